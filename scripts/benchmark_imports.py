@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""API 기동 시 모듈별 임포트 시간을 측정하는 스크립트 (`python -X importtime` 기반).
+
+깨끗한 서브프로세스에서 대상 모듈을 임포트하고, 누적 시간이 큰 모듈과 함께
+무거운 ML 의존성(torch/ultralytics/onnxruntime)이 기동 시 로드되었는지 보고한다.
+`--max-ms`를 넘거나 금지 모듈이 임포트되면 종료 코드 1을 반환해 회귀를 잡는다.
+
+사용 예시
+    python scripts/benchmark_imports.py --max-ms 1500
+    python scripts/benchmark_imports.py --module acen_api.main --top 30 --output importtime.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+DEFAULT_FORBIDDEN = ("torch", "ultralytics", "onnxruntime")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="모듈별 임포트 시간 측정")
+    parser.add_argument("--module", default="acen_api.main", help="임포트할 대상 모듈")
+    parser.add_argument("--top", type=int, default=20, help="출력할 상위 모듈 수")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--max-ms", type=float, default=None, help="전체 임포트 시간 상한(ms)")
+    parser.add_argument(
+        "--forbid",
+        default=",".join(DEFAULT_FORBIDDEN),
+        help="기동 시 임포트되면 안 되는 최상위 패키지 (쉼표 구분)",
+    )
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(max(1, args.repeat))]
+    best = min(runs, key=lambda rows: rows[args.module]["cumulative_us"] if args.module in rows else 0)
+    if args.module not in best:
+        raise SystemExit(f"모듈을 임포트하지 못했습니다: {args.module}")
+
+    total_ms = best[args.module]["cumulative_us"] / 1000
+    forbidden = {item.strip() for item in args.forbid.split(",") if item.strip()}
+    loaded_forbidden = sorted(name for name in best if name.split(".")[0] in forbidden and "." not in name)
+    top = sorted(best.items(), key=lambda item: item[1]["cumulative_us"], reverse=True)[: args.top]
+
+    report = {
+        "module": args.module,
+        "total_ms": round(total_ms, 1),
+        "forbidden_loaded": loaded_forbidden,
+        "top": [
+            {
+                "module": name,
+                "cumulative_ms": round(row["cumulative_us"] / 1000, 1),
+                "self_ms": round(row["self_us"] / 1000, 1),
+            }
+            for name, row in top
+        ],
+    }
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+
+    if loaded_forbidden or (args.max_ms is not None and total_ms > args.max_ms):
+        sys.exit(1)
+
+
+def measure(module: str) -> dict[str, dict[str, int]]:
+    """서브프로세스에서 `-X importtime`으로 임포트하고 모듈별 self/누적 시간(us)을 반환."""
+
+    src_dir = Path(__file__).resolve().parents[1] / "src"
+    python_path = os.pathsep.join(filter(None, [str(src_dir), os.environ.get("PYTHONPATH")]))
+    env = {**os.environ, "PYTHONPATH": python_path}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise SystemExit(completed.stderr)
+    return parse_importtime(completed.stderr)
+
+
+def parse_importtime(output: str) -> dict[str, dict[str, int]]:
+    """`import time: self [us] | cumulative | imported package` 형식의 로그를 파싱."""
+
+    rows: dict[str, dict[str, int]] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = (part.strip() for part in line[len("import time:") :].split("|"))
+            rows[name] = {"self_us": int(self_us), "cumulative_us": int(cumulative_us)}
+        except ValueError:
+            continue
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""fp32/int8 탐지 모델의 지연 시간, 처리량, 메모리, 박스 일치도를 비교하는 스크립트.
+
+각 정밀도 변형은 메모리 측정이 섞이지 않도록 별도 프로세스에서 실행한다.
+int8 모델은 `scripts/export_onnx.py --int8`로 미리 생성해 둔다.
+
+사용 예시
+    python scripts/benchmark_precision.py --images data/uploads --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing as mp
+import resource
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+# PyTorch 백엔드는 precision 설정을 무시하고 fp32로 실행한다.
+_SUPPORTED_PRECISIONS = {"onnx": {"fp32", "int8"}, "torch": {"fp32"}}
+
+
+class ModelUnavailable(RuntimeError):
+    """요청한 변형 대신 DummyDetector 폴백이 로드되었을 때 발생."""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="fp32/int8 탐지 모델 비교 벤치마크")
+    parser.add_argument("--weights", default="data/models/yolov11l.pt", help="원본 .pt 가중치 경로")
+    parser.add_argument("--images", required=True, help="벤치마크 이미지 디렉터리")
+    parser.add_argument("--backend", choices=["onnx", "torch"], default="onnx", help="탐지 백엔드")
+    parser.add_argument("--precisions", default="fp32,int8", help="비교할 정밀도 목록 (첫 항목이 기준)")
+    parser.add_argument("--batch-size", type=int, default=1, help="detect_batch 호출당 이미지 수")
+    parser.add_argument("--repeat", type=int, default=3, help="전체 이미지 반복 횟수")
+    parser.add_argument("--warmup", type=int, default=2, help="측정 전 워밍업 호출 수")
+    parser.add_argument("--threads", type=int, default=0, help="ONNX intra-op 스레드 수 (0은 자동)")
+    parser.add_argument("--iou", type=float, default=0.5, help="박스 일치 판정 IoU 임계값")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    images = sorted(str(p) for p in Path(args.images).rglob("*") if p.suffix.lower() in _IMAGE_EXTENSIONS)
+    if not images:
+        raise SystemExit(f"이미지를 찾을 수 없습니다: {args.images}")
+
+    precisions = [item.strip() for item in args.precisions.split(",") if item.strip()]
+    unsupported = [item for item in precisions if item not in _SUPPORTED_PRECISIONS[args.backend]]
+    if unsupported:
+        raise SystemExit(f"{args.backend} 백엔드는 다음 정밀도를 지원하지 않습니다: {', '.join(unsupported)}")
+
+    ctx = mp.get_context("spawn")
+    runs: dict[str, dict[str, Any]] = {}
+    for precision in precisions:
+        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+            try:
+                runs[precision] = pool.submit(_run_variant, args, precision, images).result()
+            except ModelUnavailable as exc:
+                raise SystemExit(str(exc)) from exc
+
+    from acen_api.schemas import BoundingBox
+    from acen_api.services.model.postprocess import box_agreement
+
+    baseline = precisions[0]
+    report: dict[str, Any] = {"images": len(images), "baseline": baseline, "variants": {}}
+    for precision, run in runs.items():
+        agreements = [
+            box_agreement(
+                [BoundingBox.model_validate(box) for box in ref],
+                [BoundingBox.model_validate(box) for box in cand],
+                iou_threshold=args.iou,
+            )
+            for ref, cand in zip(runs[baseline]["boxes"], run["boxes"])
+        ]
+        ious = [item["mean_iou"] for item in agreements if item["mean_iou"] is not None]
+        report["variants"][precision] = {
+            **run["timing"],
+            "agreement": {
+                "recall": statistics.fmean(item["recall"] for item in agreements),
+                "precision": statistics.fmean(item["precision"] for item in agreements),
+                "mean_iou": statistics.fmean(ious) if ious else None,
+            },
+        }
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+
+
+def _run_variant(args: argparse.Namespace, precision: str, images: list[str]) -> dict[str, Any]:
+    """자식 프로세스에서 한 정밀도 변형을 로드하고 측정."""
+
+    from acen_api.services import ModelConfig, OnnxDetector, UltralyticsDetector
+    from acen_api.services.model.registry import _current_rss_bytes
+
+    config = ModelConfig(name=f"bench-{precision}", weights_path=Path(args.weights), precision=precision)
+    rss_before = _current_rss_bytes() or 0
+    started = time.perf_counter()
+    if args.backend == "onnx":
+        model = OnnxDetector(config, intra_op_threads=args.threads)
+    else:
+        model = UltralyticsDetector(config)
+    model.load(device="cpu")
+    load_seconds = time.perf_counter() - started
+    # 모델 파일이나 런타임이 없으면 래퍼가 DummyDetector로 폴백하므로 측정값이 무의미하다.
+    if (model._session if args.backend == "onnx" else model._model) is None:
+        path = model.onnx_path if args.backend == "onnx" else args.weights
+        raise ModelUnavailable(f"{precision} 모델을 로드할 수 없습니다 (파일/런타임 확인): {path}")
+    rss_loaded = _current_rss_bytes() or 0
+
+    batches = [images[i : i + args.batch_size] for i in range(0, len(images), args.batch_size)]
+    for batch in batches[: args.warmup]:
+        model.detect_batch(batch)
+
+    latencies: list[float] = []
+    boxes: list[list[dict]] = []
+    started = time.perf_counter()
+    for round_index in range(args.repeat):
+        for batch in batches:
+            t0 = time.perf_counter()
+            outputs = model.detect_batch(batch)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            if round_index == 0:
+                boxes.extend([box.model_dump() for box in output] for output in outputs)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "boxes": boxes,
+        "timing": {
+            "load_seconds": round(load_seconds, 3),
+            "latency_ms_p50": round(_percentile(latencies, 0.50), 2),
+            "latency_ms_p95": round(_percentile(latencies, 0.95), 2),
+            "throughput_ips": round(len(images) * args.repeat / elapsed, 2) if elapsed else None,
+            "model_rss_bytes": rss_loaded - rss_before,
+            "peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        },
+    }
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""YOLO 가중치(.pt)를 OnnxDetector용 ONNX 모델로 변환하는 스크립트.
+
+사용 예시
+    python scripts/export_onnx.py --weights data/models/yolov11l.pt --imgsz 640
+    # INT8 변형(yolov11l.int8.onnx)도 함께 생성. --calib-dir를 주면 정적 양자화
+    python scripts/export_onnx.py --int8 --calib-dir data/uploads
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+from pathlib import Path
+from typing import Iterator
+
+_CALIBRATION_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="YOLO 가중치를 ONNX로 export")
+    parser.add_argument("--weights", default="data/models/yolov11l.pt", help="원본 .pt 가중치 경로")
+    parser.add_argument("--imgsz", type=int, default=640, help="모델 입력 크기")
+    parser.add_argument("--opset", type=int, default=None, help="ONNX opset 버전 (기본값: ultralytics 기본)")
+    parser.add_argument(
+        "--static-batch",
+        action="store_true",
+        help="배치 차원을 1로 고정 (기본값은 동적 배치로 export)",
+    )
+    parser.add_argument("--int8", action="store_true", help="INT8 양자화 모델(.int8.onnx)도 생성")
+    parser.add_argument(
+        "--calib-dir",
+        default=None,
+        help="정적 양자화용 보정 이미지 디렉터리 (없으면 동적 양자화)",
+    )
+    parser.add_argument("--calib-size", type=int, default=64, help="보정에 사용할 최대 이미지 수")
+    args = parser.parse_args()
+
+    try:
+        from ultralytics import YOLO
+    except ImportError as exc:
+        raise SystemExit("ultralytics 패키지가 필요합니다: pip install ultralytics") from exc
+
+    weights = Path(args.weights)
+    if not weights.exists():
+        raise SystemExit(f"가중치 파일을 찾을 수 없습니다: {weights}")
+
+    model = YOLO(str(weights))
+    exported = model.export(
+        format="onnx",
+        imgsz=args.imgsz,
+        dynamic=not args.static_batch,
+        simplify=True,
+        opset=args.opset,
+    )
+
+    # OnnxDetector는 `weights_path`와 같은 이름의 .onnx 파일을 찾는다.
+    target = weights.with_suffix(".onnx")
+    if Path(exported).resolve() != target.resolve():
+        shutil.move(str(exported), target)
+    print(target)
+
+    if args.int8:
+        calib_dir = Path(args.calib_dir) if args.calib_dir else None
+        print(quantize_int8(target, calib_dir, imgsz=args.imgsz, limit=args.calib_size))
+
+
+def quantize_int8(source: Path, calib_dir: Path | None, *, imgsz: int, limit: int) -> Path:
+    """fp32 ONNX 모델을 INT8로 양자화. 보정 이미지가 있으면 정적, 없으면 동적 양자화."""
+
+    try:
+        from onnxruntime.quantization import (
+            CalibrationDataReader,
+            QuantFormat,
+            QuantType,
+            quantize_dynamic,
+            quantize_static,
+        )
+    except ImportError as exc:
+        raise SystemExit("onnxruntime 패키지가 필요합니다: pip install onnxruntime") from exc
+
+    from acen_api.services.model.detector_onnx import onnx_model_path
+
+    target = onnx_model_path(source.with_suffix(".pt"), "int8")
+    if calib_dir is None:
+        quantize_dynamic(str(source), str(target), weight_type=QuantType.QUInt8)
+        return target
+
+    class _Reader(CalibrationDataReader):
+        def __init__(self) -> None:
+            self._batches = _calibration_batches(calib_dir, imgsz=imgsz, limit=limit)
+
+        def get_next(self):
+            return next(self._batches, None)
+
+    quantize_static(
+        str(source),
+        str(target),
+        _Reader(),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8,
+        per_channel=True,
+    )
+    return target
+
+
+def _calibration_batches(calib_dir: Path, *, imgsz: int, limit: int) -> Iterator[dict]:
+    import numpy as np
+
+    from acen_api.services.model.image import to_rgb_array
+    from acen_api.services.model.postprocess import letterbox
+
+    paths = sorted(p for p in calib_dir.rglob("*") if p.suffix.lower() in _CALIBRATION_EXTENSIONS)[:limit]
+    if not paths:
+        raise SystemExit(f"보정 이미지를 찾을 수 없습니다: {calib_dir}")
+    for path in paths:
+        tensor, _ = letterbox(to_rgb_array(path), imgsz)
+        yield {"images": np.expand_dims(tensor, 0)}
+
+
+if __name__ == "__main__":
+    main()
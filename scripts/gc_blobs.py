@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""일자 로그/추론 결과가 더 이상 참조하지 않는 업로드 이미지와 파생본을 삭제하는 스크립트.
+
+`.env`의 DB/파생본 설정(DATABASE_URL, RENDITION_SIZES, RENDITION_DIR 등)을 그대로 사용한다.
+
+사용 예시
+    python scripts/gc_blobs.py --grace-hours 24
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+from pathlib import Path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="참조 없는 업로드 이미지 정리")
+    parser.add_argument("--grace-hours", type=float, default=24.0, help="업로드 후 이 시간이 지난 파일만 삭제")
+    parser.add_argument("--limit", type=int, default=1000, help="한 번에 삭제할 최대 개수")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    from acen_api.api.deps import build_rendition_service
+    from acen_api.config import AppSettings
+    from acen_api.core.db import SessionLocal
+    from acen_api.services import ImageStorageService, collect_unreferenced_blobs
+
+    settings = AppSettings()
+    renditions = build_rendition_service(settings)
+    session = SessionLocal()
+    try:
+        removed = collect_unreferenced_blobs(
+            session,
+            ImageStorageService(Path(settings.upload_dir)),
+            renditions=renditions,
+            grace_seconds=args.grace_hours * 3600,
+            limit=args.limit,
+        )
+    finally:
+        session.close()
+        if renditions is not None:
+            renditions.close()
+
+    print(json.dumps({"removed": removed}, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
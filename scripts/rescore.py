@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""모델 교체 후 과거 일자 로그 이미지를 일괄 재탐지해 ModelResult를 갱신하는 스크립트.
+
+`.env`의 모델/DB 설정(MODEL_BACKEND, MODEL_PATH, DATABASE_URL 등)을 그대로 사용한다.
+체크포인트 파일이 있으면 마지막으로 커밋한 `Date.id` 다음부터 이어서 실행한다.
+
+사용 예시
+    python scripts/rescore.py --checkpoint data/rescore.json --batch-size 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+from pathlib import Path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="과거 일자 로그 이미지 재탐지")
+    parser.add_argument("--checkpoint", default="data/rescore.json", help="진행 상황 체크포인트 경로")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터 실행")
+    parser.add_argument("--batch-size", type=int, default=16, help="추론 배치 크기")
+    parser.add_argument("--page-size", type=int, default=512, help="DB 키셋 페이지 크기")
+    parser.add_argument("--queue-size", type=int, default=4, help="단계 사이 대기 배치 수 상한")
+    parser.add_argument("--decode-workers", type=int, default=4, help="이미지 디코딩 스레드 수")
+    parser.add_argument("--confidence", type=float, default=0.25, help="탐지 confidence 임계값")
+    parser.add_argument("--iou", type=float, default=0.45, help="NMS IoU 임계값")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    from acen_api.api.deps import build_model_registry
+    from acen_api.config import AppSettings
+    from acen_api.core.db import SessionLocal
+    from acen_api.services import ImageStorageService, RescoreJob
+
+    checkpoint = Path(args.checkpoint)
+    if args.restart and checkpoint.exists():
+        checkpoint.unlink()
+
+    settings = AppSettings()
+    registry = build_model_registry(settings)
+    # 재탐지 결과가 내용 주소 저장소의 파일을 참조하도록 API와 같은 업로드 디렉터리를 사용
+    storage = ImageStorageService(Path(settings.upload_dir))
+    try:
+        job = RescoreJob(
+            SessionLocal,
+            registry.get("detector"),
+            batch_size=args.batch_size,
+            page_size=args.page_size,
+            queue_size=args.queue_size,
+            decode_workers=args.decode_workers,
+            confidence=args.confidence,
+            iou=args.iou,
+            checkpoint_path=checkpoint,
+            content_id=storage.content_id,
+        )
+        stats = job.run()
+    finally:
+        registry.close()
+
+    print(
+        json.dumps(
+            {
+                "last_date_id": stats.last_date_id,
+                "processed": stats.processed,
+                "failed": stats.failed,
+                "boxes": stats.boxes,
+                "elapsed_seconds": round(stats.elapsed_seconds, 2),
+                "images_per_second": round(stats.images_per_second, 2),
+            },
+            indent=2,
+            ensure_ascii=False,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,22 +2,48 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+import logging
+import tempfile
+from collections.abc import Callable, Generator
+from functools import partial
 
-from fastapi import Depends, Header, HTTPException, status
+from pathlib import Path
+
+from fastapi import Depends, Header, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
 from ..core.db import get_db
 from ..services import (
+    MODEL_RENDITION,
+    CpuPlan,
     EvaluatorService,
     FeedbackService,
     ImageStorageService,
+    InferenceCache,
+    InferenceExecutor,
+    MicroBatcher,
+    ModelConfig,
+    ModelRegistry,
+    ModelWrapper,
+    OnnxDetector,
+    ProcessPoolModel,
+    RenditionService,
     UltralyticsDetector,
     RuleBasedClassifier,
+    ShadowEvaluator,
+    SingleFlight,
+    TensorCache,
+    WeightsWatcher,
+    claim_worker_slot,
+    current_cpu_plan,
+    plan_cpu,
+    synthetic_image,
 )
 from ..config import AppSettings
 from ..repositories import ApiKeyRepository, UserRepository
 
+logger = logging.getLogger(__name__)
+
 
 def get_session(db: Session = Depends(get_db)) -> Generator[Session, None, None]:
     yield db
@@ -31,25 +57,285 @@ def get_feedback_service(session: Session = Depends(get_session)) -> FeedbackSer
     return FeedbackService(session)
 
 
-def get_storage() -> ImageStorageService:
-    from pathlib import Path
-
+def get_storage(request: Request) -> ImageStorageService:
     settings = AppSettings()
-    storage_dir = Path("data/uploads")
+    storage_dir = Path(settings.upload_dir)
     allowed = {ext.strip() for ext in settings.upload_allowed_ext.split(",") if ext.strip()}
     return ImageStorageService(
         storage_dir,
         allowed_extensions=allowed,
         max_file_size=settings.upload_max_bytes,
+        renditions=get_rendition_service(request),
+    )
+
+
+def build_rendition_service(settings: AppSettings) -> RenditionService | None:
+    """`RENDITION_SIZES`(이름:긴 변)로 파생 이미지 생성기 구성. 크기가 없으면 None."""
+
+    sizes: dict[str, int] = {}
+    for item in settings.rendition_sizes.split(","):
+        name, _, edge = item.strip().partition(":")
+        if name and edge.strip():
+            sizes[name] = int(edge)
+    if not sizes:
+        return None
+    # 타일 탐지는 원본 해상도가 필요하므로 모델 입력 크기 파생본을 만들지 않는다.
+    if settings.rendition_model_size and settings.detect_tile_size <= 0:
+        sizes.setdefault(MODEL_RENDITION, settings.model_input_size)
+    return RenditionService(settings.rendition_dir, sizes, workers=settings.rendition_workers)
+
+
+def get_rendition_service(request: Request) -> RenditionService | None:
+    if not hasattr(request.app.state, "renditions"):
+        request.app.state.renditions = build_rendition_service(AppSettings())
+    return request.app.state.renditions
+
+
+def build_cpu_plan(settings: AppSettings) -> CpuPlan | None:
+    """워커별 CPU 스레드/코어 계획. `CPU_WORKERS`가 0이면 None.
+
+    코어 고정 시 같은 노드의 워커끼리 파일 잠금으로 순번을 나눠 가지므로 기동 시 한 번만 호출한다.
+    """
+
+    if settings.cpu_workers <= 0:
+        return None
+    index = 0
+    if settings.cpu_pin:
+        slot_dir = settings.cpu_slot_dir or Path(tempfile.gettempdir()) / "acen-cpu-slots"
+        index = claim_worker_slot(settings.cpu_workers, slot_dir)
+    return plan_cpu(
+        workers=settings.cpu_workers,
+        worker_index=index,
+        threads=settings.cpu_threads,
+        inter_op_threads=settings.cpu_interop_threads,
+        pin=settings.cpu_pin,
+    )
+
+
+def build_model_registry(settings: AppSettings) -> ModelRegistry:
+    """설정값으로 탐지/분류 모델을 등록한 레지스트리 생성."""
+
+    registry = ModelRegistry()
+    weights = Path(settings.model_path) if settings.model_path else None
+    detector_factory = _detector_factory(settings)
+    if settings.inference_process_workers > 0:
+        detector_factory = partial(
+            ProcessPoolModel,
+            factory=detector_factory,
+            workers=settings.inference_process_workers,
+            max_restarts=settings.inference_process_max_restarts,
+        )
+    registry.register(
+        "detector",
+        detector_factory,
+        ModelConfig(
+            name=_detector_name(settings),
+            weights_path=weights,
+            device=settings.model_device,
+            precision=settings.model_precision,
+        ),
+    )
+    registry.register(
+        "classifier",
+        RuleBasedClassifier,
+        ModelConfig(name=RuleBasedClassifier.name, device=settings.model_device),
+    )
+    return registry
+
+
+def _detector_factory(settings: AppSettings):
+    if settings.model_backend == "onnx":
+        plan = current_cpu_plan()
+        return partial(
+            OnnxDetector,
+            input_size=settings.model_input_size,
+            intra_op_threads=settings.onnx_intra_op_threads or (plan.intra_op_threads if plan else 0),
+            inter_op_threads=settings.onnx_inter_op_threads or (plan.inter_op_threads if plan else 0),
+            tensor_cache=TensorCache(settings.tensor_cache_dir) if settings.tensor_cache_dir else None,
+        )
+    if settings.detect_tile_size > 0:
+        return partial(
+            UltralyticsDetector,
+            tile_size=settings.detect_tile_size,
+            tile_overlap=settings.detect_tile_overlap,
+            max_tiles=settings.detect_max_tiles,
+        )
+    return UltralyticsDetector
+
+
+def _detector_name(settings: AppSettings) -> str:
+    if settings.model_backend == "onnx":
+        return OnnxDetector.name
+    if settings.detect_tile_size > 0:
+        # 타일 설정이 바뀌면 결과가 달라지므로 추론 캐시 키(모델 이름)에 반영한다.
+        return (
+            f"{UltralyticsDetector.name}-tiled-{settings.detect_tile_size}"
+            f"-{settings.detect_tile_overlap}-{settings.detect_max_tiles}"
+        )
+    return UltralyticsDetector.name
+
+
+def get_model_registry(request: Request) -> ModelRegistry:
+    """lifespan에서 생성한 레지스트리 반환. lifespan 없이 기동된 경우 최초 호출 시 생성."""
+
+    registry = getattr(request.app.state, "model_registry", None)
+    if registry is None:
+        registry = build_model_registry(AppSettings())
+        request.app.state.model_registry = registry
+    return registry
+
+
+def build_batchers(registry: ModelRegistry, settings: AppSettings) -> dict[str, MicroBatcher]:
+    """레지스트리 모델 앞단에 둘 역할별 마이크로 배처 생성. 비활성화 시 빈 dict."""
+
+    if not settings.batch_enabled:
+        return {}
+
+    def run_detect(thresholds: tuple[float, float], paths: list[Path]):
+        confidence, iou = thresholds
+        return registry.get("detector").detect_batch(paths, confidence=confidence, iou=iou)
+
+    def run_classify(top_k: int, paths: list[Path]):
+        return registry.get("classifier").classify_batch(paths, top_k=top_k)
+
+    options = {
+        "max_batch_size": settings.batch_max_size,
+        "window_ms": settings.batch_window_ms,
+        "max_queue_size": settings.batch_queue_size,
+        "retry_after_seconds": settings.inference_retry_after_seconds,
+    }
+    return {
+        "detector": MicroBatcher(run_detect, name="detect-batcher", **options),
+        "classifier": MicroBatcher(run_classify, name="classify-batcher", **options),
+    }
+
+
+def warm_up_models(registry: ModelRegistry, settings: AppSettings) -> None:
+    """설정된 입력 크기와 배치 크기로 등록된 모든 모델을 합성 이미지로 한 번씩 실행."""
+
+    for role in registry.roles():
+        try:
+            registry.warm_up(role, warmup_task(role, settings))
+        except Exception:  # pragma: no cover - 실패는 status()/readiness로 노출
+            logger.exception("모델 워밍업 실패: %s", role)
+
+
+def warmup_task(role: str, settings: AppSettings) -> Callable[[ModelWrapper], None]:
+    """역할별 워밍업 함수. 설정된 입력 크기 x 배치 크기 조합으로 합성 이미지를 실행한다."""
+
+    sizes = [int(item) for item in settings.model_warmup_sizes.split(",") if item.strip()]
+    sizes = sizes or [settings.model_input_size]
+    batch_sizes = sorted({1, settings.batch_max_size if settings.batch_enabled else 1})
+    method = "classify_batch" if role == "classifier" else "detect_batch"
+
+    def run(model: ModelWrapper) -> None:
+        for size in sizes:
+            image = synthetic_image(size)
+            for batch_size in batch_sizes:
+                getattr(model, method)([image] * batch_size)
+
+    return run
+
+
+def get_batchers(
+    request: Request, registry: ModelRegistry = Depends(get_model_registry)
+) -> dict[str, MicroBatcher]:
+    batchers = getattr(request.app.state, "batchers", None)
+    if batchers is None:
+        batchers = build_batchers(registry, AppSettings())
+        request.app.state.batchers = batchers
+    return batchers
+
+
+def build_inference_cache(settings: AppSettings) -> InferenceCache | None:
+    """설정에 따른 추론 결과 캐시 생성. 비활성화 시 None."""
+
+    if not settings.inference_cache_enabled:
+        return None
+    disk_dir = Path(settings.inference_cache_dir) if settings.inference_cache_dir else None
+    return InferenceCache(max_bytes=settings.inference_cache_max_bytes, disk_dir=disk_dir)
+
+
+def get_inference_cache(request: Request) -> InferenceCache | None:
+    if not hasattr(request.app.state, "inference_cache"):
+        request.app.state.inference_cache = build_inference_cache(AppSettings())
+    return request.app.state.inference_cache
+
+
+def build_singleflight(settings: AppSettings) -> SingleFlight | None:
+    """동시 중복 추론 합치기. 비활성화 시 None."""
+
+    return SingleFlight() if settings.inference_singleflight_enabled else None
+
+
+def get_singleflight(request: Request) -> SingleFlight | None:
+    if not hasattr(request.app.state, "singleflight"):
+        request.app.state.singleflight = build_singleflight(AppSettings())
+    return request.app.state.singleflight
+
+
+def build_shadow_evaluator(settings: AppSettings) -> ShadowEvaluator | None:
+    """후보 가중치가 설정된 경우 그림자 평가기 생성. 모델은 첫 샘플 시점에 로드된다."""
+
+    if not settings.shadow_model_path or settings.shadow_sample_rate <= 0:
+        return None
+    return ShadowEvaluator(
+        _detector_factory(settings),
+        ModelConfig(
+            name=f"{_detector_name(settings)}-shadow",
+            weights_path=Path(settings.shadow_model_path),
+            device=settings.model_device,
+            precision=settings.model_precision,
+        ),
+        sample_rate=settings.shadow_sample_rate,
+        queue_size=settings.shadow_queue_size,
+    )
+
+
+def get_shadow_evaluator(request: Request) -> ShadowEvaluator | None:
+    if not hasattr(request.app.state, "shadow_evaluator"):
+        request.app.state.shadow_evaluator = build_shadow_evaluator(AppSettings())
+    return request.app.state.shadow_evaluator
+
+
+def build_weights_watcher(registry: ModelRegistry, settings: AppSettings) -> WeightsWatcher | None:
+    """프로세스별 탐지 가중치 파일 감시. `MODEL_WATCH_INTERVAL`이 0 이하면 None."""
+
+    if settings.model_watch_interval <= 0 or "detector" not in registry.roles():
+        return None
+    return WeightsWatcher(
+        registry,
+        "detector",
+        interval=settings.model_watch_interval,
+        warm_up=warmup_task("detector", settings) if settings.model_warmup else None,
+        drain_seconds=settings.model_swap_drain_seconds,
+    )
+
+
+def build_inference_executor(settings: AppSettings) -> InferenceExecutor:
+    """Starlette 기본 스레드풀과 분리된 추론 전용 실행기 생성."""
+
+    return InferenceExecutor(
+        max_workers=settings.inference_workers,
+        queue_size=settings.inference_queue_size,
+        retry_after_seconds=settings.inference_retry_after_seconds,
     )
 
 
-def get_detector() -> UltralyticsDetector:
-    return UltralyticsDetector()
+def get_inference_executor(request: Request) -> InferenceExecutor:
+    executor = getattr(request.app.state, "inference_executor", None)
+    if executor is None:
+        executor = build_inference_executor(AppSettings())
+        request.app.state.inference_executor = executor
+    return executor
+
+
+def get_detector(registry: ModelRegistry = Depends(get_model_registry)) -> ModelWrapper:
+    return registry.get("detector")
 
 
-def get_classifier() -> RuleBasedClassifier:
-    return RuleBasedClassifier()
+def get_classifier(registry: ModelRegistry = Depends(get_model_registry)) -> ModelWrapper:
+    return registry.get("classifier")
 
 
 def get_api_key_repo(session: Session = Depends(get_session)) -> ApiKeyRepository:
@@ -75,6 +361,18 @@ def require_api_key(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
 
 
+def require_configured_api_key(
+    x_api_key: str | None = Header(default=None),
+    repo: ApiKeyRepository = Depends(get_api_key_repo),
+) -> None:
+    """키가 하나도 없는 초기 상태에서도 유효한 API Key를 요구하는 관리용 검증."""
+
+    if not x_api_key:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="API key required")
+    if not repo.get_by_key(x_api_key):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
+
+
 def get_user_repo(session: Session = Depends(get_session)) -> UserRepository:
     return UserRepository(session)
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from ...repositories import CalendarRepository
@@ -47,3 +47,19 @@ def create_calendar(
     session.commit()
     session.refresh(cal)
     return cal
+
+
+@router.delete("/{calendar_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_calendar(
+    calendar_id: int,
+    session: Session = Depends(get_session),
+    user_id: int = Depends(get_current_user),
+    _: None = Depends(require_api_key),
+) -> Response:
+    repo = CalendarRepository(session)
+    calendar = repo.get(calendar_id)
+    if not calendar or calendar.user_id != user_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Calendar not found")
+    repo.delete(calendar)
+    session.commit()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
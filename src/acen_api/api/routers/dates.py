@@ -4,12 +4,13 @@ from __future__ import annotations
 
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
-from ...repositories import CalendarRepository, DateRepository
+from ...repositories import CalendarRepository, DateRepository, ImageBlobRepository
 from ...schemas import DateCreate, DateRead, ErrorResponse
-from ..deps import get_current_user, get_session, require_api_key
+from ...services import ImageStorageService
+from ..deps import get_current_user, get_session, get_storage, require_api_key
 
 
 error_responses = {
@@ -31,6 +32,7 @@ def create_date(
     session: Session = Depends(get_session),
     user_id: int = Depends(get_current_user),
     _: None = Depends(require_api_key),
+    storage: ImageStorageService = Depends(get_storage),
 ) -> DateRead:
     cal_repo = CalendarRepository(session)
     calendar = cal_repo.get(payload.calendar_id)
@@ -42,6 +44,9 @@ def create_date(
 
     repo = DateRepository(session)
     date_entry = repo.create(payload, user_id=user_id)
+    content_id = storage.content_id(payload.image_path) if payload.image_path else None
+    if content_id is not None:
+        ImageBlobRepository(session).add_ref(content_id, ImageBlobRepository.OWNER_DATE, date_entry.id)
     session.commit()
     session.refresh(date_entry)
     return date_entry
@@ -61,3 +66,19 @@ def list_dates(
     repo = DateRepository(session)
     entries = repo.list_by_range(calendar_id, start, end, user_id=user_id)
     return entries
+
+
+@router.delete("/{date_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_date(
+    date_id: int,
+    session: Session = Depends(get_session),
+    user_id: int = Depends(get_current_user),
+    _: None = Depends(require_api_key),
+) -> Response:
+    repo = DateRepository(session)
+    date_entry = repo.get(date_id)
+    if not date_entry or date_entry.user_id != user_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Date not found")
+    repo.delete(date_entry)
+    session.commit()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,6 +1,11 @@
 """헬스 체크 라우터."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Response, status
+
+from ...config import AppSettings
+from ...schemas import ModelStatus, ReadinessResponse
+from ...services import ModelRegistry
+from ..deps import get_model_registry
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -9,3 +14,28 @@ router = APIRouter(prefix="/health", tags=["health"])
 def health_check() -> dict[str, str]:
     """서비스 모니터링을 위한 간단한 OK 응답."""
     return {"status": "ok"}
+
+
+@router.get("/live", summary="프로세스 생존 확인")
+def liveness() -> dict[str, str]:
+    """프로세스가 요청을 처리할 수 있으면 항상 OK. 모델 상태와 무관하다."""
+    return {"status": "ok"}
+
+
+@router.get("/ready", summary="트래픽 수신 가능 여부", response_model=ReadinessResponse)
+def readiness(
+    response: Response, registry: ModelRegistry = Depends(get_model_registry)
+) -> ReadinessResponse:
+    """모든 모델이 로드(워밍업 사용 시 워밍업까지)되기 전에는 503을 반환.
+
+    `MODEL_PRELOAD=false`이면 첫 요청에서 지연 로딩하므로 항상 준비 상태로 본다.
+    """
+
+    settings = AppSettings()
+    ready = not settings.model_preload or registry.ready(warmed=settings.model_warmup)
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ReadinessResponse(
+        status="ready" if ready else "warming",
+        models=[ModelStatus(**item) for item in registry.status()],
+    )
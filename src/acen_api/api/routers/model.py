@@ -2,24 +2,86 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
+import time
 from pathlib import Path
+from typing import Any, Awaitable, Callable, Sequence
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, UploadFile, status
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ...repositories import ApiKeyRepository, DateRepository, ImageBlobRepository, ModelResultRepository
+from ...repositories.model_result import CLASSIFICATION, DETECTION
 
 from ...schemas import (
+    APIModel,
+    BoundingBox,
+    ClassificationBatchItem,
+    ClassificationBatchRequest,
+    ClassificationBatchResponse,
     ClassificationRequest,
     ClassificationResponse,
+    ClassificationResult,
+    DetectionBatchItem,
+    DetectionBatchRequest,
+    DetectionBatchResponse,
     DetectionRequest,
     DetectionResponse,
     ErrorResponse,
     ImageReference,
+    ModelReloadRequest,
+    ModelReloadResponse,
+    ModelStatus,
+    UploadClassificationResponse,
+    UploadDetectionResponse,
+)
+from ...services import (
+    MODEL_RENDITION,
+    ExecutorSaturated,
+    ImageStorageService,
+    InferenceCache,
+    InferenceExecutor,
+    MicroBatcher,
+    ModelRegistry,
+    RenditionService,
+    ShadowEvaluator,
+    SingleFlight,
+    StorageError,
+    StorageResult,
+    content_hash,
+    current_cpu_plan,
+    image_size,
+    weights_version,
+)
+from ...config import AppSettings
+from ..deps import (
+    get_batchers,
+    get_classifier,
+    get_detector,
+    get_inference_cache,
+    get_inference_executor,
+    get_model_registry,
+    get_rendition_service,
+    get_session,
+    get_shadow_evaluator,
+    get_singleflight,
+    get_storage,
+    require_api_key,
+    require_configured_api_key,
+    warmup_task,
 )
-from ..deps import get_classifier, get_detector
+from .uploads import iter_upload_file, receive_upload, register_blob
+
+logger = logging.getLogger(__name__)
 
 
 error_responses = {
     400: {"model": ErrorResponse, "description": "잘못된 입력"},
-    404: {"model": ErrorResponse, "description": "이미지를 찾을 수 없습니다."},
+    404: {"model": ErrorResponse, "description": "이미지 또는 일자 로그를 찾을 수 없습니다."},
+    503: {"model": ErrorResponse, "description": "추론 대기열 포화 (Retry-After 헤더 참고)"},
 }
 
 
@@ -27,34 +89,602 @@ router = APIRouter(prefix="/model", tags=["model"], responses=error_responses)
 
 
 @router.post("/detect", response_model=DetectionResponse)
-def detect(
+async def detect(
     payload: DetectionRequest,
     detector = Depends(get_detector),
+    batchers: dict[str, MicroBatcher] = Depends(get_batchers),
+    registry: ModelRegistry = Depends(get_model_registry),
+    cache: InferenceCache | None = Depends(get_inference_cache),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+    storage: ImageStorageService = Depends(get_storage),
+    flight: SingleFlight | None = Depends(get_singleflight),
+    session: Session = Depends(get_session),
+    x_api_key: str | None = Header(default=None),
+    shadow: ShadowEvaluator | None = Depends(get_shadow_evaluator),
+    renditions: RenditionService | None = Depends(get_rendition_service),
 ) -> DetectionResponse:
-    detector.load()
-    image_path = _resolve_image_path(payload)
-    if not image_path.exists():
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Image not found")
+    original_path, identity = await run_in_threadpool(_resolve_image, payload, storage)
+    if payload.date_id is not None:
+        await run_in_threadpool(_check_date, session, payload.date_id, x_api_key)
+    image_path, scale = await run_in_threadpool(_model_input, original_path, storage, renditions)
+
+    params = {"confidence": payload.confidence, "iou": payload.iou}
+
+    def compare(boxes: list[BoundingBox], model_ms: float) -> None:
+        # 캐시 적중/single-flight 공유가 아닌, 모델을 실제로 실행한 요청만 모델 실행 시간과 함께 비교한다.
+        # 큐에 넣기만 하고 기다리지 않는다. 포화 시 그림자 작업은 버려진다.
+        shadow.submit(image_path, boxes, model_ms, **params)
 
-    boxes = detector.detect(image_path)
-    return DetectionResponse(boxes=boxes)
+    async def run() -> list[BoundingBox]:
+        return await _run_model(
+            executor,
+            batchers.get("detector"),
+            image_path,
+            lambda: detector.detect(image_path, **params),
+            group=(payload.confidence, payload.iou),
+            budget_ms=payload.max_batch_wait_ms,
+            on_computed=compare if shadow is not None else None,
+        )
+
+    boxes = await _coalesced(
+        flight,
+        _flight_key(registry, "detector", identity, params),
+        _cached,
+        cache,
+        registry,
+        "detector",
+        image_path,
+        params,
+        run,
+        BoundingBox,
+    )
+    if scale is not None:
+        boxes = _rescale(boxes, scale)
+    persisted = None
+    if payload.date_id is not None:
+        repo = ModelResultRepository(session)
+        persisted = await run_in_threadpool(
+            _persist,
+            session,
+            repo.save_detections,
+            DETECTION,
+            payload.date_id,
+            boxes,
+            str(original_path),
+            storage.content_id(original_path),
+        )
+    return DetectionResponse(boxes=boxes, persisted=persisted)
 
 
 @router.post("/classify", response_model=ClassificationResponse)
-def classify(
+async def classify(
     payload: ClassificationRequest,
     classifier = Depends(get_classifier),
+    batchers: dict[str, MicroBatcher] = Depends(get_batchers),
+    registry: ModelRegistry = Depends(get_model_registry),
+    cache: InferenceCache | None = Depends(get_inference_cache),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+    storage: ImageStorageService = Depends(get_storage),
+    flight: SingleFlight | None = Depends(get_singleflight),
+    session: Session = Depends(get_session),
+    x_api_key: str | None = Header(default=None),
+    renditions: RenditionService | None = Depends(get_rendition_service),
 ) -> ClassificationResponse:
-    classifier.load()
-    image_path = _resolve_image_path(payload)
-    if not image_path.exists():
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Image not found")
+    original_path, identity = await run_in_threadpool(_resolve_image, payload, storage)
+    if payload.date_id is not None:
+        await run_in_threadpool(_check_date, session, payload.date_id, x_api_key)
+    image_path, _ = await run_in_threadpool(_model_input, original_path, storage, renditions)
+
+    params = {"top_k": payload.top_k}
+
+    async def run() -> list[ClassificationResult]:
+        return await _run_model(
+            executor,
+            batchers.get("classifier"),
+            image_path,
+            lambda: classifier.classify(image_path, **params),
+            group=payload.top_k,
+            budget_ms=payload.max_batch_wait_ms,
+        )
+
+    results = await _coalesced(
+        flight,
+        _flight_key(registry, "classifier", identity, params),
+        _cached,
+        cache,
+        registry,
+        "classifier",
+        image_path,
+        params,
+        run,
+        ClassificationResult,
+    )
+    persisted = None
+    if payload.date_id is not None:
+        repo = ModelResultRepository(session)
+        persisted = await run_in_threadpool(
+            _persist,
+            session,
+            repo.save_classifications,
+            CLASSIFICATION,
+            payload.date_id,
+            results,
+            str(original_path),
+            storage.content_id(original_path),
+        )
+    return ClassificationResponse(results=results, persisted=persisted)
+
+
+@router.post(
+    "/detect:upload", response_model=UploadDetectionResponse, dependencies=[Depends(require_api_key)]
+)
+async def detect_upload(
+    file: UploadFile = File(...),
+    confidence: float = Form(0.25, ge=0, le=1),
+    iou: float = Form(0.45, ge=0, le=1),
+    detector = Depends(get_detector),
+    batchers: dict[str, MicroBatcher] = Depends(get_batchers),
+    registry: ModelRegistry = Depends(get_model_registry),
+    cache: InferenceCache | None = Depends(get_inference_cache),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+    storage: ImageStorageService = Depends(get_storage),
+    flight: SingleFlight | None = Depends(get_singleflight),
+    session: Session = Depends(get_session),
+) -> UploadDetectionResponse:
+    """이미지를 저장하고, 저장 시 디코딩한 픽셀로 곧바로 탐지."""
+
+    stored = await _store_upload(file, storage, session)
+    pixels = stored.pixels
+
+    params = {"confidence": confidence, "iou": iou}
+
+    async def run() -> list[BoundingBox]:
+        return await _run_model(
+            executor,
+            batchers.get("detector"),
+            pixels,
+            lambda: detector.detect(pixels, **params),
+            group=(confidence, iou),
+        )
+
+    boxes = await _coalesced(
+        flight,
+        _flight_key(registry, "detector", (stored.content_hash,), params),
+        _cached,
+        cache,
+        registry,
+        "detector",
+        stored.path,
+        params,
+        run,
+        BoundingBox,
+        stored.content_hash,
+    )
+    return UploadDetectionResponse(
+        boxes=boxes, upload_id=stored.upload_id, relative_path=str(stored.relative_path)
+    )
+
+
+@router.post(
+    "/classify:upload", response_model=UploadClassificationResponse, dependencies=[Depends(require_api_key)]
+)
+async def classify_upload(
+    file: UploadFile = File(...),
+    top_k: int = Form(3, ge=1, le=10),
+    classifier = Depends(get_classifier),
+    batchers: dict[str, MicroBatcher] = Depends(get_batchers),
+    registry: ModelRegistry = Depends(get_model_registry),
+    cache: InferenceCache | None = Depends(get_inference_cache),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+    storage: ImageStorageService = Depends(get_storage),
+    flight: SingleFlight | None = Depends(get_singleflight),
+    session: Session = Depends(get_session),
+) -> UploadClassificationResponse:
+    """이미지를 저장하고, 저장 시 디코딩한 픽셀로 곧바로 분류."""
+
+    stored = await _store_upload(file, storage, session)
+    pixels = stored.pixels
+
+    params = {"top_k": top_k}
+
+    async def run() -> list[ClassificationResult]:
+        return await _run_model(
+            executor,
+            batchers.get("classifier"),
+            pixels,
+            lambda: classifier.classify(pixels, **params),
+            group=top_k,
+        )
+
+    results = await _coalesced(
+        flight,
+        _flight_key(registry, "classifier", (stored.content_hash,), params),
+        _cached,
+        cache,
+        registry,
+        "classifier",
+        stored.path,
+        params,
+        run,
+        ClassificationResult,
+        stored.content_hash,
+    )
+    return UploadClassificationResponse(
+        results=results, upload_id=stored.upload_id, relative_path=str(stored.relative_path)
+    )
+
+
+@router.post("/detect:batch", response_model=DetectionBatchResponse)
+async def detect_batch(
+    payload: DetectionBatchRequest,
+    detector = Depends(get_detector),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+    storage: ImageStorageService = Depends(get_storage),
+) -> DetectionBatchResponse:
+    """여러 이미지를 한 번의 배치 추론으로 탐지. 결과는 입력 순서를 유지한다."""
+
+    thresholds = {"confidence": payload.confidence, "iou": payload.iou}
+    outputs, errors = await _offload(
+        executor,
+        _run_batch,
+        payload.items,
+        storage,
+        lambda paths: detector.detect_batch(paths, **thresholds),
+        lambda path: detector.detect(path, **thresholds),
+    )
+    return DetectionBatchResponse(
+        results=[
+            DetectionBatchItem(index=index, boxes=outputs.get(index), error=errors.get(index))
+            for index in range(len(payload.items))
+        ]
+    )
+
+
+@router.post("/classify:batch", response_model=ClassificationBatchResponse)
+async def classify_batch(
+    payload: ClassificationBatchRequest,
+    classifier = Depends(get_classifier),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+    storage: ImageStorageService = Depends(get_storage),
+) -> ClassificationBatchResponse:
+    """여러 이미지를 한 번의 배치 추론으로 분류. 결과는 입력 순서를 유지한다."""
+
+    outputs, errors = await _offload(
+        executor,
+        _run_batch,
+        payload.items,
+        storage,
+        lambda paths: classifier.classify_batch(paths, top_k=payload.top_k),
+        lambda path: classifier.classify(path, top_k=payload.top_k),
+    )
+    return ClassificationBatchResponse(
+        results=[
+            ClassificationBatchItem(index=index, results=outputs.get(index), error=errors.get(index))
+            for index in range(len(payload.items))
+        ]
+    )
+
+
+@router.get("/status", response_model=list[ModelStatus])
+def model_status(registry: ModelRegistry = Depends(get_model_registry)) -> list[ModelStatus]:
+    """레지스트리에 등록된 모델의 로딩 상태/소요 시간/메모리 사용량."""
+    return [ModelStatus(**item) for item in registry.status()]
+
+
+@router.post(
+    "/reload",
+    response_model=ModelReloadResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(require_configured_api_key)],
+    responses={409: {"model": ErrorResponse, "description": "이미 교체가 진행 중입니다."}},
+)
+def reload_model(
+    payload: ModelReloadRequest, registry: ModelRegistry = Depends(get_model_registry)
+) -> ModelReloadResponse:
+    """새 가중치를 백그라운드에서 로드/워밍업한 뒤 무중단으로 교체.
+
+    가중치 파일은 로드 시 역직렬화되므로 `MODEL_DIR` 안의 경로만 허용하고, 키가 없는 초기 상태에서도
+    API Key를 요구한다. 교체는 요청을 받은 프로세스(응답의 `pid`)에만 적용된다.
+    """
+
+    if payload.role not in registry.roles():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Model role not found")
+    settings = AppSettings()
+    weights = Path(payload.weights_path) if payload.weights_path else registry.config(payload.role).weights_path
+    if weights is None or not weights.exists():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Weights file not found")
+    weights = weights.resolve()
+    if not weights.is_relative_to(Path(settings.model_dir).resolve()):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Weights must be inside the model directory")
+
+    started = registry.start_swap(
+        payload.role,
+        weights,
+        warm_up=warmup_task(payload.role, settings) if settings.model_warmup else None,
+        drain_seconds=settings.model_swap_drain_seconds,
+    )
+    if not started:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Model swap already in progress")
+    return ModelReloadResponse(role=payload.role, weights_path=str(weights), pid=os.getpid())
+
+
+@router.get("/metrics")
+def model_metrics(
+    batchers: dict[str, MicroBatcher] = Depends(get_batchers),
+    cache: InferenceCache | None = Depends(get_inference_cache),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+    flight: SingleFlight | None = Depends(get_singleflight),
+    shadow: ShadowEvaluator | None = Depends(get_shadow_evaluator),
+    renditions: RenditionService | None = Depends(get_rendition_service),
+) -> dict[str, Any]:
+    """추론 캐시/배처/실행기/single-flight/그림자 평가/파생 이미지/CPU 실행 계획 등 런타임 지표."""
+    return {
+        "cache": cache.stats() if cache is not None else None,
+        "batching": {role: batcher.stats() for role, batcher in batchers.items()},
+        "executor": executor.stats(),
+        "singleflight": flight.stats() if flight is not None else None,
+        "shadow": shadow.stats() if shadow is not None else None,
+        "renditions": renditions.stats() if renditions is not None else None,
+        "cpu_plan": plan.to_dict() if (plan := current_cpu_plan()) is not None else None,
+    }
+
+
+async def _offload(executor: InferenceExecutor, fn: Callable[..., Any], *args: Any) -> Any:
+    """추론 작업을 전용 실행기에서 실행. 대기열 포화 시 503 + Retry-After로 즉시 거절."""
+
+    try:
+        return await executor.run(fn, *args)
+    except ExecutorSaturated as exc:
+        raise _saturated(exc) from exc
+
+
+async def _run_model(
+    executor: InferenceExecutor,
+    batcher: MicroBatcher | None,
+    item: Any,
+    direct: Callable[[], list[Any]],
+    *,
+    group: Any,
+    budget_ms: float | None = None,
+    on_computed: Callable[[list[Any], float], None] | None = None,
+) -> list[Any]:
+    """모델 호출. 배처가 있으면 큐에 넣은 Future를 기다리므로 배치 창 동안 스레드를 점유하지 않는다.
+
+    승인 제어는 배처 대기열에서, 배처가 없으면 실행기 대기열에서 한다. `on_computed`는 결과와
+    대기 시간을 뺀 모델 실행 시간(ms, 배처 경로는 배치 호출 시간)으로 호출된다.
+    """
+
+    if batcher is None:
+        results, model_ms = await _offload(executor, _timed, direct)
+    else:
+        try:
+            future = batcher.submit_future(item, group=group, budget_ms=budget_ms)
+        except ExecutorSaturated as exc:
+            raise _saturated(exc) from exc
+        results = await asyncio.wrap_future(future)
+        model_ms = future.elapsed_ms or 0.0
+    if on_computed is not None:
+        on_computed(results, model_ms)
+    return results
+
+
+def _timed(fn: Callable[[], list[Any]]) -> tuple[list[Any], float]:
+    started = time.perf_counter()
+    results = fn()
+    return results, (time.perf_counter() - started) * 1000
+
+
+def _saturated(exc: ExecutorSaturated) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Inference queue is full",
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+async def _coalesced(flight: SingleFlight | None, key: Any, fn: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+    """같은 키의 동시 요청은 한 번만 실행하고 결과를 공유."""
+
+    if flight is None:
+        return await fn(*args)
+    return await flight.run(key, lambda: fn(*args))
+
+
+def _flight_key(registry: ModelRegistry, role: str, identity: tuple, params: dict[str, Any]) -> tuple:
+    """single-flight 키. `identity`는 내용 해시 또는 `_resolve_image()`가 읽은 파일 메타데이터."""
+
+    config = registry.config(role)
+    # 가중치 교체 직후의 요청이 이전 모델의 진행 중 결과를 공유하지 않도록 경로를 포함한다.
+    weights = str(config.weights_path) if config.weights_path else None
+    return (role, config.name, weights, config.precision, identity, tuple(sorted(params.items())))
+
+
+async def _cached(
+    cache: InferenceCache | None,
+    registry: ModelRegistry,
+    role: str,
+    image_path: Path,
+    params: dict[str, Any],
+    compute: Callable[[], Awaitable[list[Any]]],
+    item_type: type[APIModel],
+    digest: str | None = None,
+) -> list[Any]:
+    """이미지 내용 해시/모델/가중치 버전/정밀도/파라미터로 결과를 캐시.
+
+    `digest`가 주어지면 파일을 다시 읽지 않고 내용 해시로 사용한다. 해시 계산과 디스크 계층
+    입출력은 블로킹이므로 스레드풀에서 실행한다.
+    """
+
+    if cache is None:
+        return await compute()
+
+    key, cached = await run_in_threadpool(_cache_lookup, cache, registry, role, image_path, params, digest)
+    if cached is not None:
+        return [item_type.model_validate(item) for item in cached]
+
+    results = await compute()
+    await run_in_threadpool(cache.put, key, [item.model_dump() for item in results])
+    return results
+
+
+def _cache_lookup(
+    cache: InferenceCache,
+    registry: ModelRegistry,
+    role: str,
+    image_path: Path,
+    params: dict[str, Any],
+    digest: str | None,
+) -> tuple[str, Any]:
+    config = registry.config(role)
+    try:
+        digest = digest or content_hash(image_path)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Image not found") from exc
+    key = cache.make_key(
+        content_hash=digest,
+        model_name=config.name,
+        weights_version=weights_version(config.weights_path),
+        params={**params, "precision": config.precision},
+    )
+    return key, cache.get(key)
+
+
+def _check_date(session: Session, date_id: int, x_api_key: str | None) -> None:
+    """결과를 저장할 요청은 API Key와 대상 일자 로그를 추론 전에 확인."""
+
+    require_api_key(x_api_key, ApiKeyRepository(session))
+    if DateRepository(session).get(date_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Date not found")
+
+
+def _persist(
+    session: Session,
+    save: Callable[..., int],
+    result_type: str,
+    date_id: int,
+    items: Sequence[Any],
+    image_path: str,
+    content_id: str | None = None,
+) -> int:
+    """해당 일자의 같은 종류 결과를 교체(DELETE + executemany INSERT)하고 한 번에 커밋.
+
+    교체되는 결과가 가리키던 파일의 참조를 제거하고, 이미지가 내용 주소 저장소의 파일이면
+    새 결과가 그 파일을 참조함을 기록한다.
+    """
+
+    count = save(date_id, items, image_path=image_path)
+    ImageBlobRepository(session).replace_ref(content_id, ImageBlobRepository.OWNER_RESULTS[result_type], date_id)
+    session.commit()
+    return count
+
+
+async def _store_upload(file: UploadFile, storage: ImageStorageService, session: Session) -> StorageResult:
+    stored = await receive_upload(iter_upload_file(file), storage, filename=file.filename)
+    await run_in_threadpool(register_blob, session, stored)
+    return stored
+
+
+def _resolve_image(payload: ImageReference, storage: ImageStorageService) -> tuple[Path, tuple]:
+    """이미지 경로와 single-flight용 파일 식별 정보(경로, mtime, 크기). 파일 입출력이므로 스레드풀에서 호출."""
+
+    missing_upload = bool(payload.upload_id) and not payload.image_path
+    code = status.HTTP_404_NOT_FOUND if missing_upload else status.HTTP_400_BAD_REQUEST
+    path, error = _locate_image(payload, storage)
+    if path is None:
+        raise HTTPException(status_code=code, detail=error)
+    try:
+        # 확인 직후 파일이 삭제될 수 있으므로 stat 실패도 같은 오류로 응답한다.
+        stat = path.stat()
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=code, detail="Upload not found" if missing_upload else "Image not found") from exc
+    return path, (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def _model_input(
+    image_path: Path, storage: ImageStorageService, renditions: RenditionService | None
+) -> tuple[Path, tuple[float, float] | None]:
+    """업로드 이미지면 미리 만든 모델 입력 크기 파생본과 (가로, 세로) 원본 좌표 배율을 반환.
+
+    파생본이 아직 없거나 원본이 이미 그 크기 이하면 원본을 그대로 쓴다(배율 None).
+    """
+
+    if renditions is None or MODEL_RENDITION not in renditions.sizes:
+        return image_path, None
+    digest = storage.content_id(image_path)
+    if digest is None:
+        return image_path, None
+    rendition = renditions.path(MODEL_RENDITION, digest)
+    if not rendition.exists():
+        # 파생본이 없는 이전 업로드는 이번 요청은 원본으로 처리하고 생성을 예약한다.
+        renditions.schedule(image_path, digest)
+        return image_path, None
+    try:
+        (width, height), (model_width, model_height) = image_size(image_path), image_size(rendition)
+    except OSError:
+        return image_path, None
+    # 축소되지 않았거나 방향이 다르게 저장된 원본(EXIF 미보정)은 원본으로 추론한다.
+    if (model_width, model_height) == (width, height) or abs(width / height - model_width / model_height) > 0.05:
+        return image_path, None
+    return rendition, (width / model_width, height / model_height)
+
+
+def _rescale(boxes: list[BoundingBox], scale: tuple[float, float]) -> list[BoundingBox]:
+    """파생본 좌표의 박스를 원본 좌표로 변환."""
+
+    sx, sy = scale
+    return [
+        box.model_copy(update={"x": box.x * sx, "y": box.y * sy, "width": box.width * sx, "height": box.height * sy})
+        for box in boxes
+    ]
+
+
+def _locate_image(item: ImageReference, storage: ImageStorageService) -> tuple[Path | None, str | None]:
+    """`image_path` 또는 `upload_id`로 이미지 파일을 찾는다. 실패 시 (None, 오류 메시지)."""
+
+    if item.image_path:
+        path = Path(item.image_path)
+        return (path, None) if path.exists() else (None, "Image not found")
+    if item.upload_id:
+        try:
+            return storage.resolve(item.upload_id), None
+        except StorageError:
+            return None, "Upload not found"
+    return None, "image_path or upload_id is required"
+
+
+def _run_batch(
+    items: Sequence[ImageReference],
+    storage: ImageStorageService,
+    run_many: Callable[[list[Path]], list[Any]],
+    run_one: Callable[[Path], Any],
+) -> tuple[dict[int, Any], dict[int, str]]:
+    """유효한 항목만 모아 배치 실행하고 항목별 결과/오류를 인덱스로 반환."""
+
+    errors: dict[int, str] = {}
+    valid: list[tuple[int, Path]] = []
+    for index, item in enumerate(items):
+        path, error = _locate_image(item, storage)
+        if path is None:
+            errors[index] = error
+            continue
+        valid.append((index, path))
 
-    results = classifier.classify(image_path, top_k=payload.top_k)
-    return ClassificationResponse(results=results)
+    outputs: dict[int, Any] = {}
+    if not valid:
+        return outputs, errors
 
+    try:
+        results = run_many([path for _, path in valid])
+    except Exception:
+        # 배치 전체가 실패하면 어떤 항목이 원인인지 가리기 위해 개별 실행으로 전환
+        logger.exception("배치 추론 실패, 항목별 실행으로 전환")
+        for index, path in valid:
+            try:
+                outputs[index] = run_one(path)
+            except Exception as exc:
+                errors[index] = str(exc) or exc.__class__.__name__
+        return outputs, errors
 
-def _resolve_image_path(payload: ImageReference) -> Path:
-    if payload.image_path:
-        return Path(payload.image_path)
-    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="image_path is required")
+    for (index, _), result in zip(valid, results):
+        outputs[index] = result
+    return outputs, errors
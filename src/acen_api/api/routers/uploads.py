@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+from typing import AsyncIterator
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from ...repositories import ImageBlobRepository
 from ...schemas import ErrorResponse
-from ..deps import get_storage, require_api_key
+from ...services import ImageStorageService, RenditionService, StorageError, StorageResult
+from ..deps import get_rendition_service, get_session, get_storage, require_api_key
+
+# 업로드 본문을 읽는 단위. 요청당 메모리 사용량은 이 크기로 제한된다.
+_CHUNK_SIZE = 64 * 1024
+# 내용 주소 파일은 바뀌지 않으므로 브라우저/프록시가 오래 캐시해도 된다.
+_IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
 
 
 error_responses = {
     400: {"model": ErrorResponse, "description": "잘못된 요청"},
     401: {"model": ErrorResponse, "description": "인증 필요"},
+    404: {"model": ErrorResponse, "description": "리소스를 찾을 수 없습니다."},
 }
 
 
@@ -20,17 +31,111 @@ router = APIRouter(prefix="/uploads", tags=["uploads"], responses=error_response
 
 
 @router.post("", dependencies=[Depends(require_api_key)])
-async def upload_image(file: UploadFile = File(...), storage=Depends(get_storage)) -> dict:
+async def upload_image(
+    file: UploadFile = File(...),
+    storage=Depends(get_storage),
+    session: Session = Depends(get_session),
+) -> dict:
     # 파일명과 내용 검증 및 저장
+    result = await receive_upload(iter_upload_file(file), storage, filename=file.filename, decode=False)
+    await run_in_threadpool(register_blob, session, result)
+    return _upload_payload(result)
+
+
+@router.post("/stream", dependencies=[Depends(require_api_key)])
+async def upload_image_stream(
+    request: Request,
+    filename: str | None = Query(default=None, description="확장자 판별용 원본 파일명"),
+    storage: ImageStorageService = Depends(get_storage),
+    session: Session = Depends(get_session),
+) -> dict:
+    """요청 본문(이미지 바이트)을 받는 즉시 기록. 크기/형식 위반은 본문을 다 받기 전에 거절."""
+
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > storage.max_file_size:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="파일 크기가 제한을 초과했습니다.")
+    result = await receive_upload(request.stream(), storage, filename=filename, decode=False)
+    await run_in_threadpool(register_blob, session, result)
+    return _upload_payload(result)
+
+
+@router.get("/{upload_id}/rendition", response_class=FileResponse, dependencies=[Depends(require_api_key)])
+def get_rendition(
+    upload_id: str,
+    size: int = Query(default=160, ge=1, le=8192, description="필요한 긴 변 픽셀"),
+    storage: ImageStorageService = Depends(get_storage),
+    renditions: RenditionService | None = Depends(get_rendition_service),
+) -> FileResponse:
+    """요청 크기 이상인 가장 작은 파생 이미지를 반환. 아직 생성 전이거나 더 크게 요청하면 원본.
+
+    원본을 내려줄 수 있으므로 업로드와 같은 API Key를 요구한다.
+    """
+
+    try:
+        original = storage.resolve(upload_id)
+    except StorageError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found") from exc
+
+    best = renditions.best(upload_id, size) if renditions is not None else None
+    if best is None:
+        if renditions is not None:
+            # 예전 업로드처럼 파생본이 없으면 이번 요청은 원본으로 응답하고 생성을 예약한다.
+            renditions.schedule(original, upload_id)
+        name, path = "original", original
+    else:
+        name, path = best
+    headers = {"Cache-Control": _IMMUTABLE_CACHE, "X-Rendition": name}
+    return FileResponse(path, headers=headers)
+
+
+async def receive_upload(
+    chunks: AsyncIterator[bytes],
+    storage: ImageStorageService,
+    *,
+    filename: str | None = None,
+    decode: bool = True,
+) -> StorageResult:
+    """청크를 임시 파일로 스트리밍하며 검증하고 저장. 검증 실패는 400으로 변환.
+
+    `decode=False`면 추론에 쓸 픽셀을 만들지 않아 방향 보정이 없는 업로드는 디코딩 없이 끝난다.
+    """
+
+    writer = await run_in_threadpool(storage.open_upload, filename=filename, decode=decode)
     try:
-        data = await file.read()
-        result = storage.save_bytes(data, filename=file.filename)
-    except Exception as exc:  # StorageError 메시지 위임
+        async for chunk in chunks:
+            if chunk:
+                await run_in_threadpool(writer.write, chunk)
+        return await run_in_threadpool(writer.finish)
+    except StorageError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    finally:
+        writer.abort()
+
+
+def register_blob(session: Session, result: StorageResult) -> None:
+    """저장된 파일을 참조 카운트 테이블에 등록. 같은 내용이 이미 등록되어 있으면 그대로 둔다."""
+
+    ImageBlobRepository(session).register(
+        result.content_hash or result.upload_id,
+        relative_path=result.relative_path.as_posix(),
+        content_type=result.content_type,
+        size_bytes=result.size_bytes,
+    )
+    session.commit()
 
+
+async def iter_upload_file(file: UploadFile) -> AsyncIterator[bytes]:
+    """`UploadFile`을 한 번에 읽지 않고 청크 단위로 순회."""
+
+    while chunk := await file.read(_CHUNK_SIZE):
+        yield chunk
+
+
+def _upload_payload(result: StorageResult) -> dict:
     return {
+        "upload_id": result.upload_id,
         "path": str(result.path),
         "relative_path": str(result.relative_path),
         "content_type": result.content_type,
+        "deduplicated": result.deduplicated,
     }
-
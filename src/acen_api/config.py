@@ -12,7 +12,58 @@ class AppSettings(BaseSettings):
     log_level: str = "INFO"
     ui_enabled: bool = True
     api_key: str | None = None
+    upload_dir: str = "data/uploads"
     upload_max_bytes: int = 5 * 1024 * 1024
     upload_allowed_ext: str = "jpg,jpeg,png,webp"
+    # 쉼표로 구분한 `이름:긴 변 픽셀` 파생 이미지 목록. 비워두면 생성하지 않는다
+    rendition_sizes: str = "thumb:160,preview:1024"
+    # 모델 입력 크기(MODEL_INPUT_SIZE) 파생본 "model"도 생성해 /model/detect·classify 입력으로 사용 (타일 탐지 시 제외)
+    rendition_model_size: bool = True
+    rendition_dir: str = "data/renditions"
+    rendition_workers: int = 2
+    model_path: str | None = "data/models/yolov11l.pt"
+    model_device: str | None = None
+    model_preload: bool = True
+    model_warmup: bool = True
+    # 쉼표로 구분한 워밍업 입력 크기(한 변 픽셀). 비워두면 MODEL_INPUT_SIZE 사용
+    model_warmup_sizes: str = ""
+    model_backend: str = "torch"
+    model_input_size: int = 640
+    model_precision: str = "fp32"
+    # 가중치 교체 후 이전 모델을 해제하기까지 기다리는 시간(초). 진행 중인 요청은 이전 모델로 끝난다
+    model_swap_drain_seconds: float = 30.0
+    # POST /model/reload로 불러올 수 있는 가중치 디렉터리. 이 밖의 경로는 거절한다
+    model_dir: str = "data/models"
+    # 0보다 크면 각 워커 프로세스가 이 주기(초)로 가중치 파일 변경을 확인해 스스로 교체한다
+    model_watch_interval: float = 0.0
+    detect_tile_size: int = 0
+    detect_tile_overlap: float = 0.2
+    detect_max_tiles: int = 16
+    # 노드에서 함께 실행되는 워커 프로세스 수. 0이면 CPU 실행 계획을 적용하지 않는다
+    cpu_workers: int = 0
+    cpu_threads: int = 0
+    cpu_interop_threads: int = 1
+    cpu_pin: bool = False
+    cpu_slot_dir: str | None = None
+    onnx_intra_op_threads: int = 0
+    onnx_inter_op_threads: int = 0
+    batch_enabled: bool = True
+    batch_max_size: int = 8
+    batch_window_ms: float = 5.0
+    # 배처에 대기할 수 있는 최대 요청 수. 넘으면 503 + Retry-After (0이면 제한 없음)
+    batch_queue_size: int = 64
+    inference_cache_enabled: bool = True
+    inference_cache_max_bytes: int = 32 * 1024 * 1024
+    inference_cache_dir: str | None = None
+    tensor_cache_dir: str | None = None
+    inference_singleflight_enabled: bool = True
+    inference_workers: int = 4
+    inference_queue_size: int = 16
+    inference_retry_after_seconds: int = 1
+    inference_process_workers: int = 0
+    inference_process_max_restarts: int = 5
+    shadow_model_path: str | None = None
+    shadow_sample_rate: float = 0.0
+    shadow_queue_size: int = 32
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
@@ -69,4 +69,8 @@ def _handle_http_exception(request: Request, exc: StarletteHTTPException) -> JSO
         code="http_error",
         message=exc.detail if isinstance(exc.detail, str) else str(exc.detail),
     )
-    return JSONResponse(status_code=exc.status_code, content=payload.model_dump())
+    return JSONResponse(
+        status_code=exc.status_code,
+        content=payload.model_dump(),
+        headers=getattr(exc, "headers", None),
+    )
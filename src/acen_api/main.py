@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
+import threading
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
+from .api.deps import (
+    build_batchers,
+    build_cpu_plan,
+    build_inference_cache,
+    build_inference_executor,
+    build_model_registry,
+    build_rendition_service,
+    build_shadow_evaluator,
+    build_singleflight,
+    build_weights_watcher,
+    warm_up_models,
+)
 from .api.routers import api_router
 from .config import AppSettings
 from .core.db import init_db
 from .core.errors import register_exception_handlers
+from .services import apply_cpu_plan
 
 
 TAGS_METADATA = [
@@ -29,7 +43,50 @@ async def lifespan(app: FastAPI):
     """애플리케이션 시작/종료 처리를 위한 컨텍스트."""
 
     init_db()
-    yield
+    settings = AppSettings()
+    # 모델 로드(torch/onnxruntime 임포트) 전에 스레드 수와 코어 고정을 적용한다.
+    plan = build_cpu_plan(settings)
+    app.state.cpu_plan = apply_cpu_plan(plan) if plan is not None else None
+    registry = build_model_registry(settings)
+    if settings.model_preload:
+        registry.load_all()
+    app.state.model_registry = registry
+    app.state.batchers = build_batchers(registry, settings)
+    app.state.inference_cache = build_inference_cache(settings)
+    app.state.singleflight = build_singleflight(settings)
+    app.state.inference_executor = build_inference_executor(settings)
+    app.state.shadow_evaluator = build_shadow_evaluator(settings)
+    app.state.renditions = build_rendition_service(settings)
+    # --workers N 실행 시 /model/reload는 요청을 받은 프로세스에만 적용되므로 파일 교체를 프로세스별로 감시한다.
+    app.state.weights_watcher = build_weights_watcher(registry, settings)
+    warmup = None
+    if settings.model_preload and settings.model_warmup:
+        # 워밍업은 백그라운드에서 진행하고, 끝날 때까지 /health/ready가 503을 반환한다.
+        warmup = threading.Thread(
+            target=warm_up_models, args=(registry, settings), name="model-warmup", daemon=True
+        )
+        warmup.start()
+    try:
+        yield
+    finally:
+        if warmup is not None:
+            warmup.join()
+        if app.state.weights_watcher is not None:
+            app.state.weights_watcher.close()
+            app.state.weights_watcher = None
+        if app.state.shadow_evaluator is not None:
+            app.state.shadow_evaluator.close()
+            app.state.shadow_evaluator = None
+        if app.state.renditions is not None:
+            app.state.renditions.close()
+            app.state.renditions = None
+        app.state.inference_executor.shutdown()
+        app.state.inference_executor = None
+        for batcher in app.state.batchers.values():
+            batcher.close()
+        registry.close()
+        app.state.model_registry = None
+        app.state.batchers = None
 
 
 def create_app() -> FastAPI:
@@ -5,6 +5,8 @@ from .entities import (
     Calendar,
     Date,
     Feedback,
+    ImageBlob,
+    ImageBlobRef,
     ModelResult,
     Product,
     Schedule,
@@ -22,6 +24,8 @@ __all__ = [
     "Calendar",
     "Date",
     "ModelResult",
+    "ImageBlob",
+    "ImageBlobRef",
     "Feedback",
     "Product",
     "Suggest",
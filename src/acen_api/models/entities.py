@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import date as date_type, datetime
 
 from sqlalchemy import Date as SADate
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -196,3 +196,35 @@ class Suggest(TimestampMixin, Base):
 
     feedback: Mapped[Feedback] = relationship(back_populates="suggestions")
     product: Mapped[Product] = relationship(back_populates="suggestions")
+
+
+class ImageBlob(TimestampMixin, Base):
+    """내용 해시로 저장된 이미지 파일과 참조 수."""
+
+    __tablename__ = "image_blobs"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    relative_path: Mapped[str] = mapped_column(String(255), nullable=False)
+    content_type: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    refs: Mapped[list["ImageBlobRef"]] = relationship(
+        back_populates="blob", cascade="all, delete-orphan", passive_deletes=True
+    )
+
+
+class ImageBlobRef(TimestampMixin, Base):
+    """이미지 파일을 가리키는 레코드(`date`, `detection_results` 등)."""
+
+    __tablename__ = "image_blob_refs"
+    __table_args__ = (UniqueConstraint("content_hash", "owner_type", "owner_id"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    content_hash: Mapped[str] = mapped_column(
+        ForeignKey("image_blobs.content_hash", ondelete="CASCADE"), nullable=False
+    )
+    owner_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    owner_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    blob: Mapped[ImageBlob] = relationship(back_populates="refs")
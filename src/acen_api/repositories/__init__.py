@@ -3,6 +3,8 @@
 from .base import BaseRepository
 from .date import CalendarRepository, DateRepository
 from .feedback import FeedbackRepository, SuggestRepository
+from .image_blob import ImageBlobRepository
+from .model_result import ModelResultRepository
 from .product import ProductRepository
 from .template import ScheduleRepository, TemplateRepository
 from .user import UserRepository
@@ -14,6 +16,8 @@ __all__ = [
     "ScheduleRepository",
     "CalendarRepository",
     "DateRepository",
+    "ModelResultRepository",
+    "ImageBlobRepository",
     "ProductRepository",
     "FeedbackRepository",
     "SuggestRepository",
@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session, selectinload
 from ..models import Calendar, Date
 from ..schemas import DateCreate
 from .base import BaseRepository
+from .image_blob import ImageBlobRepository
 
 
 class CalendarRepository(BaseRepository):
@@ -37,6 +38,13 @@ class CalendarRepository(BaseRepository):
         stmt = select(Calendar).where(Calendar.user_id == user_id).order_by(Calendar.id)
         return list(self.session.execute(stmt).scalars())
 
+    def delete(self, calendar: Calendar) -> None:
+        """캘린더 삭제. 함께 삭제되는 일자 로그의 이미지 참조도 제거한다."""
+
+        date_ids = self.session.execute(select(Date.id).where(Date.calendar_id == calendar.id)).scalars().all()
+        ImageBlobRepository(self.session).release_dates(date_ids)
+        self.session.delete(calendar)
+
 
 class DateRepository(BaseRepository):
     """일자 로그 CRUD 및 조회."""
@@ -98,6 +106,12 @@ class DateRepository(BaseRepository):
         self.session.flush()
         return date_obj
 
+    def delete(self, date_obj: Date) -> None:
+        """일자 로그 삭제. 일자 로그와 그 추론 결과의 이미지 참조도 제거한다."""
+
+        ImageBlobRepository(self.session).release_dates([date_obj.id])
+        self.session.delete(date_obj)
+
     @staticmethod
     def _calc_ratio(done: int, total: int) -> float:
         if total <= 0:
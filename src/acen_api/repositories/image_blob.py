@@ -0,0 +1,124 @@
+"""내용 주소 이미지 저장소의 참조 카운트 리포지토리."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import Select, delete, select
+from sqlalchemy.orm import Session
+
+from ..models import ImageBlob, ImageBlobRef
+from .base import BaseRepository
+from .model_result import CLASSIFICATION, DETECTION
+
+
+class ImageBlobRepository(BaseRepository):
+    """이미지 파일(blob) 등록과 레코드별 참조 추적.
+
+    같은 (blob, owner_type, owner_id) 참조는 한 번만 세므로 반복 호출해도 안전하다.
+    추론 결과는 id 없이 일괄 저장되므로 결과 행 대신 일자와 결과 종류 단위(date_id)로 참조한다.
+    """
+
+    OWNER_DATE = "date"
+    OWNER_RESULTS = {DETECTION: "detection_results", CLASSIFICATION: "classification_results"}
+
+    def __init__(self, session: Session) -> None:
+        super().__init__(session)
+
+    def get(self, content_hash: str) -> ImageBlob | None:
+        return self.session.get(ImageBlob, content_hash)
+
+    def register(
+        self, content_hash: str, *, relative_path: str, content_type: str | None, size_bytes: int
+    ) -> ImageBlob:
+        """업로드된 파일을 등록. 이미 있는 내용이면 기존 항목을 반환."""
+
+        blob = self.get(content_hash)
+        if blob is None:
+            blob = ImageBlob(
+                content_hash=content_hash,
+                relative_path=relative_path,
+                content_type=content_type,
+                size_bytes=size_bytes,
+                ref_count=0,
+            )
+            self.session.add(blob)
+            self.session.flush()
+        return blob
+
+    def add_ref(self, content_hash: str, owner_type: str, owner_id: int) -> bool:
+        """참조 추가. 등록되지 않은 blob이거나 이미 있는 참조면 False."""
+
+        blob = self.get(content_hash)
+        if blob is None or self._find_ref(content_hash, owner_type, owner_id) is not None:
+            return False
+        self.session.add(ImageBlobRef(content_hash=content_hash, owner_type=owner_type, owner_id=owner_id))
+        blob.ref_count += 1
+        self.session.flush()
+        return True
+
+    def replace_ref(self, content_hash: str | None, owner_type: str, owner_id: int) -> None:
+        """레코드의 기존 참조를 제거하고 `content_hash`(있으면)를 참조하도록 교체."""
+
+        self.remove_refs(owner_type, owner_id)
+        if content_hash is not None:
+            self.add_ref(content_hash, owner_type, owner_id)
+
+    def remove_refs(self, owner_type: str, owner_id: int) -> int:
+        """레코드가 가진 참조를 모두 제거하고 참조 수를 줄인다."""
+
+        return self._remove(
+            select(ImageBlobRef).where(ImageBlobRef.owner_type == owner_type, ImageBlobRef.owner_id == owner_id)
+        )
+
+    def release_dates(self, date_ids: Sequence[int]) -> int:
+        """삭제되는 일자 로그와 그 추론 결과가 가진 참조를 모두 제거."""
+
+        if not date_ids:
+            return 0
+        owner_types = [self.OWNER_DATE, *self.OWNER_RESULTS.values()]
+        return self._remove(
+            select(ImageBlobRef).where(
+                ImageBlobRef.owner_type.in_(owner_types), ImageBlobRef.owner_id.in_(list(date_ids))
+            )
+        )
+
+    def unreferenced(self, limit: int = 1000, *, created_before: datetime | None = None) -> list[ImageBlob]:
+        """참조가 없는 blob 목록 (정리 대상). `created_before`로 막 업로드된 파일은 제외한다."""
+
+        stmt = select(ImageBlob).where(ImageBlob.ref_count == 0)
+        if created_before is not None:
+            stmt = stmt.where(ImageBlob.created_at < created_before)
+        stmt = stmt.order_by(ImageBlob.created_at).limit(limit)
+        return list(self.session.execute(stmt).scalars())
+
+    def delete_unreferenced(self, content_hash: str) -> bool:
+        """참조가 여전히 없을 때만 blob 행을 삭제. 그 사이 참조가 생겼으면 False."""
+
+        result = self.session.execute(
+            delete(ImageBlob).where(ImageBlob.content_hash == content_hash, ImageBlob.ref_count == 0)
+        )
+        self.session.flush()
+        return result.rowcount > 0
+
+    def _remove(self, stmt: Select) -> int:
+        refs = list(self.session.execute(stmt).scalars())
+        for ref in refs:
+            blob = self.get(ref.content_hash)
+            if blob is not None:
+                blob.ref_count = max(0, blob.ref_count - 1)
+        if refs:
+            self.session.execute(
+                delete(ImageBlobRef).where(ImageBlobRef.id.in_([ref.id for ref in refs]))
+            )
+        self.session.flush()
+        return len(refs)
+
+    def _find_ref(self, content_hash: str, owner_type: str, owner_id: int) -> ImageBlobRef | None:
+        stmt = select(ImageBlobRef).where(
+            ImageBlobRef.content_hash == content_hash,
+            ImageBlobRef.owner_type == owner_type,
+            ImageBlobRef.owner_id == owner_id,
+        )
+        return self.session.execute(stmt).scalar_one_or_none()
@@ -0,0 +1,92 @@
+"""모델 추론 결과 리포지토리."""
+
+from __future__ import annotations
+
+import json
+from typing import Sequence
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from ..models import ModelResult
+from ..schemas import BoundingBox, ClassificationResult
+from .base import BaseRepository
+
+DETECTION = "detection"
+CLASSIFICATION = "classification"
+
+
+class ModelResultRepository(BaseRepository):
+    """일자 로그에 연결된 추론 결과 저장/조회."""
+
+    def __init__(self, session: Session) -> None:
+        super().__init__(session)
+
+    def save_detections(
+        self, date_id: int, boxes: Sequence[BoundingBox], *, image_path: str | None = None
+    ) -> int:
+        """일자 로그의 탐지 결과를 교체. 좌표는 `data`에 압축 JSON으로 보관."""
+
+        return self.replace_detections([(date_id, boxes, image_path)])
+
+    def replace_detections(
+        self, items: Sequence[tuple[int, Sequence[BoundingBox], str | None]]
+    ) -> int:
+        """여러 일자 로그의 탐지 결과를 교체. DELETE 한 번과 executemany INSERT 한 번으로 처리."""
+
+        if not items:
+            return 0
+        self._delete([date_id for date_id, _, _ in items], DETECTION)
+        rows = [row for date_id, boxes, path in items for row in _detection_rows(date_id, boxes, path)]
+        return self._insert_many(rows)
+
+    def save_classifications(
+        self, date_id: int, results: Sequence[ClassificationResult], *, image_path: str | None = None
+    ) -> int:
+        """일자 로그의 분류 결과(top-k)를 순위와 함께 교체."""
+
+        self._delete([date_id], CLASSIFICATION)
+        rows = [
+            {
+                "date_id": date_id,
+                "result_type": CLASSIFICATION,
+                "label": item.label,
+                "score": item.score,
+                "data": _compact({"rank": rank}),
+                "image_path": image_path,
+            }
+            for rank, item in enumerate(results)
+        ]
+        return self._insert_many(rows)
+
+    def list_for_date(self, date_id: int) -> list[ModelResult]:
+        stmt = select(ModelResult).where(ModelResult.date_id == date_id).order_by(ModelResult.id)
+        return list(self.session.execute(stmt).scalars())
+
+    def _delete(self, date_ids: Sequence[int], result_type: str) -> None:
+        self.session.execute(
+            delete(ModelResult).where(ModelResult.date_id.in_(date_ids), ModelResult.result_type == result_type)
+        )
+
+    def _insert_many(self, rows: list[dict]) -> int:
+        if rows:
+            self.session.execute(insert(ModelResult), rows)
+        return len(rows)
+
+
+def _detection_rows(date_id: int, boxes: Sequence[BoundingBox], image_path: str | None) -> list[dict]:
+    return [
+        {
+            "date_id": date_id,
+            "result_type": DETECTION,
+            "label": box.label,
+            "score": box.score,
+            "data": _compact([round(box.x, 2), round(box.y, 2), round(box.width, 2), round(box.height, 2)]),
+            "image_path": image_path,
+        }
+        for box in boxes
+    ]
+
+
+def _compact(value: object) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
@@ -7,9 +7,10 @@ from typing import Any
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from ..models import User
+from ..models import Date, User
 from ..schemas import UserCreate
 from .base import BaseRepository
+from .image_blob import ImageBlobRepository
 
 
 class UserRepository(BaseRepository):
@@ -33,5 +34,9 @@ class UserRepository(BaseRepository):
         return user
 
     def delete(self, user: User) -> None:
+        """사용자 삭제. 함께 삭제되는 일자 로그의 이미지 참조도 제거한다."""
+
+        date_ids = self.session.execute(select(Date.id).where(Date.user_id == user.id)).scalars().all()
+        ImageBlobRepository(self.session).release_dates(date_ids)
         self.session.delete(user)
 
@@ -18,12 +18,24 @@ from .feedback import (
 from .error import ErrorField, ErrorResponse
 from .model import (
     BoundingBox,
+    ClassificationBatchItem,
+    ClassificationBatchRequest,
+    ClassificationBatchResponse,
     ClassificationRequest,
     ClassificationResponse,
     ClassificationResult,
+    DetectionBatchItem,
+    DetectionBatchRequest,
+    DetectionBatchResponse,
     DetectionRequest,
     DetectionResponse,
     ImageReference,
+    ModelReloadRequest,
+    ModelReloadResponse,
+    ModelStatus,
+    ReadinessResponse,
+    UploadClassificationResponse,
+    UploadDetectionResponse,
 )
 from .template import (
     ScheduleBase,
@@ -62,6 +74,18 @@ __all__ = [
     "ClassificationResponse",
     "ClassificationResult",
     "ImageReference",
+    "DetectionBatchRequest",
+    "DetectionBatchItem",
+    "DetectionBatchResponse",
+    "ClassificationBatchRequest",
+    "ClassificationBatchItem",
+    "ClassificationBatchResponse",
+    "ModelReloadRequest",
+    "ModelReloadResponse",
+    "ModelStatus",
+    "ReadinessResponse",
+    "UploadDetectionResponse",
+    "UploadClassificationResponse",
     "MetricBreakdown",
     "EvaluatorMetrics",
     "FeedbackBase",
@@ -21,9 +21,10 @@ class BoundingBox(APIModel):
 
 
 class DetectionResponse(APIModel):
-    """탐지 결과 응답."""
+    """탐지 결과 응답. `date_id`를 지정한 요청은 저장된 결과 수를 `persisted`로 반환."""
 
     boxes: list[BoundingBox]
+    persisted: int | None = None
 
 
 class ClassificationResult(APIModel):
@@ -34,9 +35,10 @@ class ClassificationResult(APIModel):
 
 
 class ClassificationResponse(APIModel):
-    """분류 결과 응답."""
+    """분류 결과 응답. `date_id`를 지정한 요청은 저장된 결과 수를 `persisted`로 반환."""
 
     results: list[ClassificationResult]
+    persisted: int | None = None
 
 
 class ImageReference(APIModel):
@@ -51,9 +53,113 @@ class DetectionRequest(ImageReference):
 
     confidence: Annotated[float, Field(ge=0, le=1)] = 0.25
     iou: Annotated[float, Field(ge=0, le=1)] = 0.45
+    max_batch_wait_ms: Annotated[float | None, Field(ge=0, le=1000)] = None
+    # 지정하면 탐지 결과를 해당 일자 로그의 ModelResult로 일괄 저장
+    date_id: int | None = None
 
 
 class ClassificationRequest(ImageReference):
     """분류 요청."""
 
     top_k: Annotated[int, Field(ge=1, le=10)] = 3
+    max_batch_wait_ms: Annotated[float | None, Field(ge=0, le=1000)] = None
+    # 지정하면 분류 결과를 해당 일자 로그의 ModelResult로 일괄 저장
+    date_id: int | None = None
+
+
+class DetectionBatchRequest(APIModel):
+    """여러 이미지에 대한 탐지 요청."""
+
+    items: Annotated[list[ImageReference], Field(min_length=1, max_length=64)]
+    confidence: Annotated[float, Field(ge=0, le=1)] = 0.25
+    iou: Annotated[float, Field(ge=0, le=1)] = 0.45
+
+
+class DetectionBatchItem(APIModel):
+    """배치 탐지의 개별 결과. 실패한 항목은 `error`만 채운다."""
+
+    index: int
+    boxes: list[BoundingBox] | None = None
+    error: str | None = None
+
+
+class DetectionBatchResponse(APIModel):
+    """입력 순서를 유지한 배치 탐지 결과."""
+
+    results: list[DetectionBatchItem]
+
+
+class ClassificationBatchRequest(APIModel):
+    """여러 이미지에 대한 분류 요청."""
+
+    items: Annotated[list[ImageReference], Field(min_length=1, max_length=64)]
+    top_k: Annotated[int, Field(ge=1, le=10)] = 3
+
+
+class ClassificationBatchItem(APIModel):
+    """배치 분류의 개별 결과. 실패한 항목은 `error`만 채운다."""
+
+    index: int
+    results: list[ClassificationResult] | None = None
+    error: str | None = None
+
+
+class ClassificationBatchResponse(APIModel):
+    """입력 순서를 유지한 배치 분류 결과."""
+
+    results: list[ClassificationBatchItem]
+
+
+class UploadDetectionResponse(DetectionResponse):
+    """업로드와 동시에 수행한 탐지 결과. 이후 요청은 `upload_id`로 같은 이미지를 참조한다."""
+
+    upload_id: str
+    relative_path: str
+
+
+class UploadClassificationResponse(ClassificationResponse):
+    """업로드와 동시에 수행한 분류 결과."""
+
+    upload_id: str
+    relative_path: str
+
+
+class ModelStatus(APIModel):
+    """레지스트리에 등록된 모델의 로딩 상태."""
+
+    role: str
+    name: str
+    weights_path: str | None = None
+    ready: bool
+    swapping: bool = False
+    load_seconds: float | None = None
+    memory_bytes: int | None = None
+    warmed: bool = False
+    warmup_seconds: float | None = None
+    error: str | None = None
+
+
+class ModelReloadRequest(APIModel):
+    """모델 가중치 교체 요청. `weights_path`를 생략하면 현재 경로의 파일을 다시 읽는다."""
+
+    role: str = "detector"
+    weights_path: str | None = None
+
+
+class ModelReloadResponse(APIModel):
+    """백그라운드 교체 시작 응답. 진행 상황은 `/model/status`의 `swapping`으로 확인.
+
+    교체는 `pid` 프로세스에만 적용된다. 여러 워커로 실행할 때는 `MODEL_WATCH_INTERVAL`로 파일 교체를 감시한다.
+    """
+
+    role: str
+    weights_path: str | None = None
+    pid: int
+    status: str = "accepted"
+
+
+class ReadinessResponse(APIModel):
+    """트래픽 수신 가능 여부. 모든 모델이 로드/워밍업되어야 `ready`."""
+
+    status: str
+    models: list[ModelStatus]
@@ -1,11 +1,24 @@
 """도메인 서비스 패키지."""
 
 from .model.base import ModelConfig, ModelWrapper
+from .model.batching import MicroBatcher
+from .model.cache import InferenceCache, content_hash, weights_version
+from .model.executor import ExecutorSaturated, InferenceExecutor
 from .model.classifier_stub import RuleBasedClassifier
+from .model.detector_onnx import OnnxDetector
 from .model.detector_ultralytics import UltralyticsDetector
-from .model.device import choose_device
+from .model.device import CpuPlan, apply_cpu_plan, choose_device, claim_worker_slot, current_cpu_plan, plan_cpu
 from .model.dummy import DummyClassifier, DummyDetector
-from .storage import ImageStorageService, StorageError, StorageResult
+from .model.image import ImageInput, image_size, synthetic_image, to_rgb_array
+from .model.shadow import ShadowEvaluator
+from .model.singleflight import SingleFlight
+from .model.tensor_cache import TensorCache
+from .model.registry import ModelEntry, ModelRegistry, SynchronizedModel, WeightsWatcher
+from .model.workers import ProcessPoolModel, WorkerCrashed
+from .blob_gc import collect_unreferenced_blobs
+from .renditions import MODEL_RENDITION, RenditionService
+from .rescore import RescoreJob, RescoreStats
+from .storage import ImageStorageService, StorageError, StorageResult, UploadWriter, sniff_image_format
 from .evaluator.service import EvaluatorService
 from .feedback.service import FeedbackResult, FeedbackService
 
@@ -13,13 +26,45 @@ __all__ = [
     "ImageStorageService",
     "StorageError",
     "StorageResult",
+    "UploadWriter",
+    "sniff_image_format",
+    "RenditionService",
+    "MODEL_RENDITION",
+    "collect_unreferenced_blobs",
     "ModelConfig",
     "ModelWrapper",
     "choose_device",
+    "CpuPlan",
+    "plan_cpu",
+    "apply_cpu_plan",
+    "current_cpu_plan",
+    "claim_worker_slot",
     "DummyDetector",
     "DummyClassifier",
     "UltralyticsDetector",
+    "OnnxDetector",
     "RuleBasedClassifier",
+    "ModelRegistry",
+    "ModelEntry",
+    "SynchronizedModel",
+    "WeightsWatcher",
+    "MicroBatcher",
+    "InferenceCache",
+    "content_hash",
+    "weights_version",
+    "SingleFlight",
+    "ShadowEvaluator",
+    "TensorCache",
+    "InferenceExecutor",
+    "ExecutorSaturated",
+    "ImageInput",
+    "image_size",
+    "synthetic_image",
+    "to_rgb_array",
+    "ProcessPoolModel",
+    "WorkerCrashed",
+    "RescoreJob",
+    "RescoreStats",
     "EvaluatorService",
     "FeedbackService",
     "FeedbackResult",
@@ -0,0 +1,48 @@
+"""참조가 없는 업로드 이미지(blob)와 파생본 정리."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from ..repositories import ImageBlobRepository
+from .renditions import RenditionService
+from .storage import ImageStorageService
+
+logger = logging.getLogger(__name__)
+
+
+def collect_unreferenced_blobs(
+    session: Session,
+    storage: ImageStorageService,
+    *,
+    renditions: RenditionService | None = None,
+    grace_seconds: float = 3600.0,
+    limit: int = 1000,
+) -> int:
+    """`ref_count`가 0이고 `grace_seconds`보다 오래된 blob의 행과 파일(파생본 포함)을 삭제.
+
+    업로드 직후 아직 일자 로그에 연결되지 않은 파일은 유예 시간 동안 남겨 둔다. 행은 참조가
+    여전히 없을 때만 지우고 커밋한 뒤에 파일을 삭제하므로, 그 사이 참조가 생긴 파일은 유지된다.
+    같은 내용의 재업로드는 기존 파일을 재사용하므로 업로드가 적은 시간에 실행한다.
+    삭제한 blob 수를 반환.
+    """
+
+    repo = ImageBlobRepository(session)
+    created_before = (datetime.now(timezone.utc) - timedelta(seconds=grace_seconds)).replace(tzinfo=None)
+    removed = []
+    for blob in repo.unreferenced(limit, created_before=created_before):
+        if repo.delete_unreferenced(blob.content_hash):
+            removed.append((blob.content_hash, blob.relative_path))
+    session.commit()
+
+    for digest, relative_path in removed:
+        (storage.base_dir / relative_path).unlink(missing_ok=True)
+        if renditions is not None:
+            for name in renditions.sizes:
+                renditions.path(name, digest).unlink(missing_ok=True)
+    if removed:
+        logger.info("참조 없는 이미지 %d개 삭제", len(removed))
+    return len(removed)
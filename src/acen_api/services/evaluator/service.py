@@ -7,6 +7,7 @@ from datetime import date
 from sqlalchemy.orm import Session
 
 from ...repositories import CalendarRepository, DateRepository
+from ...repositories.model_result import CLASSIFICATION
 from ...schemas import EvaluatorMetrics
 from .metrics import DailyRecord, compute_metrics
 
@@ -31,7 +32,8 @@ class EvaluatorService:
             record = DailyRecord(
                 scheduled_date=date_obj.scheduled_date,
                 completion_ratio=float(date_obj.completion_ratio),
-                model_count=len(date_obj.model_results),
+                # 분류 결과(이미지마다 top-k 행)만 제외한다. 그 밖의 결과 종류 표기는 모두 탐지로 센다.
+                model_count=sum(1 for result in date_obj.model_results if result.result_type != CLASSIFICATION),
                 severity_score=avg_severity,
             )
             records.append(record)
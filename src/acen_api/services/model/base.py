@@ -4,24 +4,53 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Protocol
+from typing import Iterable, Protocol, Sequence
 
 from ...schemas import BoundingBox, ClassificationResult
+from .image import ImageInput
+
+# DetectionRequest와 같은 기본 탐지 임계값
+DEFAULT_CONFIDENCE = 0.25
+DEFAULT_IOU = 0.45
 
 
 class ModelWrapper(Protocol):
     """탐지/분류 모델 공통 인터페이스."""
 
     name: str
+    thread_safe: bool = True
 
     def load(self, *, device: str | None = None) -> None:  # pragma: no cover - 인터페이스 선언
         """모델 리소스를 메모리에 로드."""
 
-    def detect(self, image_path: Path) -> list[BoundingBox]:  # pragma: no cover
-        """탐지 결과 반환."""
+    def detect(
+        self, image: ImageInput, *, confidence: float = DEFAULT_CONFIDENCE, iou: float = DEFAULT_IOU
+    ) -> list[BoundingBox]:  # pragma: no cover
+        """탐지 결과 반환. `image`는 파일 경로 또는 디코딩된 RGB 배열.
+
+        `confidence` 미만 점수의 박스는 제외하고, `iou`는 NMS 임계값으로 사용한다.
+        """
+
+    def classify(self, image: ImageInput, top_k: int = 3) -> list[ClassificationResult]:  # pragma: no cover
+        """분류 결과 반환. `image`는 파일 경로 또는 디코딩된 RGB 배열."""
+
+    def detect_batch(
+        self,
+        images: Sequence[ImageInput],
+        *,
+        confidence: float = DEFAULT_CONFIDENCE,
+        iou: float = DEFAULT_IOU,
+    ) -> list[list[BoundingBox]]:
+        """여러 이미지의 탐지 결과를 입력 순서대로 반환. 기본 구현은 단건 호출을 반복."""
 
-    def classify(self, image_path: Path, top_k: int = 3) -> list[ClassificationResult]:  # pragma: no cover
-        """분류 결과 반환."""
+        return [self.detect(image, confidence=confidence, iou=iou) for image in images]
+
+    def classify_batch(
+        self, images: Sequence[ImageInput], top_k: int = 3
+    ) -> list[list[ClassificationResult]]:
+        """여러 이미지의 분류 결과를 입력 순서대로 반환. 기본 구현은 단건 호출을 반복."""
+
+        return [self.classify(image, top_k=top_k) for image in images]
 
 
 @dataclass(slots=True)
@@ -32,3 +61,12 @@ class ModelConfig:
     weights_path: Path | None = None
     labels: Iterable[str] | None = None
     device: str | None = None
+    # 추론 정밀도. "fp32" 또는 "int8"(양자화 변형, 백엔드가 지원하는 경우)
+    precision: str = "fp32"
+
+    def key(self) -> tuple:
+        """레지스트리 등에서 사용할 해시 가능한 식별 키."""
+
+        weights = str(self.weights_path) if self.weights_path else None
+        labels = tuple(self.labels) if self.labels is not None else None
+        return (self.name, weights, labels, self.device, self.precision)
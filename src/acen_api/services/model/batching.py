@@ -0,0 +1,178 @@
+"""동적 마이크로 배칭 스케줄러."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+from .executor import ExecutorSaturated
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+BatchHandler = Callable[[Hashable, list[T]], list[R]]
+
+
+class BatchFuture(Future):
+    """배치 결과 Future. `elapsed_ms`는 이 요청이 포함된 배치 호출(handler) 실행 시간."""
+
+    elapsed_ms: float | None = None
+
+
+@dataclass(slots=True)
+class _Pending:
+    item: Any
+    deadline: float
+    future: BatchFuture = field(default_factory=BatchFuture)
+
+
+class MicroBatcher(Generic[T, R]):
+    """짧은 시간 창 안에 도착한 요청을 묶어 한 번의 배치 호출로 처리.
+
+    같은 `group` 키를 가진 요청만 함께 묶이며, 배치는 `max_batch_size`가 차거나
+    대기 중인 요청 중 가장 이른 마감 시각(도착 시각 + min(창, 요청별 예산))에 도달하면 실행된다.
+    배치 호출은 전용 스레드 하나에서 순차 실행되고 결과는 요청별 Future로 분배된다.
+    대기 중인 요청이 `max_queue_size`에 도달하면 큐에 넣지 않고 `ExecutorSaturated`로 거절한다.
+    """
+
+    def __init__(
+        self,
+        handler: BatchHandler,
+        *,
+        max_batch_size: int = 8,
+        window_ms: float = 5.0,
+        max_queue_size: int = 0,
+        retry_after_seconds: int = 1,
+        name: str = "micro-batcher",
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size는 1 이상이어야 합니다.")
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.window = max(0.0, window_ms) / 1000.0
+        # 0이면 대기 요청 수를 제한하지 않는다.
+        self.max_queue_size = max(0, max_queue_size)
+        self.retry_after_seconds = retry_after_seconds
+        self.name = name
+        self._cond = threading.Condition()
+        self._pending: dict[Hashable, list[_Pending]] = {}
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._queued = 0
+        self._batches = 0
+        self._items = 0
+        self._rejected = 0
+
+    def submit(self, item: T, *, group: Hashable = None, budget_ms: float | None = None) -> R:
+        """요청을 배치 큐에 넣고 결과가 나올 때까지 대기."""
+
+        return self.submit_future(item, group=group, budget_ms=budget_ms).result()
+
+    def submit_future(
+        self, item: T, *, group: Hashable = None, budget_ms: float | None = None
+    ) -> "BatchFuture[R]":
+        """요청을 배치 큐에 넣고 결과 Future를 반환. 대기열이 가득 차면 `ExecutorSaturated`."""
+
+        wait = self.window if budget_ms is None else min(self.window, max(0.0, budget_ms) / 1000.0)
+        pending = _Pending(item=item, deadline=time.monotonic() + wait)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"{self.name}가 이미 종료되었습니다.")
+            if self.max_queue_size and self._queued >= self.max_queue_size:
+                self._rejected += 1
+                raise ExecutorSaturated(self.retry_after_seconds)
+            self._ensure_started()
+            self._pending.setdefault(group, []).append(pending)
+            self._queued += 1
+            self._cond.notify()
+        return pending.future
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            queued, rejected = self._queued, self._rejected
+            batches, items = self._batches, self._items
+        return {
+            "batches": batches,
+            "items": items,
+            "queued": queued,
+            "rejected": rejected,
+            "avg_batch_size": (items / batches) if batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "max_queue_size": self.max_queue_size,
+            "window_ms": self.window * 1000.0,
+        }
+
+    def close(self) -> None:
+        """새 요청을 막고 대기 중인 요청을 모두 처리한 뒤 스레드를 종료."""
+
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _ensure_started(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                ready = self._take_ready_batch()
+                while ready is None:
+                    if self._closed and not self._pending:
+                        return
+                    self._cond.wait(timeout=self._next_timeout())
+                    ready = self._take_ready_batch()
+            self._execute(*ready)
+
+    def _take_ready_batch(self) -> tuple[Hashable, list[_Pending]] | None:
+        now = time.monotonic()
+        for group, items in self._pending.items():
+            earliest = min(pending.deadline for pending in items)
+            if len(items) >= self.max_batch_size or earliest <= now or self._closed:
+                batch = items[: self.max_batch_size]
+                remaining = items[self.max_batch_size :]
+                if remaining:
+                    self._pending[group] = remaining
+                else:
+                    del self._pending[group]
+                self._queued -= len(batch)
+                return group, batch
+        return None
+
+    def _next_timeout(self) -> float | None:
+        deadlines = [pending.deadline for items in self._pending.values() for pending in items]
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - time.monotonic())
+
+    def _execute(self, group: Hashable, batch: list[_Pending]) -> None:
+        live = [pending for pending in batch if pending.future.set_running_or_notify_cancel()]
+        if not live:
+            return
+        started = time.perf_counter()
+        try:
+            results = self.handler(group, [pending.item for pending in live])
+            if len(results) != len(live):
+                raise RuntimeError("배치 결과 개수가 입력 개수와 다릅니다.")
+        except Exception as exc:  # 배치 전체 실패는 모든 대기 요청에 전달
+            logger.exception("%s 배치 실행 실패", self.name)
+            for pending in live:
+                pending.future.set_exception(exc)
+        else:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            for pending, result in zip(live, results):
+                pending.future.elapsed_ms = elapsed_ms
+                pending.future.set_result(result)
+        with self._cond:
+            self._batches += 1
+            self._items += len(live)
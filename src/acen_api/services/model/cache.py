@@ -0,0 +1,152 @@
+"""이미지 내용 해시 기반 추론 결과 캐시."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Mapping
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def content_hash(path: Path) -> str:
+    """파일 내용의 SHA-256 해시."""
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def weights_version(weights_path: Path | str | None) -> str:
+    """가중치 파일 크기/수정 시각으로 만든 버전 문자열. 가중치가 없으면 "none"."""
+
+    if not weights_path:
+        return "none"
+    try:
+        stat = Path(weights_path).stat()
+    except OSError:
+        return "none"
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+class InferenceCache:
+    """추론 결과를 보관하는 2단 캐시.
+
+    메모리 계층은 직렬화된 결과의 바이트 크기 합이 `max_bytes`를 넘지 않도록 LRU 순으로 제거하며,
+    `disk_dir`가 주어지면 디스크 계층에도 JSON으로 기록해 프로세스 재시작 후에도 재사용한다.
+    """
+
+    def __init__(self, *, max_bytes: int = 32 * 1024 * 1024, disk_dir: Path | None = None) -> None:
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(
+        *, content_hash: str, model_name: str, weights_version: str, params: Mapping[str, Any]
+    ) -> str:
+        raw = json.dumps(
+            [content_hash, model_name, weights_version, dict(sorted(params.items()))],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return json.loads(payload)
+
+        payload = self._read_disk(key)
+        with self._lock:
+            if payload is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._store(key, payload)
+        return json.loads(payload)
+
+    def put(self, key: str, value: Any) -> None:
+        payload = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        with self._lock:
+            self._store(key, payload)
+        self._write_disk(key, payload)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._disk_hits + self._misses
+            return {
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_ratio": ((self._hits + self._disk_hits) / lookups) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions,
+                "disk_enabled": self.disk_dir is not None,
+            }
+
+    def _store(self, key: str, payload: bytes) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._entries[key] = payload
+        self._size += len(payload)
+        while self._size > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+            self._evictions += 1
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> bytes | None:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, payload: bytes) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+        except OSError as exc:  # pragma: no cover - 디스크 계층 실패는 무시
+            logger.warning("추론 캐시 디스크 기록 실패: %s", exc)
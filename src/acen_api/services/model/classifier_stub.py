@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+from typing import Sequence
 
-from PIL import Image, ImageStat
+import numpy as np
+from PIL import Image
 
 from ...schemas import BoundingBox, ClassificationResult
 from .base import ModelConfig, ModelWrapper
+from .image import ImageInput
+
+_LABELS = ("acne", "clear", "neutral")
+# Pillow의 RGB -> L 변환과 같은 ITU-R 601 휘도 가중치
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float64)
+# 평균 밝기만 필요하므로 JPEG은 이 크기 근처까지 축소 디코딩(draft)한다.
+_DRAFT_SIZE = 64
 
 
 class RuleBasedClassifier(ModelWrapper):
     """간단한 통계 기반 더미 분류기.
 
     평균 밝기 등을 기반으로 가중치를 생성하여 초기 API 연동을 돕는다.
+    부하 시 폴백 분류기로 쓰이므로 배치 전체의 점수를 NumPy로 한 번에 계산한다.
     """
 
     name = "rule-based-classifier"
@@ -25,27 +34,68 @@ class RuleBasedClassifier(ModelWrapper):
     def load(self, *, device: str | None = None) -> None:
         self._loaded = True
 
-    def detect(self, image_path: Path) -> list[BoundingBox]:  # pragma: no cover - 분류 전용
+    def detect(self, image: ImageInput, **_thresholds: float) -> list[BoundingBox]:  # pragma: no cover - 분류 전용
         return []
 
-    def classify(self, image_path: Path, top_k: int = 3) -> list[ClassificationResult]:
+    def classify(self, image: ImageInput, top_k: int = 3) -> list[ClassificationResult]:
+        return self.classify_batch([image], top_k=top_k)[0]
+
+    def classify_batch(
+        self, images: Sequence[ImageInput], top_k: int = 3
+    ) -> list[list[ClassificationResult]]:
         if not self._loaded:
             raise RuntimeError("모델이 로드되지 않았습니다. 먼저 load()를 호출하세요.")
+        if not images:
+            return []
 
-        with Image.open(image_path) as img:
-            stat = ImageStat.Stat(img.convert("L"))
-            mean_brightness = stat.mean[0] / 255.0
+        brightness = mean_brightness(images)
 
         # 밝을수록 "clear" 점수 상승, 어두울수록 "acne" 점수 상승
-        acne_score = max(0.0, min(1.0, 1.0 - mean_brightness))
-        clear_score = max(0.0, min(1.0, mean_brightness))
-        neutral_score = 1.0 - abs(clear_score - acne_score)
-
-        results = [
-            ClassificationResult(label="acne", score=float(acne_score)),
-            ClassificationResult(label="clear", score=float(clear_score)),
-            ClassificationResult(label="neutral", score=float(neutral_score)),
+        acne = np.clip(1.0 - brightness, 0.0, 1.0)
+        clear = np.clip(brightness, 0.0, 1.0)
+        neutral = 1.0 - np.abs(clear - acne)
+        scores = np.stack([acne, clear, neutral], axis=1)
+        order = np.argsort(-scores, axis=1, kind="stable")[:, :top_k]
+
+        return [
+            [ClassificationResult(label=_LABELS[index], score=float(row[index])) for index in indices]
+            for row, indices in zip(scores.tolist(), order.tolist())
         ]
 
-        results.sort(key=lambda item: item.score, reverse=True)
-        return results[:top_k]
+
+def mean_brightness(images: Sequence[ImageInput]) -> np.ndarray:
+    """이미지별 평균 휘도(0~1)를 (N,) 배열로 반환.
+
+    배열 입력은 크기가 모두 같으면 한 번에 쌓아 계산하고, 경로 입력은 그레이스케일로
+    축소 디코딩해 채널 평균만 구한다.
+    """
+
+    channel_means = np.empty((len(images), 3), dtype=np.float64)
+    arrays = [(i, image) for i, image in enumerate(images) if isinstance(image, np.ndarray)]
+    if arrays and len({array.shape for _, array in arrays}) == 1 and arrays[0][1].ndim == 3:
+        stacked = np.stack([array for _, array in arrays])
+        flat = stacked.reshape(len(arrays), -1, stacked.shape[-1])
+        channel_means[[i for i, _ in arrays]] = flat.mean(axis=1)[:, :3]
+    else:
+        for i, array in arrays:
+            channel_means[i] = _channel_means(array)
+
+    for i, image in enumerate(images):
+        if not isinstance(image, np.ndarray):
+            channel_means[i] = _decode_luma(image)
+
+    return channel_means @ _LUMA_WEIGHTS / 255.0
+
+
+def _channel_means(array: np.ndarray) -> np.ndarray:
+    if array.ndim == 2:
+        return np.full(3, array.mean())
+    return array.reshape(-1, array.shape[-1]).mean(axis=0)[:3]
+
+
+def _decode_luma(path: ImageInput) -> float:
+    """JPEG은 draft 모드로 축소 디코딩한 그레이스케일 평균. 가중치 합이 1이므로 세 채널에 복제."""
+
+    with Image.open(path) as img:
+        img.draft("L", (_DRAFT_SIZE, _DRAFT_SIZE))
+        return float(np.asarray(img.convert("L"), dtype=np.float64).mean())
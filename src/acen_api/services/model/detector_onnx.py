@@ -0,0 +1,177 @@
+"""ONNX Runtime(CPU) 기반 YOLO 탐지 래퍼."""
+
+from __future__ import annotations
+
+import ast
+import logging
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+from ...schemas import BoundingBox
+from .base import DEFAULT_CONFIDENCE, DEFAULT_IOU, ModelConfig, ModelWrapper
+from .dummy import DummyDetector
+from .image import ImageInput, to_rgb_array
+from .postprocess import LetterboxInfo, decode_yolo_output, letterbox
+from .tensor_cache import TensorCache
+
+logger = logging.getLogger(__name__)
+
+# onnxruntime은 첫 load() 시점에 임포트한다.
+_UNSET: Any = object()
+ort: Any = _UNSET
+
+
+def _load_ort() -> Any:
+    """onnxruntime을 지연 임포트. 미설치 환경에서는 None."""
+
+    global ort
+    if ort is _UNSET:
+        try:
+            import onnxruntime as module
+        except ImportError:  # pragma: no cover - 옵셔널 의존성
+            module = None
+        ort = module
+    return ort
+
+
+class OnnxDetector(ModelWrapper):
+    """Ultralytics에서 export한 ONNX YOLO 모델을 onnxruntime CPU provider로 실행.
+
+    `weights_path`가 `.pt`이면 같은 이름의 `.onnx` 파일을 찾는다(`precision="int8"`이면
+    `.int8.onnx`). onnxruntime이 없거나 모델 파일이 없으면 DummyDetector로 폴백한다.
+    `tensor_cache`가 주어지면 경로 입력의 전처리 텐서를 디스크에서 재사용한다.
+    """
+
+    name = "onnx-detector"
+
+    def __init__(
+        self,
+        config: ModelConfig | None = None,
+        *,
+        input_size: int = 640,
+        intra_op_threads: int = 0,
+        inter_op_threads: int = 0,
+        tensor_cache: TensorCache | None = None,
+    ) -> None:
+        self.config = config or ModelConfig(name=self.name)
+        self.input_size = input_size
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
+        self.tensor_cache = tensor_cache
+        self._session: Any | None = None
+        self._input_name = "images"
+        self._fixed_batch = False
+        self._labels: list[str] = []
+        self._fallback = DummyDetector()
+        self._loaded = False
+
+    @property
+    def onnx_path(self) -> Path | None:
+        weights = self.config.weights_path
+        if not weights:
+            return None
+        return onnx_model_path(Path(weights), self.config.precision)
+
+    def load(self, *, device: str | None = None) -> None:
+        path = self.onnx_path
+        if _load_ort() is None or path is None or not path.exists():
+            logger.warning("ONNX 모델 또는 onnxruntime을 찾을 수 없어 DummyDetector로 대체합니다: %s", path)
+            self._fallback.load(device="cpu")
+            self._session = None
+            self._loaded = True
+            return
+
+        self._session = self._create_session(path)
+        model_input = self._session.get_inputs()[0]
+        self._input_name = model_input.name
+        shape = list(model_input.shape)
+        self._fixed_batch = isinstance(shape[0], int)
+        if isinstance(shape[-1], int):
+            self.input_size = shape[-1]
+        self._labels = _read_labels(self._session)
+        self._loaded = True
+
+    def _create_session(self, path: Path) -> Any:
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = self.intra_op_threads
+        options.inter_op_num_threads = self.inter_op_threads
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        return ort.InferenceSession(str(path), sess_options=options, providers=["CPUExecutionProvider"])
+
+    def detect(
+        self, image: ImageInput, *, confidence: float = DEFAULT_CONFIDENCE, iou: float = DEFAULT_IOU
+    ) -> list[BoundingBox]:
+        return self.detect_batch([image], confidence=confidence, iou=iou)[0]
+
+    def detect_batch(
+        self,
+        images: Sequence[ImageInput],
+        *,
+        confidence: float = DEFAULT_CONFIDENCE,
+        iou: float = DEFAULT_IOU,
+    ) -> list[list[BoundingBox]]:
+        if not self._loaded:
+            raise RuntimeError("모델이 로드되지 않았습니다. 먼저 load()를 호출하세요.")
+        if not images:
+            return []
+        if self._session is None:
+            return [self._fallback.detect(image, confidence=confidence, iou=iou) for image in images]
+
+        prepared = [self._prepare(image) for image in images]
+        tensors = np.stack([tensor for tensor, _ in prepared])
+        if self._fixed_batch:
+            outputs = np.concatenate(
+                [self._session.run(None, {self._input_name: tensors[i : i + 1]})[0] for i in range(len(tensors))]
+            )
+        else:
+            outputs = self._session.run(None, {self._input_name: tensors})[0]
+
+        return [
+            self._to_boxes(output, info, confidence=confidence, iou=iou)
+            for output, (_, info) in zip(outputs, prepared)
+        ]
+
+    def _prepare(self, image: ImageInput) -> tuple[np.ndarray, LetterboxInfo]:
+        if self.tensor_cache is not None:
+            return self.tensor_cache.prepare(image, self.input_size)
+        return letterbox(to_rgb_array(image), self.input_size)
+
+    def classify(self, image: ImageInput, top_k: int = 3):  # pragma: no cover - 탐지 전용
+        return self._fallback.classify(image, top_k=top_k)
+
+    def _to_boxes(self, output: np.ndarray, info, *, confidence: float, iou: float) -> list[BoundingBox]:
+        boxes, scores, classes = decode_yolo_output(output, info, confidence=confidence, iou=iou)
+        labels = self._labels
+        return [
+            BoundingBox(
+                x=float(box[0]),
+                y=float(box[1]),
+                width=float(box[2]),
+                height=float(box[3]),
+                score=float(score),
+                label=labels[cls] if 0 <= cls < len(labels) else str(cls),
+            )
+            for box, score, cls in zip(boxes.tolist(), scores.tolist(), classes.tolist())
+        ]
+
+
+def onnx_model_path(weights: Path, precision: str = "fp32") -> Path:
+    """가중치 경로와 정밀도에 대응하는 ONNX 모델 경로."""
+
+    suffix = ".onnx" if precision == "fp32" else f".{precision}.onnx"
+    return weights.with_suffix(suffix)
+
+
+def _read_labels(session: Any) -> list[str]:
+    """Ultralytics export 메타데이터(`names`)에서 라벨 목록을 읽는다."""
+
+    try:
+        names = session.get_modelmeta().custom_metadata_map.get("names")
+        parsed = ast.literal_eval(names) if names else {}
+    except Exception:  # pragma: no cover - 메타데이터 형식이 다를 때
+        return []
+    if isinstance(parsed, dict):
+        return [str(parsed[key]) for key in sorted(parsed)]
+    return [str(item) for item in parsed]
@@ -4,31 +4,63 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
-try:
-    from ultralytics import YOLO
-except ImportError:  # pragma: no cover - 옵셔널 의존성
-    YOLO = None  # type: ignore[assignment]
+import numpy as np
 
 from ...schemas import BoundingBox
-from .base import ModelConfig, ModelWrapper
+from .base import DEFAULT_CONFIDENCE, DEFAULT_IOU, ModelConfig, ModelWrapper
 from .device import choose_device
 from .dummy import DummyDetector
+from .image import ImageInput, to_rgb_array
+from .postprocess import merge_tiled_detections, tile_grid
 
 logger = logging.getLogger(__name__)
 
+# ultralytics(및 torch) 임포트는 수 초가 걸리므로 첫 load() 시점까지 미룬다.
+_UNSET: Any = object()
+YOLO: Any = _UNSET
+
+
+def _load_yolo() -> Any:
+    """`ultralytics.YOLO`를 지연 임포트. 미설치 환경에서는 None."""
+
+    global YOLO
+    if YOLO is _UNSET:
+        try:
+            from ultralytics import YOLO as module
+        except ImportError:  # pragma: no cover - 옵셔널 의존성
+            module = None
+        YOLO = module
+    return YOLO
+
 
 class UltralyticsDetector(ModelWrapper):
     """Ultralytics YOLO 모델을 감싼 래퍼.
 
     Ultralytics가 설치되어 있지 않거나 가중치가 없을 경우 내부적으로 DummyDetector로 폴백한다.
+
+    `tile_size`를 지정하면 그보다 큰 이미지를 겹치는 타일로 나눠 전체 이미지와 함께 한 번의
+    배치로 추론하고, 타일 경계의 중복 박스는 NMS로 합친다. 고해상도 사진에서 작은 병변의
+    재현율을 높이는 대신 타일 수만큼 지연 시간이 늘어난다.
     """
 
     name = "ultralytics-detector"
-
-    def __init__(self, config: ModelConfig | None = None) -> None:
+    # Ultralytics predictor는 내부 상태를 공유하므로 동시 호출을 직렬화해야 한다.
+    thread_safe = False
+
+    def __init__(
+        self,
+        config: ModelConfig | None = None,
+        *,
+        tile_size: int = 0,
+        tile_overlap: float = 0.2,
+        max_tiles: int = 16,
+    ) -> None:
         self.config = config or ModelConfig(name=self.name)
+        self.tile_size = tile_size
+        self.tile_overlap = tile_overlap
+        self.max_tiles = max_tiles
         self._model: Any | None = None
         self._labels: list[str] = []
         self._fallback = DummyDetector()
@@ -36,8 +68,9 @@ class UltralyticsDetector(ModelWrapper):
 
     def load(self, *, device: str | None = None) -> None:
         target_device = choose_device(device or self.config.device)
+        yolo = _load_yolo()
 
-        if YOLO is None:
+        if yolo is None:
             logger.warning("ultralytics 패키지를 찾을 수 없어 DummyDetector를 사용합니다.")
             self._fallback.load(device=target_device)
             self._model = None
@@ -52,8 +85,11 @@ class UltralyticsDetector(ModelWrapper):
             self._loaded = True
             return
 
+        if self.config.precision != "fp32":
+            logger.warning("PyTorch 백엔드는 %s 정밀도를 지원하지 않아 fp32로 실행합니다.", self.config.precision)
+
         try:
-            model = YOLO(str(weights))
+            model = yolo(str(weights))
             model.to(target_device)
             self._model = model
             self._labels = [str(v) for v in getattr(model, "names", {}).values()] if getattr(model, "names", None) else []
@@ -64,49 +100,136 @@ class UltralyticsDetector(ModelWrapper):
             self._model = None
             self._loaded = True
 
-    def detect(self, image_path: Path) -> list[BoundingBox]:
+    def detect(
+        self, image: ImageInput, *, confidence: float = DEFAULT_CONFIDENCE, iou: float = DEFAULT_IOU
+    ) -> list[BoundingBox]:
+        return self.detect_batch([image], confidence=confidence, iou=iou)[0]
+
+    def detect_batch(
+        self,
+        images: Sequence[ImageInput],
+        *,
+        confidence: float = DEFAULT_CONFIDENCE,
+        iou: float = DEFAULT_IOU,
+    ) -> list[list[BoundingBox]]:
+        """여러 이미지를 한 번의 `predict` 호출로 처리. 임계값은 모델 내부 NMS 단계에서 적용된다."""
+
         if not self._loaded:
             raise RuntimeError("모델이 로드되지 않았습니다. 먼저 load()를 호출하세요.")
 
+        if not images:
+            return []
+
+        thresholds = {"confidence": confidence, "iou": iou}
         if self._model is None:
-            return self._fallback.detect(image_path)
+            return [self._fallback.detect(image, **thresholds) for image in images]
+
+        if self.tile_size > 0:
+            return self._detect_tiled(images, confidence=confidence, iou=iou)
 
         try:
-            results = self._model.predict(source=str(image_path), verbose=False)
+            results = self._predict([_to_source(image) for image in images], confidence=confidence, iou=iou)
         except Exception as exc:  # pragma: no cover - 예외 시 폴백
             logger.exception("YOLO 예측 실패, DummyDetector 결과 사용: %s", exc)
-            return self._fallback.detect(image_path)
-
-        boxes: list[BoundingBox] = []
-        if not results:
-            return boxes
-
-        result = results[0]
-        yolo_boxes = getattr(result, "boxes", None)
-        if yolo_boxes is None:
-            return boxes
+            return [self._fallback.detect(image, **thresholds) for image in images]
+
+        outputs: list[list[BoundingBox]] = []
+        for index, image in enumerate(images):
+            result = results[index] if index < len(results) else None
+            try:
+                outputs.append(self._to_boxes(*_result_arrays(result)))
+            except Exception as exc:  # pragma: no cover - 변환 실패 시 폴백
+                logger.exception("YOLO 결과 파싱 실패, DummyDetector 결과 사용: %s", exc)
+                outputs.append(self._fallback.detect(image, **thresholds))
+        return outputs
+
+    def _predict(self, sources: list[Any], *, confidence: float, iou: float) -> list[Any]:
+        results = self._model.predict(source=sources, conf=confidence, iou=iou, verbose=False)
+        return list(results or [])
+
+    def _detect_tiled(
+        self, images: Sequence[ImageInput], *, confidence: float, iou: float
+    ) -> list[list[BoundingBox]]:
+        """모든 이미지의 전체 뷰와 타일을 한 번의 predict로 처리한 뒤 이미지별로 병합."""
+
+        sources: list[np.ndarray] = []
+        # 이미지별 (시작 인덱스, 타일 원점 목록). 첫 항목은 전체 이미지(원점 0, 0)
+        layout: list[tuple[int, list[tuple[int, int]]]] = []
+        for image in images:
+            pixels = to_rgb_array(image)
+            height, width = pixels.shape[:2]
+            tiles = tile_grid(
+                width, height, self.tile_size, overlap=self.tile_overlap, max_tiles=self.max_tiles
+            )
+            layout.append((len(sources), [(0, 0)] + [(x0, y0) for x0, y0, _, _ in tiles]))
+            sources.append(_to_source(pixels))
+            sources.extend(_to_source(pixels[y0:y1, x0:x1]) for x0, y0, x1, y1 in tiles)
 
         try:
-            for box in yolo_boxes:
-                xywh = box.xywh[0].tolist()
-                cls_idx = int(box.cls[0].item()) if getattr(box, "cls", None) is not None else 0
-                score = float(box.conf[0].item()) if getattr(box, "conf", None) is not None else 0.0
-                label = self._labels[cls_idx] if self._labels and 0 <= cls_idx < len(self._labels) else str(cls_idx)
-                boxes.append(
-                    BoundingBox(
-                        x=xywh[0],
-                        y=xywh[1],
-                        width=xywh[2],
-                        height=xywh[3],
-                        score=score,
-                        label=label,
-                    )
-                )
-        except Exception as exc:  # pragma: no cover - 변환 실패 시 폴백
-            logger.exception("YOLO 결과 파싱 실패, DummyDetector 결과 사용: %s", exc)
-            return self._fallback.detect(image_path)
-
-        return boxes
-
-    def classify(self, image_path: Path, top_k: int = 3):  # pragma: no cover - 탐지 전용
-        return self._fallback.classify(image_path, top_k=top_k)
+            results = self._predict(sources, confidence=confidence, iou=iou)
+        except Exception as exc:  # pragma: no cover - 예외 시 폴백
+            logger.exception("YOLO 타일 예측 실패, DummyDetector 결과 사용: %s", exc)
+            return [self._fallback.detect(image, confidence=confidence, iou=iou) for image in images]
+
+        outputs: list[list[BoundingBox]] = []
+        for start, origins in layout:
+            parts = [
+                _result_arrays(results[start + i] if start + i < len(results) else None)
+                for i in range(len(origins))
+            ]
+            boxes, scores, classes = (np.concatenate(column) for column in zip(*parts))
+            counts = [len(part[0]) for part in parts]
+            offsets = np.repeat(np.asarray(origins, dtype=np.float64), counts, axis=0)
+            outputs.append(self._to_boxes(*merge_tiled_detections(boxes, scores, classes, offsets, iou)))
+        return outputs
+
+    def _to_boxes(self, xywh: np.ndarray, scores: np.ndarray, classes: np.ndarray) -> list[BoundingBox]:
+        labels = self._labels
+        return [
+            BoundingBox(
+                x=x,
+                y=y,
+                width=w,
+                height=h,
+                score=score,
+                label=labels[cls_idx] if 0 <= cls_idx < len(labels) else str(cls_idx),
+            )
+            for (x, y, w, h), score, cls_idx in zip(xywh.tolist(), scores.tolist(), classes.tolist())
+        ]
+
+    def classify(self, image: ImageInput, top_k: int = 3):  # pragma: no cover - 탐지 전용
+        return self._fallback.classify(image, top_k=top_k)
+
+
+def _result_arrays(result: Any) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """YOLO 결과의 박스 텐서 전체를 한 번에 NumPy (중심 xywh, 점수, 클래스)로 변환."""
+
+    yolo_boxes = getattr(result, "boxes", None) if result is not None else None
+    if yolo_boxes is None or len(yolo_boxes) == 0:
+        return np.empty((0, 4)), np.empty((0,)), np.empty((0,), dtype=np.int64)
+
+    xywh = _to_numpy(yolo_boxes.xywh).reshape(-1, 4)
+    count = len(xywh)
+    conf = getattr(yolo_boxes, "conf", None)
+    cls = getattr(yolo_boxes, "cls", None)
+    scores = _to_numpy(conf).reshape(-1) if conf is not None else np.zeros(count)
+    classes = (
+        _to_numpy(cls).reshape(-1).astype(np.int64) if cls is not None else np.zeros(count, dtype=np.int64)
+    )
+    return xywh, scores, classes
+
+
+def _to_source(image: ImageInput) -> Any:
+    """Ultralytics `predict` 입력으로 변환. 배열은 RGB -> BGR로 뒤집어 전달한다."""
+
+    if isinstance(image, np.ndarray):
+        return np.ascontiguousarray(image[..., ::-1])
+    return str(image)
+
+
+def _to_numpy(values: Any) -> np.ndarray:
+    """torch 텐서(디바이스 무관) 또는 배열을 NumPy 배열로 변환."""
+
+    if hasattr(values, "detach"):
+        values = values.detach().cpu().numpy()
+    return np.asarray(values)
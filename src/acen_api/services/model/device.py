@@ -1,28 +1,194 @@
-"""디바이스 선택 유틸."""
+"""디바이스 선택과 CPU 실행 계획 유틸."""
 
 from __future__ import annotations
 
-from typing import Literal
+import logging
+import os
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Literal
 
-try:
-    import torch
-except ImportError:  # pragma: no cover - torch 미설치 환경
-    torch = None  # type: ignore[assignment]
+logger = logging.getLogger(__name__)
+
+# torch는 임포트에 수 초가 걸리므로 실제로 디바이스를 판별할 때 처음 임포트한다.
+_UNSET: Any = object()
+torch: Any = _UNSET
 
 AvailableDevice = Literal["cpu", "cuda"]
 
+# OpenMP/BLAS 계열 라이브러리가 임포트 시점에 읽는 스레드 수 환경 변수
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+
+def _load_torch() -> Any:
+    """torch 모듈을 지연 임포트. 미설치 환경에서는 None."""
+
+    global torch
+    if torch is _UNSET:
+        try:
+            import torch as module
+        except ImportError:  # pragma: no cover - torch 미설치 환경
+            module = None
+        torch = module
+        if module is not None and _active_plan is not None:
+            _apply_torch_threads(module, _active_plan)
+    return torch
+
 
 def choose_device(preferred: str | None = None) -> AvailableDevice:
     """환경에 맞는 실행 디바이스 선택."""
 
     if preferred:
         preferred = preferred.lower()
-        if preferred == "cuda" and torch and torch.cuda.is_available():
-            return "cuda"
         if preferred == "cpu":
             return "cpu"
+        if preferred == "cuda" and _cuda_available():
+            return "cuda"
 
-    if torch and torch.cuda.is_available():
+    if _cuda_available():
         return "cuda"
 
     return "cpu"
+
+
+def _cuda_available() -> bool:
+    module = _load_torch()
+    return bool(module and module.cuda.is_available())
+
+
+@dataclass(slots=True)
+class CpuPlan:
+    """워커 프로세스 하나의 CPU 사용 계획."""
+
+    available_cores: int
+    workers: int
+    worker_index: int
+    intra_op_threads: int
+    inter_op_threads: int
+    cores: list[int] | None = None
+    applied: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+_active_plan: CpuPlan | None = None
+
+
+def plan_cpu(
+    *,
+    workers: int = 1,
+    worker_index: int = 0,
+    threads: int = 0,
+    inter_op_threads: int = 1,
+    pin: bool = False,
+) -> CpuPlan:
+    """노드의 사용 가능한 코어를 워커 수로 나눠 워커별 스레드 수와 코어 집합을 정한다.
+
+    `threads`가 0이면 `OMP_NUM_THREADS`가 지정된 경우 그 값을, 아니면 워커당 코어 수를 쓴다.
+    `pin=True`면 워커 순번에 해당하는 연속 코어 구간을 할당한다.
+    """
+
+    available = _available_cores()
+    workers = max(1, workers)
+    per_worker = max(1, len(available) // workers)
+    intra = threads or _env_threads() or per_worker
+    cores = None
+    if pin:
+        start = (worker_index * per_worker) % len(available)
+        cores = available[start : start + per_worker]
+    return CpuPlan(
+        available_cores=len(available),
+        workers=workers,
+        worker_index=worker_index,
+        intra_op_threads=intra,
+        inter_op_threads=max(1, inter_op_threads),
+        cores=cores,
+    )
+
+
+def apply_cpu_plan(plan: CpuPlan) -> CpuPlan:
+    """계획을 현재 프로세스에 적용하고 전역 계획으로 등록.
+
+    ML 라이브러리를 임포트하기 전(앱 기동 직후)에 호출해야 환경 변수가 반영된다. 코어 고정은
+    호출한 스레드와 이후 생성되는 스레드(추론 실행기, 배처, OpenMP 풀)에 상속된다.
+    """
+
+    global _active_plan
+    for name in _THREAD_ENV_VARS:
+        os.environ[name] = str(plan.intra_op_threads)
+    plan.applied = ["env"]
+
+    if plan.cores and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, plan.cores)
+            plan.applied.append("affinity")
+        except OSError as exc:  # pragma: no cover - 컨테이너 cpuset 밖의 코어
+            logger.warning("CPU 코어 고정 실패: %s", exc)
+
+    module = sys.modules.get("torch")
+    if module is not None:
+        _apply_torch_threads(module, plan)
+    _active_plan = plan
+    logger.info("CPU 실행 계획 적용: %s", plan.to_dict())
+    return plan
+
+
+def current_cpu_plan() -> CpuPlan | None:
+    """적용된 CPU 실행 계획. 적용 전이면 None."""
+
+    return _active_plan
+
+
+def claim_worker_slot(workers: int, lock_dir: Path | str) -> int:
+    """같은 노드의 워커 프로세스끼리 파일 잠금으로 0..workers-1 순번을 나눠 갖는다.
+
+    잠금은 프로세스가 종료될 때 함께 풀리므로 재시작한 워커가 빈 순번을 다시 가져간다.
+    모든 순번이 사용 중이거나 잠금을 지원하지 않으면 0을 반환한다.
+    """
+
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - Windows
+        return 0
+
+    directory = Path(lock_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    for index in range(max(1, workers)):
+        handle = open(directory / f"cpu-slot-{index}.lock", "w")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            continue
+        # 프로세스가 살아 있는 동안 잠금을 유지하기 위해 핸들을 보관한다.
+        _slot_handles.append(handle)
+        return index
+    return 0
+
+
+_slot_handles: list[Any] = []
+
+
+def _apply_torch_threads(module: Any, plan: CpuPlan) -> None:
+    module.set_num_threads(plan.intra_op_threads)
+    try:
+        module.set_num_interop_threads(plan.inter_op_threads)
+    except RuntimeError:  # 이미 병렬 작업이 실행된 뒤에는 변경 불가
+        logger.debug("torch inter-op 스레드 수는 이미 고정되어 변경하지 않습니다.")
+    if "torch" not in plan.applied:
+        plan.applied.append("torch")
+
+
+def _available_cores() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _env_threads() -> int:
+    try:
+        return max(0, int(os.environ.get("OMP_NUM_THREADS", "0")))
+    except ValueError:
+        return 0
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
-from PIL import Image
-
 from ...schemas import BoundingBox, ClassificationResult
-from .base import ModelConfig, ModelWrapper
+from .base import DEFAULT_CONFIDENCE, DEFAULT_IOU, ModelConfig, ModelWrapper
+from .image import ImageInput, image_size
+
+_DUMMY_SCORE = 0.5
 
 
 class DummyDetector(ModelWrapper):
@@ -22,14 +21,25 @@ class DummyDetector(ModelWrapper):
     def load(self, *, device: str | None = None) -> None:
         self.loaded = True
 
-    def detect(self, image_path: Path) -> list[BoundingBox]:
+    def detect(
+        self, image: ImageInput, *, confidence: float = DEFAULT_CONFIDENCE, iou: float = DEFAULT_IOU
+    ) -> list[BoundingBox]:
         self._ensure_loaded()
-        width, height = _read_image_size(image_path)
+        if confidence > _DUMMY_SCORE:
+            return []
+        width, height = image_size(image)
         return [
-            BoundingBox(x=0.1 * width, y=0.1 * height, width=0.5 * width, height=0.5 * height, score=0.5, label="acne")
+            BoundingBox(
+                x=0.1 * width,
+                y=0.1 * height,
+                width=0.5 * width,
+                height=0.5 * height,
+                score=_DUMMY_SCORE,
+                label="acne",
+            )
         ]
 
-    def classify(self, image_path: Path, top_k: int = 3) -> list[ClassificationResult]:
+    def classify(self, image: ImageInput, top_k: int = 3) -> list[ClassificationResult]:
         self._ensure_loaded()
         return [ClassificationResult(label="acne", score=0.6), ClassificationResult(label="clear", score=0.4)][:top_k]
 
@@ -43,10 +53,5 @@ class DummyClassifier(DummyDetector):
 
     name = "dummy-classifier"
 
-    def detect(self, image_path: Path) -> list[BoundingBox]:  # pragma: no cover - 분류 전용에서 사용 안함
+    def detect(self, image: ImageInput, **_thresholds: float) -> list[BoundingBox]:  # pragma: no cover - 분류 전용
         return []
-
-
-def _read_image_size(path: Path) -> tuple[int, int]:
-    with Image.open(path) as img:
-        return img.size
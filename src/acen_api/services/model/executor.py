@@ -0,0 +1,89 @@
+"""추론 전용 실행기와 승인 제어."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+R = TypeVar("R")
+
+
+class ExecutorSaturated(Exception):
+    """실행기 대기열이 가득 차 요청을 받을 수 없을 때 발생하는 예외."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("추론 대기열이 가득 찼습니다.")
+        self.retry_after = retry_after
+
+
+class InferenceExecutor:
+    """DB 라우트와 분리된 추론 전용 스레드 풀.
+
+    실행 중(`max_workers`) + 대기(`queue_size`) 작업 수를 세마포어로 제한하고,
+    한도를 넘는 요청은 대기열에 쌓지 않고 즉시 `ExecutorSaturated`로 거절한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 4,
+        queue_size: int = 16,
+        retry_after_seconds: int = 1,
+        name: str = "inference",
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers는 1 이상이어야 합니다.")
+        self.max_workers = max_workers
+        self.queue_size = max(0, queue_size)
+        self.retry_after_seconds = retry_after_seconds
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._slots = threading.BoundedSemaphore(max_workers + self.queue_size)
+        self._lock = threading.Lock()
+        self._inflight = 0
+        self._submitted = 0
+        self._rejected = 0
+
+    def submit(self, fn: Callable[..., R], /, *args: Any, **kwargs: Any) -> "Future[R]":
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise ExecutorSaturated(self.retry_after_seconds)
+
+        try:
+            future = self._pool.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._inflight += 1
+            self._submitted += 1
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, fn: Callable[..., R], /, *args: Any, **kwargs: Any) -> R:
+        """이벤트 루프를 막지 않고 작업 완료를 대기."""
+
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            inflight = self._inflight
+            return {
+                "workers": self.max_workers,
+                "queue_size": self.queue_size,
+                "inflight": inflight,
+                "queued": max(0, inflight - self.max_workers),
+                "submitted": self._submitted,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._inflight -= 1
+        self._slots.release()
@@ -0,0 +1,37 @@
+"""모델 입력 이미지 변환 유틸."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+from PIL import Image
+
+# 파일 경로 또는 이미 디코딩된 RGB(H, W, 3) uint8 배열
+ImageInput = Union[Path, str, np.ndarray]
+
+
+def to_rgb_array(image: ImageInput) -> np.ndarray:
+    """입력을 RGB uint8 배열로 변환. 배열 입력은 복사하지 않고 그대로 반환."""
+
+    if isinstance(image, np.ndarray):
+        return image
+    with Image.open(image) as img:
+        return np.asarray(img.convert("RGB"))
+
+
+def synthetic_image(size: int | tuple[int, int], *, fill: int = 114) -> np.ndarray:
+    """워밍업용 단색 RGB 배열. `size`는 한 변 길이 또는 (width, height)."""
+
+    width, height = (size, size) if isinstance(size, int) else size
+    return np.full((height, width, 3), fill, dtype=np.uint8)
+
+
+def image_size(image: ImageInput) -> tuple[int, int]:
+    """(width, height) 반환. 경로 입력은 헤더만 읽는다."""
+
+    if isinstance(image, np.ndarray):
+        return int(image.shape[1]), int(image.shape[0])
+    with Image.open(image) as img:
+        return img.size
@@ -0,0 +1,220 @@
+"""YOLO 계열 모델의 전처리/후처리 유틸 (NumPy 벡터화)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import numpy as np
+from PIL import Image
+
+from ...schemas import BoundingBox
+
+
+@dataclass(slots=True)
+class LetterboxInfo:
+    """레터박스 변환 정보. 모델 좌표를 원본 좌표로 되돌릴 때 사용."""
+
+    ratio: float
+    pad_x: float
+    pad_y: float
+    width: int
+    height: int
+
+
+def letterbox(image: np.ndarray, size: int, *, fill: int = 114) -> tuple[np.ndarray, LetterboxInfo]:
+    """RGB(H, W, 3) 배열을 비율 유지 리사이즈 + 패딩하여 (3, size, size) float32 텐서로 변환."""
+
+    height, width = image.shape[:2]
+    ratio = min(size / height, size / width)
+    new_w, new_h = max(1, round(width * ratio)), max(1, round(height * ratio))
+    resized = image
+    if (new_w, new_h) != (width, height):
+        resized = np.asarray(Image.fromarray(image).resize((new_w, new_h), Image.BILINEAR))
+
+    pad_x = (size - new_w) / 2
+    pad_y = (size - new_h) / 2
+    left, top = int(round(pad_x - 0.1)), int(round(pad_y - 0.1))
+    canvas = np.full((size, size, 3), fill, dtype=np.uint8)
+    canvas[top : top + new_h, left : left + new_w] = resized
+
+    tensor = canvas.transpose(2, 0, 1).astype(np.float32) / 255.0
+    return tensor, LetterboxInfo(ratio=ratio, pad_x=left, pad_y=top, width=width, height=height)
+
+
+def nms(boxes_xyxy: np.ndarray, scores: np.ndarray, iou_threshold: float) -> np.ndarray:
+    """점수 내림차순 greedy NMS. 유지할 인덱스 배열을 반환."""
+
+    if boxes_xyxy.size == 0:
+        return np.empty((0,), dtype=np.int64)
+
+    x1, y1, x2, y2 = boxes_xyxy.T
+    areas = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    order = np.argsort(-scores, kind="stable")
+    keep: list[int] = []
+    while order.size:
+        current = order[0]
+        keep.append(int(current))
+        rest = order[1:]
+        inter_w = np.clip(np.minimum(x2[current], x2[rest]) - np.maximum(x1[current], x1[rest]), 0, None)
+        inter_h = np.clip(np.minimum(y2[current], y2[rest]) - np.maximum(y1[current], y1[rest]), 0, None)
+        inter = inter_w * inter_h
+        union = areas[current] + areas[rest] - inter
+        iou = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+        order = rest[iou <= iou_threshold]
+    return np.asarray(keep, dtype=np.int64)
+
+
+def batched_nms(
+    boxes_xyxy: np.ndarray, scores: np.ndarray, classes: np.ndarray, iou_threshold: float
+) -> np.ndarray:
+    """클래스별 NMS. 클래스마다 좌표를 평행 이동시켜 한 번의 NMS로 처리."""
+
+    if boxes_xyxy.size == 0:
+        return np.empty((0,), dtype=np.int64)
+    # 이동 폭을 가장 큰 좌표보다 크게 잡아 다른 클래스 박스가 겹치지 않게 한다.
+    span = float(np.abs(boxes_xyxy).max()) + 1.0
+    offsets = classes.astype(np.float64)[:, None] * span
+    return nms(boxes_xyxy + offsets, scores, iou_threshold)
+
+
+def xywh_to_xyxy(boxes: np.ndarray) -> np.ndarray:
+    cx, cy, w, h = boxes.T
+    return np.stack([cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2], axis=1)
+
+
+def decode_yolo_output(
+    output: np.ndarray,
+    info: LetterboxInfo,
+    *,
+    confidence: float = 0.25,
+    iou: float = 0.45,
+    max_detections: int = 300,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """단일 이미지의 YOLO 헤드 출력(4 + 클래스 수, 앵커 수)을 원본 좌표 기준 결과로 변환.
+
+    반환값은 (중심 xywh 박스 (N, 4), 점수 (N,), 클래스 인덱스 (N,))이다.
+    """
+
+    predictions = output.T  # (앵커 수, 4 + 클래스 수)
+    class_scores = predictions[:, 4:]
+    if class_scores.shape[1] == 0:
+        empty = np.empty((0,), dtype=np.float32)
+        return np.empty((0, 4), dtype=np.float32), empty, empty.astype(np.int64)
+
+    classes = class_scores.argmax(axis=1)
+    scores = class_scores[np.arange(len(classes)), classes]
+    mask = scores >= confidence
+    boxes_xywh, scores, classes = predictions[mask, :4], scores[mask], classes[mask]
+
+    boxes_xyxy = xywh_to_xyxy(boxes_xywh)
+    keep = batched_nms(boxes_xyxy, scores, classes, iou)[:max_detections]
+    boxes_xyxy, scores, classes = boxes_xyxy[keep], scores[keep], classes[keep]
+
+    boxes_xyxy[:, [0, 2]] = ((boxes_xyxy[:, [0, 2]] - info.pad_x) / info.ratio).clip(0, info.width)
+    boxes_xyxy[:, [1, 3]] = ((boxes_xyxy[:, [1, 3]] - info.pad_y) / info.ratio).clip(0, info.height)
+    widths = boxes_xyxy[:, 2] - boxes_xyxy[:, 0]
+    heights = boxes_xyxy[:, 3] - boxes_xyxy[:, 1]
+    boxes = np.stack(
+        [boxes_xyxy[:, 0] + widths / 2, boxes_xyxy[:, 1] + heights / 2, widths, heights], axis=1
+    )
+    return boxes.astype(np.float32), scores.astype(np.float32), classes.astype(np.int64)
+
+
+def box_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """두 xyxy 박스 집합 사이의 IoU 행렬 (len(a), len(b))."""
+
+    top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bottom_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    inter = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    area_a = np.prod(np.clip(boxes_a[:, 2:] - boxes_a[:, :2], 0, None), axis=1)
+    area_b = np.prod(np.clip(boxes_b[:, 2:] - boxes_b[:, :2], 0, None), axis=1)
+    union = area_a[:, None] + area_b[None, :] - inter
+    return np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+
+
+def box_agreement(
+    reference: Sequence[BoundingBox], candidate: Sequence[BoundingBox], *, iou_threshold: float = 0.5
+) -> dict[str, Any]:
+    """기준 결과 대비 후보 결과의 일치도. 같은 라벨끼리 점수 순 greedy 매칭."""
+
+    matched: list[float] = []
+    if reference and candidate:
+        ref = xywh_to_xyxy(np.array([[b.x, b.y, b.width, b.height] for b in reference], dtype=np.float64))
+        cand = xywh_to_xyxy(np.array([[b.x, b.y, b.width, b.height] for b in candidate], dtype=np.float64))
+        ious = box_iou(cand, ref)
+        same_label = np.array([[c.label == r.label for r in reference] for c in candidate])
+        ious = np.where(same_label, ious, 0.0)
+        used = np.zeros(len(reference), dtype=bool)
+        for index in np.argsort([-box.score for box in candidate], kind="stable"):
+            row = np.where(used, 0.0, ious[index])
+            best = int(row.argmax())
+            if row[best] >= iou_threshold:
+                used[best] = True
+                matched.append(float(row[best]))
+
+    return {
+        "reference": len(reference),
+        "candidate": len(candidate),
+        "matched": len(matched),
+        "recall": len(matched) / len(reference) if reference else 1.0,
+        "precision": len(matched) / len(candidate) if candidate else 1.0,
+        "mean_iou": float(np.mean(matched)) if matched else None,
+    }
+
+
+def tile_grid(
+    width: int, height: int, tile_size: int, *, overlap: float = 0.2, max_tiles: int = 16
+) -> list[tuple[int, int, int, int]]:
+    """이미지를 겹치는 정사각 타일로 나눈 (x0, y0, x1, y1) 목록.
+
+    타일 수가 `max_tiles`를 넘으면 타일 크기를 키워 개수를 맞춘다. 이미지가 타일보다
+    작으면 빈 목록을 반환한다.
+    """
+
+    if tile_size <= 0 or (width <= tile_size and height <= tile_size):
+        return []
+
+    overlap = min(max(overlap, 0.0), 0.9)
+    size = tile_size
+    while True:
+        stride = max(1, int(size * (1 - overlap)))
+        cols = _tile_starts(width, size, stride)
+        rows = _tile_starts(height, size, stride)
+        if len(cols) * len(rows) <= max(1, max_tiles) or size >= max(width, height):
+            break
+        size = int(size * 1.25) + 1
+
+    return [
+        (x0, y0, min(width, x0 + size), min(height, y0 + size))
+        for y0 in rows
+        for x0 in cols
+    ]
+
+
+def _tile_starts(length: int, size: int, stride: int) -> list[int]:
+    if length <= size:
+        return [0]
+    count = int(np.ceil((length - size) / stride)) + 1
+    return np.linspace(0, length - size, count).round().astype(int).tolist()
+
+
+def merge_tiled_detections(
+    boxes_xywh: np.ndarray,
+    scores: np.ndarray,
+    classes: np.ndarray,
+    offsets: np.ndarray,
+    iou: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """타일 좌표계의 탐지 결과를 원본 좌표로 옮긴 뒤 클래스별 NMS로 중복을 제거.
+
+    `offsets`는 박스마다 해당 타일의 (x0, y0). 반환값은 (중심 xywh, 점수, 클래스).
+    """
+
+    if len(boxes_xywh) == 0:
+        return boxes_xywh.reshape(0, 4), scores, classes
+
+    shifted = boxes_xywh.astype(np.float64, copy=True)
+    shifted[:, :2] += offsets
+    keep = batched_nms(xywh_to_xyxy(shifted), scores, classes, iou)
+    return shifted[keep], scores[keep], classes[keep]
@@ -0,0 +1,403 @@
+"""프로세스 전역 모델 레지스트리."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Hashable, Sequence
+
+from ...schemas import BoundingBox, ClassificationResult
+from .base import ModelConfig, ModelWrapper
+from .image import ImageInput
+
+logger = logging.getLogger(__name__)
+
+ModelFactory = Callable[[ModelConfig], ModelWrapper]
+
+
+class SynchronizedModel(ModelWrapper):
+    """스레드 안전하지 않은 모델 호출을 락으로 직렬화하는 프록시."""
+
+    def __init__(self, model: ModelWrapper) -> None:
+        self.wrapped = model
+        self.name = model.name
+        self._lock = threading.Lock()
+
+    def load(self, *, device: str | None = None) -> None:
+        with self._lock:
+            self.wrapped.load(device=device)
+
+    def detect(self, image: ImageInput, **thresholds: float) -> list[BoundingBox]:
+        with self._lock:
+            return self.wrapped.detect(image, **thresholds)
+
+    def classify(self, image: ImageInput, top_k: int = 3) -> list[ClassificationResult]:
+        with self._lock:
+            return self.wrapped.classify(image, top_k=top_k)
+
+    def detect_batch(self, images: Sequence[ImageInput], **thresholds: float) -> list[list[BoundingBox]]:
+        with self._lock:
+            return self.wrapped.detect_batch(images, **thresholds)
+
+    def classify_batch(
+        self, images: Sequence[ImageInput], top_k: int = 3
+    ) -> list[list[ClassificationResult]]:
+        with self._lock:
+            return self.wrapped.classify_batch(images, top_k=top_k)
+
+
+@dataclass(slots=True)
+class ModelEntry:
+    """레지스트리에 보관되는 모델과 로딩 메타데이터."""
+
+    factory: ModelFactory
+    config: ModelConfig
+    model: ModelWrapper | None = None
+    load_seconds: float | None = None
+    memory_bytes: int | None = None
+    loaded_at: float | None = None
+    warmup_seconds: float | None = None
+    error: str | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def ready(self) -> bool:
+        return self.model is not None
+
+    @property
+    def warmed(self) -> bool:
+        return self.warmup_seconds is not None
+
+
+class ModelRegistry:
+    """로드된 모델을 역할(role) 이름으로 공유하는 레지스트리.
+
+    동일한 팩토리/`ModelConfig` 조합은 하나의 인스턴스만 로드하며,
+    로딩은 항목별 락으로 보호되어 여러 워커 스레드가 동시에 요청해도 한 번만 수행된다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, ModelEntry] = {}
+        self._roles: dict[str, Hashable] = {}
+        self._swapping: set[str] = set()
+        self._retiring: list[tuple[threading.Timer, ModelWrapper]] = []
+
+    def register(self, role: str, factory: ModelFactory, config: ModelConfig) -> None:
+        """역할 이름에 모델 팩토리와 설정을 연결."""
+
+        key = _entry_key(factory, config)
+        with self._lock:
+            self._entries.setdefault(key, ModelEntry(factory=factory, config=config))
+            self._roles[role] = key
+
+    def roles(self) -> list[str]:
+        with self._lock:
+            return list(self._roles)
+
+    def config(self, role: str) -> ModelConfig:
+        """역할에 연결된 모델 설정."""
+
+        return self._entry(role).config
+
+    def get(self, role: str) -> ModelWrapper:
+        """역할에 해당하는 모델을 반환. 아직 로드되지 않았다면 이 시점에 로드한다."""
+
+        entry = self._entry(role)
+        if entry.model is not None:
+            return entry.model
+        return self._load_entry(entry)
+
+    def load(self, role: str) -> ModelEntry:
+        """역할에 해당하는 모델을 미리 로드하고 메타데이터를 반환."""
+
+        entry = self._entry(role)
+        if entry.model is None:
+            self._load_entry(entry)
+        return entry
+
+    def load_all(self) -> None:
+        """등록된 모든 역할의 모델을 로드. 개별 실패는 상태에 기록하고 계속 진행."""
+
+        for role in self.roles():
+            try:
+                self.load(role)
+            except Exception:  # pragma: no cover - 로딩 실패는 status()로 노출
+                logger.exception("모델 사전 로딩 실패: %s", role)
+
+    def warm_up(self, role: str, run: Callable[[ModelWrapper], Any]) -> ModelEntry:
+        """모델을 로드한 뒤 `run(model)`으로 합성 입력을 흘려 첫 호출 비용을 미리 치른다."""
+
+        entry = self.load(role)
+        if entry.warmed:
+            return entry
+        started = time.perf_counter()
+        try:
+            run(self.get(role))
+        except Exception as exc:
+            entry.error = f"warm-up failed: {exc}"
+            raise
+        entry.warmup_seconds = time.perf_counter() - started
+        logger.info("모델 워밍업 완료: %s (%.3fs)", entry.config.name, entry.warmup_seconds)
+        return entry
+
+    def swap(
+        self,
+        role: str,
+        weights_path: Path | str | None = None,
+        *,
+        warm_up: Callable[[ModelWrapper], Any] | None = None,
+        drain_seconds: float = 30.0,
+    ) -> ModelEntry:
+        """새 가중치로 모델을 로드/워밍업한 뒤 역할이 가리키는 항목을 원자적으로 교체.
+
+        로드와 워밍업 동안에는 기존 모델이 계속 요청을 처리하고, 실패하면 기존 모델이 유지된다.
+        `weights_path`를 생략하면 같은 경로의 파일을 다시 읽는다(파일을 덮어쓴 배포).
+        이전 모델은 이미 받은 요청이 끝나도록 `drain_seconds` 후에 해제한다.
+        """
+
+        current = self._entry(role)
+        path = Path(weights_path) if weights_path else current.config.weights_path
+        entry = ModelEntry(factory=current.factory, config=replace(current.config, weights_path=path))
+        model = self._load_entry(entry)
+        if warm_up is not None:
+            started = time.perf_counter()
+            warm_up(model)
+            entry.warmup_seconds = time.perf_counter() - started
+
+        key = _entry_key(entry.factory, entry.config)
+        with self._lock:
+            old_key = self._roles[role]
+            old = self._entries[old_key]
+            self._entries[key] = entry
+            self._roles[role] = key
+            if old_key != key and old_key not in self._roles.values():
+                del self._entries[old_key]
+            shared = old_key != key and old_key in self._roles.values()
+        logger.info("모델 교체 완료: %s -> %s", role, path)
+
+        if not shared and old.model is not None:
+            self._retire(old.model, drain_seconds)
+            old.model = None
+        return entry
+
+    def start_swap(self, role: str, weights_path: Path | str | None = None, **options: Any) -> bool:
+        """백그라운드 스레드에서 `swap()` 실행. 같은 역할의 교체가 진행 중이면 False."""
+
+        self._entry(role)
+        with self._lock:
+            if role in self._swapping:
+                return False
+            self._swapping.add(role)
+
+        def run() -> None:
+            try:
+                self.swap(role, weights_path, **options)
+            except Exception:
+                logger.exception("모델 교체 실패, 기존 모델 유지: %s", role)
+            finally:
+                with self._lock:
+                    self._swapping.discard(role)
+
+        threading.Thread(target=run, name=f"model-swap-{role}", daemon=True).start()
+        return True
+
+    def swapping(self, role: str) -> bool:
+        with self._lock:
+            return role in self._swapping
+
+    def status(self) -> list[dict[str, Any]]:
+        """역할별 로딩 상태/소요 시간/메모리 사용량 요약."""
+
+        with self._lock:
+            roles = list(self._roles.items())
+            entries = dict(self._entries)
+            swapping = set(self._swapping)
+
+        summary: list[dict[str, Any]] = []
+        for role, key in roles:
+            entry = entries[key]
+            failure = _model_failure(entry.model)
+            summary.append(
+                {
+                    "role": role,
+                    "name": entry.config.name,
+                    "weights_path": str(entry.config.weights_path) if entry.config.weights_path else None,
+                    "ready": entry.ready and failure is None,
+                    "swapping": role in swapping,
+                    "load_seconds": entry.load_seconds,
+                    "memory_bytes": entry.memory_bytes,
+                    "warmed": entry.warmed,
+                    "warmup_seconds": entry.warmup_seconds,
+                    "error": entry.error or failure,
+                }
+            )
+        return summary
+
+    def ready(self, *, warmed: bool = False) -> bool:
+        """모든 역할의 모델이 로드되었는지(`warmed=True`면 워밍업까지 끝났는지) 여부."""
+
+        with self._lock:
+            entries = [self._entries[key] for key in self._roles.values()]
+        return all(
+            entry.ready and _model_failure(entry.model) is None and (entry.warmed or not warmed)
+            for entry in entries
+        )
+
+    def close(self) -> None:
+        """보관 중인 모델 참조를 해제."""
+
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._roles.clear()
+            retiring, self._retiring = self._retiring, []
+        for timer, model in retiring:
+            timer.cancel()
+            _release(model)
+        for entry in entries:
+            model, entry.model = entry.model, None
+            if model is not None:
+                _release(model)
+
+    def _retire(self, model: ModelWrapper, delay: float) -> None:
+        """교체된 모델을 `delay`초 뒤 해제. 그 사이 진행 중인 요청은 이전 모델로 끝난다."""
+
+        def release() -> None:
+            with self._lock:
+                self._retiring = [item for item in self._retiring if item[1] is not model]
+            _release(model)
+
+        timer = threading.Timer(delay, release)
+        timer.daemon = True
+        with self._lock:
+            self._retiring.append((timer, model))
+        timer.start()
+
+    def _entry(self, role: str) -> ModelEntry:
+        with self._lock:
+            key = self._roles.get(role)
+            if key is None:
+                raise KeyError(f"등록되지 않은 모델 역할입니다: {role}")
+            return self._entries[key]
+
+    def _load_entry(self, entry: ModelEntry) -> ModelWrapper:
+        with entry.lock:
+            if entry.model is not None:
+                return entry.model
+
+            rss_before = _current_rss_bytes()
+            started = time.perf_counter()
+            try:
+                model = entry.factory(entry.config)
+                model.load(device=entry.config.device)
+            except Exception as exc:
+                entry.error = str(exc)
+                raise
+            entry.load_seconds = time.perf_counter() - started
+            rss_after = _current_rss_bytes()
+            if rss_before is not None and rss_after is not None:
+                entry.memory_bytes = max(0, rss_after - rss_before)
+            entry.loaded_at = time.time()
+            entry.error = None
+            entry.model = model if getattr(model, "thread_safe", True) else SynchronizedModel(model)
+            logger.info("모델 로드 완료: %s (%.3fs)", entry.config.name, entry.load_seconds)
+            return entry.model
+
+
+class WeightsWatcher:
+    """역할이 가리키는 가중치 파일의 변경(mtime/크기)을 주기적으로 확인해 `start_swap()`을 호출.
+
+    `POST /model/reload`는 요청을 받은 프로세스에만 적용되므로, 여러 워커 프로세스로 실행할 때는
+    각 프로세스가 이 감시 스레드로 같은 경로의 파일 교체(원자적 이름 변경 권장)를 감지한다.
+    경로 자체가 바뀌면(다른 파일로 교체) 새 경로를 기준으로 다시 감시한다.
+    """
+
+    def __init__(
+        self, registry: ModelRegistry, role: str, *, interval: float = 5.0, **swap_options: Any
+    ) -> None:
+        self.registry = registry
+        self.role = role
+        self.interval = interval
+        self.swap_options = swap_options
+        self._seen = self._signature()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"weights-watcher-{role}", daemon=True)
+        self._thread.start()
+
+    def check(self) -> bool:
+        """변경이 감지되어 교체를 시작했으면 True."""
+
+        signature = self._signature()
+        if signature is None or signature == self._seen:
+            return False
+        if self._seen is not None and signature[0] == self._seen[0]:
+            if not self.registry.start_swap(self.role, signature[0], **self.swap_options):
+                # 다른 교체가 진행 중이면 다음 주기에 다시 확인한다.
+                return False
+            logger.info("가중치 파일 변경 감지, 모델 교체 시작: %s", signature[0])
+            self._seen = signature
+            return True
+        self._seen = signature
+        return False
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:  # pragma: no cover - 감시 스레드는 계속 실행
+                logger.exception("가중치 파일 감시 실패: %s", self.role)
+
+    def _signature(self) -> tuple[Path, int, int] | None:
+        path = self.registry.config(self.role).weights_path
+        if path is None:
+            return None
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return None
+        return Path(path), stat.st_mtime_ns, stat.st_size
+
+
+def _model_failure(model: ModelWrapper | None) -> str | None:
+    """로드 후 복구할 수 없게 된 모델(예: 재시작을 포기한 워커 풀)의 실패 사유."""
+
+    if isinstance(model, SynchronizedModel):
+        model = model.wrapped
+    return getattr(model, "failure", None)
+
+
+def _release(model: ModelWrapper) -> None:
+    """모델이 워커 프로세스 등 외부 자원을 가진 경우 정리."""
+
+    target = model.wrapped if isinstance(model, SynchronizedModel) else model
+    close = getattr(target, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception:  # pragma: no cover - 종료 중 오류는 기록만
+            logger.exception("모델 자원 해제 실패: %s", model.name)
+
+
+def _entry_key(factory: ModelFactory, config: ModelConfig) -> Hashable:
+    factory_name = getattr(factory, "__qualname__", repr(factory))
+    return (getattr(factory, "__module__", ""), factory_name, config.key())
+
+
+def _current_rss_bytes() -> int | None:
+    """현재 프로세스의 RSS(바이트). 측정 불가 시 None."""
+
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            resident_pages = int(handle.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
@@ -0,0 +1,211 @@
+"""후보 모델을 실제 트래픽 일부에 그림자로 실행해 기본 모델과 비교."""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import random
+import statistics
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from ...schemas import BoundingBox
+from .base import ModelConfig, ModelWrapper
+from .image import ImageInput
+from .postprocess import box_agreement
+
+logger = logging.getLogger(__name__)
+
+_STOP: Any = object()
+_MAX_LOAD_BACKOFF = 3600.0
+
+
+@dataclass(slots=True)
+class _ShadowTask:
+    image: ImageInput
+    primary: list[BoundingBox]
+    primary_ms: float
+    thresholds: dict[str, float]
+
+
+class ShadowEvaluator:
+    """샘플링한 탐지 요청을 후보 모델로 다시 실행하고 박스 일치도/지연 시간을 기록.
+
+    요청 경로에서는 `submit()`이 큐에 넣기만 하며(put_nowait), 큐가 가득 차면 작업을 버린다.
+    후보 모델은 전용 스레드 하나에서 첫 작업 시점에 로드되고, 해당 스레드는 가능하면 낮은
+    스케줄링 우선순위로 실행해 기본 추론과의 CPU 경합을 줄인다. 로드에 실패하면
+    `load_retry_seconds`부터 두 배씩 늘어나는 대기 시간 동안 재시도하지 않고 샘플을 건너뛴다.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[ModelConfig], ModelWrapper],
+        config: ModelConfig,
+        *,
+        sample_rate: float = 0.05,
+        queue_size: int = 32,
+        iou_threshold: float = 0.5,
+        window: int = 512,
+        load_retry_seconds: float = 60.0,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.factory = factory
+        self.config = config
+        self.sample_rate = sample_rate
+        self.iou_threshold = iou_threshold
+        self.load_retry_seconds = load_retry_seconds
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._model: ModelWrapper | None = None
+        self._recent: deque[dict[str, float]] = deque(maxlen=window)
+        self._sampled = 0
+        self._dropped = 0
+        self._evaluated = 0
+        self._errors = 0
+        self._skipped = 0
+        # 마지막 로드 실패 사유, 연속 실패 횟수, 다음 로드 시도 시각
+        self._load_error: str | None = None
+        self._load_failures = 0
+        self._retry_at = 0.0
+        self._thread = threading.Thread(target=self._worker, name="shadow-eval", daemon=True)
+        self._thread.start()
+
+    def submit(
+        self,
+        image: ImageInput,
+        primary: Sequence[BoundingBox],
+        primary_ms: float,
+        **thresholds: float,
+    ) -> bool:
+        """샘플링에 걸리면 비교 작업을 큐에 넣는다. 대기열이 가득 차면 버리고 False."""
+
+        if self.sample_rate <= 0 or self._rng.random() >= self.sample_rate:
+            return False
+        if self._backing_off():
+            with self._lock:
+                self._skipped += 1
+            return False
+        task = _ShadowTask(image, list(primary), primary_ms, thresholds)
+        try:
+            self._queue.put_nowait(task)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            return False
+        with self._lock:
+            self._sampled += 1
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            recent = list(self._recent)
+            summary: dict[str, Any] = {
+                "model": self.config.name,
+                "sample_rate": self.sample_rate,
+                "queued": self._queue.qsize(),
+                "sampled": self._sampled,
+                "dropped": self._dropped,
+                "evaluated": self._evaluated,
+                "errors": self._errors,
+                "skipped": self._skipped,
+                "load_failures": self._load_failures,
+                "load_error": self._load_error,
+            }
+        for key in ("recall", "precision", "primary_ms", "shadow_ms"):
+            values = [item[key] for item in recent]
+            summary[key] = round(statistics.fmean(values), 4) if values else None
+        ious = [item["mean_iou"] for item in recent if item["mean_iou"] is not None]
+        summary["mean_iou"] = round(statistics.fmean(ious), 4) if ious else None
+        return summary
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """대기 중인 작업을 버리고 스레드를 종료."""
+
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        model, self._model = self._model, None
+        close = getattr(model, "close", None)
+        if callable(close):
+            close()
+
+    def _worker(self) -> None:
+        _lower_thread_priority()
+        while (task := self._queue.get()) is not _STOP:
+            try:
+                self._evaluate(task)
+            except Exception:
+                logger.exception("그림자 모델 평가 실패: %s", self.config.name)
+                with self._lock:
+                    self._errors += 1
+
+    def _backing_off(self) -> bool:
+        return self._model is None and self._load_error is not None and time.monotonic() < self._retry_at
+
+    def _load(self) -> bool:
+        """후보 모델을 로드. 실패하면 사유를 기록하고 대기 시간이 지날 때까지 재시도하지 않는다."""
+
+        try:
+            model = self.factory(self.config)
+            model.load(device=self.config.device)
+        except Exception as exc:
+            with self._lock:
+                self._load_failures += 1
+                self._load_error = str(exc) or exc.__class__.__name__
+                delay = min(self.load_retry_seconds * 2 ** (self._load_failures - 1), _MAX_LOAD_BACKOFF)
+                self._retry_at = time.monotonic() + delay
+            logger.warning("그림자 모델 로드 실패: %s (%.0f초 후 재시도): %s", self.config.name, delay, exc)
+            return False
+        with self._lock:
+            self._model = model
+            self._load_error = None
+            self._load_failures = 0
+        logger.info("그림자 모델 로드 완료: %s", self.config.name)
+        return True
+
+    def _evaluate(self, task: _ShadowTask) -> None:
+        if self._model is None and (self._backing_off() or not self._load()):
+            with self._lock:
+                self._skipped += 1
+            return
+
+        started = time.perf_counter()
+        shadow = self._model.detect(task.image, **task.thresholds)
+        shadow_ms = (time.perf_counter() - started) * 1000
+        agreement = box_agreement(task.primary, shadow, iou_threshold=self.iou_threshold)
+        logger.debug(
+            "그림자 비교: recall=%.3f precision=%.3f primary=%.1fms shadow=%.1fms",
+            agreement["recall"],
+            agreement["precision"],
+            task.primary_ms,
+            shadow_ms,
+        )
+        with self._lock:
+            self._evaluated += 1
+            self._recent.append(
+                {
+                    "recall": agreement["recall"],
+                    "precision": agreement["precision"],
+                    "mean_iou": agreement["mean_iou"],
+                    "primary_ms": task.primary_ms,
+                    "shadow_ms": shadow_ms,
+                }
+            )
+
+
+def _lower_thread_priority() -> None:
+    """Linux에서는 스레드 단위 nice 값을 올려 기본 추론보다 늦게 스케줄되도록 한다."""
+
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 10)
+    except (AttributeError, OSError):  # pragma: no cover - 미지원 플랫폼
+        pass
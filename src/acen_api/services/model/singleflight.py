@@ -0,0 +1,43 @@
+"""동일한 동시 추론 요청을 하나로 합치는 single-flight."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+R = TypeVar("R")
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 비동기 호출을 한 번만 실행하고 결과를 공유.
+
+    계산은 별도 태스크로 실행되므로 먼저 호출한 요청이 취소(클라이언트 연결 종료 등)되어도
+    같은 결과를 기다리는 나머지 요청에는 영향이 없다. 완료된 키는 즉시 제거되어 결과를
+    보관하지 않는다(결과 재사용은 추론 캐시가 담당).
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._leaders = 0
+        self._shared = 0
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[R]]) -> R:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish(key, done))
+            self._leaders += 1
+        else:
+            self._shared += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, Any]:
+        return {"inflight": len(self._inflight), "leaders": self._leaders, "shared": self._shared}
+
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # 기다리던 요청이 모두 취소된 경우에도 "예외 미확인" 경고가 남지 않도록 소비한다.
+            task.exception()
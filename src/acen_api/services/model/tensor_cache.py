@@ -0,0 +1,86 @@
+"""전처리된 입력 텐서를 메모리 맵 `.npy`로 보관하는 디스크 캐시."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+
+from .cache import content_hash
+from .image import ImageInput, to_rgb_array
+from .postprocess import LetterboxInfo, letterbox
+
+logger = logging.getLogger(__name__)
+
+
+class TensorCache:
+    """이미지 내용 해시와 입력 크기로 레터박스 텐서를 캐시.
+
+    같은 이미지를 여러 모델/가중치로 다시 추론할 때(A/B 비교, 모델 갱신 후 재채점) 디코딩과
+    리사이즈를 반복하지 않도록 `(3, size, size)` float32 텐서를 `.npy`로 저장하고,
+    읽을 때는 `mmap_mode="r"`로 열어 복사 없이 페이지 캐시를 공유한다.
+    레터박스 정보는 같은 이름의 `.json` 파일에 둔다. 전처리 방식이 같은 래퍼끼리 공유할 수 있다.
+
+    워커 프로세스로 전달(pickle)될 수 있도록 잠금 없이 동작하며, 통계는 프로세스별 근사값이다.
+    """
+
+    def __init__(self, directory: Path | str) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, digest: str, input_size: int) -> tuple[np.ndarray, LetterboxInfo] | None:
+        tensor_path, info_path = self._paths(digest, input_size)
+        try:
+            info = LetterboxInfo(**json.loads(info_path.read_text(encoding="utf-8")))
+            tensor = np.load(tensor_path, mmap_mode="r")
+        except (OSError, ValueError, TypeError):
+            self._misses += 1
+            return None
+        self._hits += 1
+        return tensor, info
+
+    def put(self, digest: str, input_size: int, tensor: np.ndarray, info: LetterboxInfo) -> None:
+        tensor_path, info_path = self._paths(digest, input_size)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            tensor_path.parent.mkdir(parents=True, exist_ok=True)
+            # 정보 파일을 먼저 기록해 텐서 파일이 보이면 항상 정보도 읽을 수 있게 한다.
+            tmp_info = info_path.with_name(info_path.name + suffix)
+            tmp_info.write_text(json.dumps(asdict(info)), encoding="utf-8")
+            os.replace(tmp_info, info_path)
+            tmp_tensor = tensor_path.with_name(tensor_path.name + suffix)
+            with open(tmp_tensor, "wb") as handle:
+                np.save(handle, np.ascontiguousarray(tensor, dtype=np.float32))
+            os.replace(tmp_tensor, tensor_path)
+        except OSError as exc:  # pragma: no cover - 디스크 실패 시 캐시 없이 진행
+            logger.warning("전처리 텐서 캐시 기록 실패: %s", exc)
+
+    def prepare(
+        self, image: ImageInput, input_size: int, *, digest: str | None = None
+    ) -> tuple[np.ndarray, LetterboxInfo]:
+        """캐시된 텐서를 반환하고, 없으면 레터박스 변환 후 저장. 배열 입력은 캐시하지 않는다."""
+
+        if isinstance(image, np.ndarray):
+            return letterbox(image, input_size)
+
+        digest = digest or content_hash(Path(image))
+        cached = self.get(digest, input_size)
+        if cached is not None:
+            return cached
+        tensor, info = letterbox(to_rgb_array(image), input_size)
+        self.put(digest, input_size, tensor, info)
+        return tensor, info
+
+    def stats(self) -> dict[str, int | str]:
+        return {"hits": self._hits, "misses": self._misses, "directory": str(self.directory)}
+
+    def _paths(self, digest: str, input_size: int) -> tuple[Path, Path]:
+        stem = self.directory / digest[:2] / f"{digest}-{input_size}"
+        return stem.with_suffix(".npy"), stem.with_suffix(".json")
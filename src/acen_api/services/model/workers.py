@@ -0,0 +1,321 @@
+"""프로세스 풀 기반 추론 워커.
+
+API 프로세스와 분리된 워커 프로세스에서 모델을 실행한다. 디코딩된 이미지는
+`multiprocessing.shared_memory`로 전달해 피클링 복사를 피하고, 감시 스레드가
+종료된 워커를 재시작하며 해당 워커에 배정된 요청은 `WorkerCrashed`로 실패시킨다.
+워커마다 전용 파이프를 사용하므로 강제 종료된 워커가 다른 워커의 통신을 막지 않는다.
+곧바로 다시 죽는 워커(가중치 손상, 메모리 부족 등)는 지수 백오프로 재시작하고, 연속 실패가
+`max_restarts`를 넘으면 풀 전체를 실패 상태(`failure`)로 두어 `/model/status`에 드러낸다.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import multiprocessing as mp
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+from typing import Any, Sequence
+
+import numpy as np
+
+from ...schemas import BoundingBox, ClassificationResult
+from .base import DEFAULT_CONFIDENCE, DEFAULT_IOU, ModelConfig, ModelWrapper
+from .image import ImageInput, to_rgb_array
+
+logger = logging.getLogger(__name__)
+
+_SUPERVISE_INTERVAL = 0.5
+# 이 시간 이상 실행된 뒤 종료된 워커는 연속 실패 횟수를 초기화한다.
+_STABLE_SECONDS = 30.0
+_MAX_BACKOFF_SECONDS = 30.0
+
+
+class WorkerCrashed(RuntimeError):
+    """요청을 처리하던 워커 프로세스가 비정상 종료되었을 때 발생."""
+
+
+@dataclass(slots=True)
+class _Worker:
+    index: int
+    process: Any
+    conn: Any
+    inflight: set[int] = field(default_factory=set)
+    started: float = field(default_factory=time.monotonic)
+    # 연속 비정상 종료 횟수와 다음 재시작 시각(종료 처리 전에는 None)
+    failures: int = 0
+    restart_at: float | None = None
+
+
+class ProcessPoolModel(ModelWrapper):
+    """`factory`로 만든 모델을 워커 프로세스 풀에서 실행하는 래퍼.
+
+    `factory`는 자식 프로세스에서 임포트 가능한 모듈 수준 클래스/함수여야 한다.
+    """
+
+    name = "process-pool"
+
+    def __init__(
+        self,
+        config: ModelConfig | None = None,
+        *,
+        factory: Any,
+        workers: int = 2,
+        request_timeout: float = 60.0,
+        start_method: str = "spawn",
+        max_restarts: int = 5,
+        restart_backoff: float = 0.5,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers는 1 이상이어야 합니다.")
+        self.config = config or ModelConfig(name=self.name)
+        self.name = getattr(factory, "name", self.name)
+        self.factory = factory
+        self.workers = workers
+        self.request_timeout = request_timeout
+        self.max_restarts = max_restarts
+        self.restart_backoff = restart_backoff
+        self._ctx = mp.get_context(start_method)
+        self._workers: list[_Worker] = []
+        self._futures: dict[int, Future] = {}
+        self._task_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._device: str | None = None
+        self.restarts = 0
+        # 재시작을 포기한 이유. 설정되면 모든 요청이 `WorkerCrashed`로 실패한다.
+        self.failure: str | None = None
+
+    def load(self, *, device: str | None = None) -> None:
+        if self._workers:
+            return
+        self._device = device or self.config.device
+        self._stopped.clear()
+        self.failure = None
+        self._workers = [self._spawn(index) for index in range(self.workers)]
+        self._threads = [
+            threading.Thread(target=self._collect, name="process-pool-results", daemon=True),
+            threading.Thread(target=self._supervise, name="process-pool-supervisor", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def detect(
+        self, image: ImageInput, *, confidence: float = DEFAULT_CONFIDENCE, iou: float = DEFAULT_IOU
+    ) -> list[BoundingBox]:
+        return self.detect_batch([image], confidence=confidence, iou=iou)[0]
+
+    def classify(self, image: ImageInput, top_k: int = 3) -> list[ClassificationResult]:
+        return self.classify_batch([image], top_k=top_k)[0]
+
+    def detect_batch(
+        self,
+        images: Sequence[ImageInput],
+        *,
+        confidence: float = DEFAULT_CONFIDENCE,
+        iou: float = DEFAULT_IOU,
+    ) -> list[list[BoundingBox]]:
+        payloads = self._run_many("detect", images, {"confidence": confidence, "iou": iou})
+        return [[BoundingBox.model_validate(item) for item in payload] for payload in payloads]
+
+    def classify_batch(
+        self, images: Sequence[ImageInput], top_k: int = 3
+    ) -> list[list[ClassificationResult]]:
+        payloads = self._run_many("classify", images, {"top_k": top_k})
+        return [[ClassificationResult.model_validate(item) for item in payload] for payload in payloads]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": len(self._workers),
+                "alive": sum(1 for worker in self._workers if worker.process.is_alive()),
+                "inflight": len(self._futures),
+                "restarts": self.restarts,
+                "failure": self.failure,
+            }
+
+    def close(self) -> None:
+        self._stopped.set()
+        with self._lock:
+            workers = list(self._workers)
+            self._workers = []
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except OSError:  # pragma: no cover - 이미 종료된 워커
+                pass
+        for worker in workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():  # pragma: no cover - 종료 지연 시 강제 종료
+                worker.process.terminate()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+        for worker in workers:
+            if not worker.conn.closed:
+                worker.conn.close()
+        self._fail_all(WorkerCrashed("워커 풀이 종료되었습니다."))
+
+    def _run_many(self, method: str, images: Sequence[ImageInput], kwargs: dict[str, Any]) -> list[Any]:
+        if not self._workers:
+            raise RuntimeError("모델이 로드되지 않았습니다. 먼저 load()를 호출하세요.")
+        if self.failure is not None:
+            raise WorkerCrashed(self.failure)
+
+        handles: list[tuple[int, Future, shared_memory.SharedMemory]] = []
+        try:
+            for image in images:
+                array = np.ascontiguousarray(to_rgb_array(image), dtype=np.uint8)
+                shm = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+                np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+                task_id, future = self._dispatch((method, shm.name, array.shape, array.dtype.str, kwargs))
+                handles.append((task_id, future, shm))
+            return [future.result(timeout=self.request_timeout) for _, future, _ in handles]
+        finally:
+            # 시간 초과/오류로 남은 작업은 추적에서 빼야 해당 워커가 계속 바쁜 것으로 보이지 않는다.
+            self._discard([task_id for task_id, future, _ in handles if not future.done()])
+            for _, _, shm in handles:
+                shm.close()
+                shm.unlink()
+
+    def _dispatch(self, task: tuple) -> tuple[int, Future]:
+        future: Future = Future()
+        with self._lock:
+            # 재시작 대기 중인 워커에는 보내지 않는다.
+            alive = [worker for worker in self._workers if worker.restart_at is None and worker.process.is_alive()]
+            if not alive:
+                raise WorkerCrashed(self.failure or "사용 가능한 추론 워커가 없습니다.")
+            task_id = next(self._task_ids)
+            worker = min(alive, key=lambda item: len(item.inflight))
+            worker.inflight.add(task_id)
+            self._futures[task_id] = future
+            worker.conn.send((task_id, *task))
+        return task_id, future
+
+    def _discard(self, task_ids: Sequence[int]) -> None:
+        if not task_ids:
+            return
+        with self._lock:
+            for task_id in task_ids:
+                self._futures.pop(task_id, None)
+                for worker in self._workers:
+                    worker.inflight.discard(task_id)
+
+    def _spawn(self, index: int) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(self.factory, self.config, self._device, child_conn),
+            name=f"inference-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(index=index, process=process, conn=parent_conn)
+
+    def _collect(self) -> None:
+        while not self._stopped.is_set():
+            with self._lock:
+                by_conn = {worker.conn: worker for worker in self._workers if not worker.conn.closed}
+            for conn in wait(list(by_conn), timeout=_SUPERVISE_INTERVAL):
+                try:
+                    task_id, ok, payload = conn.recv()
+                except (EOFError, OSError):
+                    # 종료된 워커. 재시작과 실패 처리는 감시 스레드가 담당한다.
+                    conn.close()
+                    continue
+                with self._lock:
+                    future = self._futures.pop(task_id, None)
+                    by_conn[conn].inflight.discard(task_id)
+                if future is None:
+                    continue
+                if ok:
+                    future.set_result(payload)
+                else:
+                    future.set_exception(RuntimeError(payload))
+
+    def _supervise(self) -> None:
+        while not self._stopped.wait(_SUPERVISE_INTERVAL):
+            with self._lock:
+                dead = [worker for worker in self._workers if not worker.process.is_alive()]
+            for worker in dead:
+                if self._stopped.is_set() or self.failure is not None:
+                    return
+                if worker.restart_at is None:
+                    self._on_exit(worker)
+                elif time.monotonic() >= worker.restart_at:
+                    replacement = self._spawn(worker.index)
+                    replacement.failures = worker.failures
+                    with self._lock:
+                        self._workers = [replacement if item is worker else item for item in self._workers]
+                        self.restarts += 1
+
+    def _on_exit(self, worker: _Worker) -> None:
+        """종료된 워커의 요청을 실패시키고 재시작 시각을 정한다. 연속 실패가 한도를 넘으면 풀을 실패 처리."""
+
+        now = time.monotonic()
+        failures = worker.failures + 1 if now - worker.started < _STABLE_SECONDS else 1
+        with self._lock:
+            failed = [self._futures.pop(task_id, None) for task_id in worker.inflight]
+            worker.inflight.clear()
+            worker.failures = failures
+        for future in failed:
+            if future is not None:
+                future.set_exception(WorkerCrashed(f"추론 워커 {worker.index}가 비정상 종료되었습니다."))
+
+        if failures > self.max_restarts:
+            self.failure = (
+                f"추론 워커 {worker.index}가 연속 {failures}회 비정상 종료되어 재시작을 중단했습니다"
+                f"(exitcode={worker.process.exitcode})."
+            )
+            logger.error(self.failure)
+            self._fail_all(WorkerCrashed(self.failure))
+            return
+        delay = min(self.restart_backoff * 2 ** (failures - 1), _MAX_BACKOFF_SECONDS)
+        worker.restart_at = now + delay
+        logger.warning(
+            "추론 워커 %d 종료 감지(exitcode=%s), %.1f초 후 재시작합니다 (연속 %d회).",
+            worker.index,
+            worker.process.exitcode,
+            delay,
+            failures,
+        )
+
+    def _fail_all(self, exc: Exception) -> None:
+        with self._lock:
+            futures = list(self._futures.values())
+            self._futures.clear()
+        for future in futures:
+            future.set_exception(exc)
+
+
+def _worker_main(factory: Any, config: ModelConfig, device: str | None, conn: Any) -> None:
+    """워커 프로세스 진입점. 모델을 한 번 로드한 뒤 파이프로 받은 작업을 처리."""
+
+    model = factory(config)
+    model.load(device=device)
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, KeyboardInterrupt):  # pragma: no cover - 부모 종료
+            return
+        if task is None:
+            return
+        task_id, method, shm_name, shape, dtype, kwargs = task
+        try:
+            shm = shared_memory.SharedMemory(name=shm_name)
+            try:
+                image = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+                output = getattr(model, method)(image, **kwargs)
+                payload = [item.model_dump() for item in output]
+                del image
+            finally:
+                shm.close()
+            conn.send((task_id, True, payload))
+        except Exception as exc:
+            conn.send((task_id, False, str(exc) or exc.__class__.__name__))
@@ -0,0 +1,128 @@
+"""저장된 원본 이미지의 크기별 파생본(썸네일/미리보기/모델 입력 크기) 생성."""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Mapping
+
+from PIL import Image, ImageOps
+
+from .storage import blob_relative_path
+
+logger = logging.getLogger(__name__)
+
+_EXTENSION = "jpg"
+# 모델 입력 크기 파생본 이름. 탐지/분류가 원본 대신 읽는다.
+MODEL_RENDITION = "model"
+
+
+class RenditionService:
+    """원본과 같은 내용 해시 이름으로 크기별 파생본을 만들어 두고, 요청 크기에 맞는 것을 고른다.
+
+    생성은 전용 스레드풀에서 진행되므로 업로드 응답을 지연시키지 않는다. 파일은
+    `<directory>/<이름>/ab/cd/<해시>.jpg`에 저장되며 이미 있으면 다시 만들지 않는다.
+    원본은 한 번만 디코딩(JPEG은 가장 큰 파생본 크기로 draft 축소 디코딩)하고,
+    큰 파생본부터 차례로 줄여 작은 파생본을 만든다.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        sizes: Mapping[str, int],
+        *,
+        workers: int = 2,
+        quality: int = 85,
+    ) -> None:
+        self.directory = Path(directory)
+        # 긴 변 기준 오름차순
+        self.sizes = dict(sorted(sizes.items(), key=lambda item: item[1]))
+        self.quality = quality
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="rendition")
+        self._lock = threading.Lock()
+        self._pending: dict[str, Future] = {}
+        self._generated = 0
+        self._failed = 0
+
+    def path(self, name: str, digest: str) -> Path:
+        return self.directory / name / blob_relative_path(digest, _EXTENSION)
+
+    def schedule(self, source: Path, digest: str) -> Future | None:
+        """파생본 생성을 백그라운드에 예약. 모두 있으면 None, 같은 원본이 진행 중이면 그 작업을 반환."""
+
+        if all(self.path(name, digest).exists() for name in self.sizes):
+            return None
+        with self._lock:
+            future = self._pending.get(digest)
+            if future is not None:
+                return future
+            future = self._pool.submit(self.generate, Path(source), digest)
+            self._pending[digest] = future
+        # 이미 끝난 작업이면 콜백이 즉시 호출되므로 잠금 밖에서 등록한다.
+        future.add_done_callback(lambda done, digest=digest: self._finish(digest, done))
+        return future
+
+    def generate(self, source: Path, digest: str) -> dict[str, Path]:
+        """없는 파생본을 모두 생성하고 이름별 경로를 반환."""
+
+        missing = [(name, edge) for name, edge in self.sizes.items() if not self.path(name, digest).exists()]
+        if missing:
+            largest = missing[-1][1]
+            with Image.open(source) as image:
+                image.draft("RGB", (largest, largest))
+                current = ImageOps.exif_transpose(image).convert("RGB")
+            for name, edge in reversed(missing):
+                current.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+                self._save(current, self.path(name, digest))
+        return {name: self.path(name, digest) for name in self.sizes}
+
+    def best(self, digest: str, size: int) -> tuple[str, Path] | None:
+        """긴 변이 `size` 이상인 가장 작은 파생본. 아직 없거나 모두 작으면 None(원본 사용)."""
+
+        for name, edge in self.sizes.items():
+            if edge < size:
+                continue
+            path = self.path(name, digest)
+            if path.exists():
+                return name, path
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "sizes": dict(self.sizes),
+                "pending": len(self._pending),
+                "generated": self._generated,
+                "failed": self._failed,
+            }
+
+    def close(self) -> None:
+        """대기 중인 작업은 취소하고 진행 중인 작업이 끝나기를 기다린다."""
+
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def _save(self, image: Image.Image, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle, tmp_name = tempfile.mkstemp(prefix=".rendition-", suffix=".part", dir=path.parent)
+        try:
+            with os.fdopen(handle, "wb") as tmp:
+                image.save(tmp, format="JPEG", quality=self.quality, optimize=True)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _finish(self, digest: str, future: Future) -> None:
+        with self._lock:
+            self._pending.pop(digest, None)
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                self._failed += 1
+                logger.warning("파생 이미지 생성 실패: %s (%s)", digest, future.exception())
+            else:
+                self._generated += 1
@@ -0,0 +1,258 @@
+"""과거 일자 로그 이미지를 새 모델로 다시 탐지해 ModelResult를 갱신하는 오프라인 작업."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models import Date
+from ..repositories import ImageBlobRepository, ModelResultRepository
+from ..repositories.model_result import DETECTION
+from .model.base import DEFAULT_CONFIDENCE, DEFAULT_IOU, ModelWrapper
+from .model.image import to_rgb_array
+
+logger = logging.getLogger(__name__)
+
+_DONE: Any = object()
+
+
+@dataclass(slots=True)
+class RescoreStats:
+    """재채점 진행 통계."""
+
+    last_date_id: int = 0
+    processed: int = 0
+    failed: int = 0
+    boxes: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def images_per_second(self) -> float:
+        return self.processed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+@dataclass(slots=True)
+class _Batch:
+    date_ids: list[int]
+    paths: list[str]
+    pixels: list[np.ndarray | None]
+    boxes: list[list] | None = None
+
+
+class RescoreJob:
+    """`Date.image_path`를 가진 일자 로그 전체를 배치 탐지하고 탐지 결과를 교체.
+
+    읽기(키셋 페이지네이션) -> 디코딩 -> 배치 추론 -> DB 일괄 기록의 네 단계가 각각 스레드로
+    실행되며 단계 사이는 크기가 제한된 큐로 연결되어 메모리 사용량이 일정하다. 배치를 커밋할
+    때마다 마지막 `Date.id`를 체크포인트 파일에 기록하므로 중단된 작업은 그 다음부터 이어서 실행된다.
+    디코딩에 실패한 이미지는 기존 결과를 유지하고 `failed`로 집계한다.
+    `content_id`(예: `ImageStorageService.content_id`)를 주면 교체한 결과의 이미지 참조도 함께 갱신한다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        detector: ModelWrapper,
+        *,
+        batch_size: int = 16,
+        page_size: int = 512,
+        queue_size: int = 4,
+        decode_workers: int = 4,
+        confidence: float = DEFAULT_CONFIDENCE,
+        iou: float = DEFAULT_IOU,
+        checkpoint_path: Path | str | None = None,
+        progress_every: int = 20,
+        content_id: Callable[[str], str | None] | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.detector = detector
+        self.batch_size = batch_size
+        self.page_size = page_size
+        self.queue_size = queue_size
+        self.decode_workers = decode_workers
+        self.confidence = confidence
+        self.iou = iou
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.progress_every = progress_every
+        self.content_id = content_id
+        self._stop = threading.Event()
+        self._errors: list[BaseException] = []
+
+    def run(self) -> RescoreStats:
+        stats = self._read_checkpoint()
+        started = time.perf_counter() - stats.elapsed_seconds
+        decoded: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        inferred: queue.Queue = queue.Queue(maxsize=self.queue_size)
+
+        with ThreadPoolExecutor(max_workers=self.decode_workers, thread_name_prefix="rescore-decode") as pool:
+            stages = [
+                threading.Thread(
+                    target=self._guard,
+                    args=(self._read_stage, stats.last_date_id, pool, decoded),
+                    name="rescore-read",
+                ),
+                threading.Thread(
+                    target=self._guard, args=(self._infer_stage, decoded, inferred), name="rescore-infer"
+                ),
+            ]
+            for stage in stages:
+                stage.start()
+            self._guard(self._write_stage, inferred, stats, started)
+            for stage in stages:
+                stage.join()
+
+        if self._errors:
+            raise self._errors[0]
+        stats.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            "재채점 완료: %d장 (실패 %d), %.1f images/sec", stats.processed, stats.failed, stats.images_per_second
+        )
+        return stats
+
+    # --- 단계 -------------------------------------------------------------------------------
+
+    def _read_stage(self, after_id: int, pool: ThreadPoolExecutor, outbox: queue.Queue) -> None:
+        """키셋 페이지로 일자 로그를 읽어 배치 단위로 디코딩 후 다음 단계로 전달."""
+
+        try:
+            for rows in self._pages(after_id):
+                for start in range(0, len(rows), self.batch_size):
+                    chunk = rows[start : start + self.batch_size]
+                    paths = [path for _, path in chunk]
+                    pixels = list(pool.map(_decode, paths))
+                    if not self._put(outbox, _Batch([date_id for date_id, _ in chunk], paths, pixels)):
+                        return
+        finally:
+            self._put(outbox, _DONE)
+
+    def _infer_stage(self, inbox: queue.Queue, outbox: queue.Queue) -> None:
+        try:
+            while (batch := self._get(inbox)) is not _DONE:
+                valid = [pixels for pixels in batch.pixels if pixels is not None]
+                outputs = iter(
+                    self.detector.detect_batch(valid, confidence=self.confidence, iou=self.iou) if valid else []
+                )
+                batch.boxes = [next(outputs) if pixels is not None else None for pixels in batch.pixels]
+                batch.pixels = []
+                if not self._put(outbox, batch):
+                    return
+        finally:
+            self._put(outbox, _DONE)
+
+    def _write_stage(self, inbox: queue.Queue, stats: RescoreStats, started: float) -> None:
+        """배치마다 DELETE + executemany INSERT + 커밋 한 번, 이후 체크포인트 기록."""
+
+        session = self.session_factory()
+        repo = ModelResultRepository(session)
+        blobs = ImageBlobRepository(session)
+        owner_type = ImageBlobRepository.OWNER_RESULTS[DETECTION]
+        written = 0
+        try:
+            while (batch := self._get(inbox)) is not _DONE:
+                items = [
+                    (date_id, boxes, path)
+                    for date_id, path, boxes in zip(batch.date_ids, batch.paths, batch.boxes or [])
+                    if boxes is not None
+                ]
+                stats.boxes += repo.replace_detections(items)
+                if self.content_id is not None:
+                    for date_id, _, path in items:
+                        blobs.replace_ref(self.content_id(path), owner_type, date_id)
+                session.commit()
+
+                stats.last_date_id = batch.date_ids[-1]
+                stats.processed += len(items)
+                stats.failed += len(batch.date_ids) - len(items)
+                stats.elapsed_seconds = time.perf_counter() - started
+                self._write_checkpoint(stats)
+                written += 1
+                if self.progress_every and written % self.progress_every == 0:
+                    logger.info(
+                        "재채점 진행: date_id=%d, %d장, %.1f images/sec",
+                        stats.last_date_id,
+                        stats.processed,
+                        stats.images_per_second,
+                    )
+        finally:
+            session.close()
+
+    def _pages(self, after_id: int) -> Iterator[list[tuple[int, str]]]:
+        session = self.session_factory()
+        try:
+            while not self._stop.is_set():
+                stmt = (
+                    select(Date.id, Date.image_path)
+                    .where(Date.id > after_id, Date.image_path.is_not(None))
+                    .order_by(Date.id)
+                    .limit(self.page_size)
+                )
+                rows = [(int(date_id), str(path)) for date_id, path in session.execute(stmt)]
+                # 다음 페이지를 읽는 동안 트랜잭션을 열어두지 않는다.
+                session.rollback()
+                if not rows:
+                    return
+                yield rows
+                after_id = rows[-1][0]
+        finally:
+            session.close()
+
+    # --- 보조 -------------------------------------------------------------------------------
+
+    def _guard(self, stage: Callable[..., None], *args: Any) -> None:
+        """단계에서 예외가 나면 기록하고 나머지 단계를 멈춘다."""
+
+        try:
+            stage(*args)
+        except BaseException as exc:
+            self._errors.append(exc)
+            self._stop.set()
+
+    def _put(self, target: queue.Queue, item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue) -> Any:
+        while not self._stop.is_set():
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _read_checkpoint(self) -> RescoreStats:
+        if self.checkpoint_path is None or not self.checkpoint_path.exists():
+            return RescoreStats()
+        data = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        return RescoreStats(**{key: data[key] for key in RescoreStats.__dataclass_fields__ if key in data})
+
+    def _write_checkpoint(self, stats: RescoreStats) -> None:
+        if self.checkpoint_path is None:
+            return
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(asdict(stats)), encoding="utf-8")
+        os.replace(tmp_path, self.checkpoint_path)
+
+
+def _decode(path: str) -> np.ndarray | None:
+    try:
+        return to_rgb_array(path)
+    except (OSError, ValueError):
+        return None
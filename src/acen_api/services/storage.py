@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import re
+import tempfile
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
-from typing import Iterable
-from uuid import uuid4
+from typing import TYPE_CHECKING, Iterable
 
+import numpy as np
 from PIL import Image, ImageOps
 
+from .model.cache import content_hash
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .renditions import RenditionService
+
+_CONTENT_HASH_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+# 내용 주소 저장 이전의 uuid4 파일 이름
+_LEGACY_UPLOAD_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+# 확장자별 파일 시그니처 판별에 필요한 최소 바이트 수
+_SNIFF_BYTES = 12
+_FORMAT_EXTENSIONS = {"JPEG": {"jpg", "jpeg"}, "PNG": {"png"}, "WEBP": {"webp"}}
+_CANONICAL_EXTENSIONS = {"JPEG": "jpg", "PNG": "png", "WEBP": "webp"}
+_ORIENTATION_TAG = 0x0112
+
 
 class StorageError(Exception):
     """스토리지 조작 실패 시 발생하는 예외."""
@@ -22,6 +40,15 @@ class StorageResult:
     path: Path
     relative_path: Path
     content_type: str
+    # 저장된 파일 이름의 확장자를 뺀 식별자 (`ImageReference.upload_id`로 사용)
+    upload_id: str = ""
+    # 저장된 파일 바이트의 SHA-256 (파일 이름이자 추론 캐시 키)
+    content_hash: str | None = None
+    # 방향 보정까지 마친 RGB(H, W, 3) uint8 픽셀. 재디코딩 없이 모델에 바로 전달
+    pixels: np.ndarray | None = None
+    size_bytes: int = 0
+    # 같은 내용의 파일이 이미 있어 새로 쓰지 않았는지 여부
+    deduplicated: bool = False
 
 
 class ImageStorageService:
@@ -34,6 +61,7 @@ class ImageStorageService:
         allowed_extensions: Iterable[str] | None = None,
         max_file_size: int = 5 * 1024 * 1024,
         normalize_orientation: bool = True,
+        renditions: RenditionService | None = None,
     ) -> None:
         self.base_dir = Path(base_dir)
         self.allowed_extensions = {
@@ -41,59 +69,162 @@ class ImageStorageService:
         }
         self.max_file_size = max_file_size
         self.normalize_orientation = normalize_orientation
+        # 저장 후 파생 이미지(썸네일 등)를 백그라운드로 생성
+        self.renditions = renditions
 
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
-    def save_bytes(self, data: bytes, *, filename: str | None = None) -> StorageResult:
-        """바이트 데이터를 검증 후 저장."""
+    def save_bytes(self, data: bytes, *, filename: str | None = None, decode: bool = True) -> StorageResult:
+        """바이트 데이터를 검증 후 저장. `decode=False`면 `pixels`를 채우지 않는다."""
 
         self._validate_size(len(data))
+        return self._store(data, filename, decode=decode)
+
+    def open_upload(self, *, filename: str | None = None, decode: bool = True) -> "UploadWriter":
+        """청크 단위로 받는 업로드를 임시 파일에 기록하는 writer 생성."""
+
+        return UploadWriter(self, filename, decode=decode)
+
+    def _store(self, source: bytes | Path, filename: str | None, *, decode: bool) -> StorageResult:
+        """헤더만 읽어 검증하고, 방향 보정이 필요 없으면 원본 바이트를 그대로 저장.
+
+        EXIF 방향 태그가 실제로 회전/반전을 요구할 때만 디코딩 -> 보정 -> 재인코딩한다.
+        파일은 저장할 바이트의 SHA-256 이름으로 샤딩된 경로에 두며, 같은 내용이 이미 있으면
+        다시 쓰지 않는다. `source`가 임시 파일 경로면 복사 없이 최종 위치로 옮긴다.
+        """
 
-        image = self._load_image(data)
-        extension = self._resolve_extension(filename, image)
+        format_name, orientation = self._inspect(source)
+        extension = self._resolve_extension(filename, format_name)
         self._validate_extension(extension)
+        # 같은 내용은 업로드 파일명의 확장자(jpg/jpeg 등)와 무관하게 한 파일로 저장한다.
+        extension = _CANONICAL_EXTENSIONS.get(format_name or "", extension)
 
-        content_type = self._guess_content_type(extension)
-        file_name = f"{uuid4().hex}.{extension}"
-        full_path = self.base_dir / file_name
+        pixels = None
+        if self.normalize_orientation and orientation not in (None, 1):
+            source, pixels = self._transpose(source, format_name or _extension_format(extension))
 
-        image_to_save = image
-        if self.normalize_orientation:
-            image_to_save = ImageOps.exif_transpose(image)
+        if decode and pixels is None:
+            # 헤더 검사(verify)는 잘린 스캔 데이터를 잡지 못하므로 최종 위치로 옮기기 전에 디코딩한다.
+            pixels = _decode_rgb(source)
+        elif pixels is None:
+            _check_complete(source)
 
-        buffer = BytesIO()
-        format_name = image_to_save.format or extension.upper()
-        save_kwargs = {} if extension.lower() != "jpg" else {"quality": 90}
-        image_to_save.save(buffer, format=format_name, **save_kwargs)
-        full_path.write_bytes(buffer.getvalue())
+        digest = content_hash(source) if isinstance(source, Path) else hashlib.sha256(source).hexdigest()
+        relative_path = blob_relative_path(digest, extension)
+        full_path = self.base_dir / relative_path
+        deduplicated = full_path.exists()
+        if not deduplicated:
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            if isinstance(source, Path):
+                os.replace(source, full_path)
+            else:
+                _write_atomic(full_path, source)
+        if self.renditions is not None:
+            self.renditions.schedule(full_path, digest)
+
+        return StorageResult(
+            path=full_path,
+            relative_path=relative_path,
+            content_type=self._guess_content_type(extension),
+            upload_id=digest,
+            content_hash=digest,
+            pixels=pixels,
+            size_bytes=full_path.stat().st_size,
+            deduplicated=deduplicated,
+        )
+
+    def content_id(self, image_path: str | Path) -> str | None:
+        """경로가 이 저장소의 내용 주소 파일을 가리키면 내용 해시를, 아니면 None."""
+
+        path = Path(image_path)
+        if not _CONTENT_HASH_PATTERN.match(path.stem):
+            return None
+        if not (self.base_dir / blob_relative_path(path.stem, path.suffix.lstrip("."))).exists():
+            return None
+        return path.stem
 
-        return StorageResult(path=full_path, relative_path=Path(file_name), content_type=content_type)
+    def _inspect(self, source: bytes | Path) -> tuple[str | None, int | None]:
+        """픽셀을 디코딩하지 않고 형식과 EXIF 방향 태그를 읽은 뒤 `verify()`로 구조를 검사."""
 
-    def _load_image(self, data: bytes) -> Image.Image:
         try:
-            image = Image.open(BytesIO(data))
-            image.load()
-            return image
+            with Image.open(_open_source(source)) as image:
+                format_name = image.format
+                # PNG의 getexif()는 전체 디코딩을 유발하므로 헤더에서 읽힌 EXIF 블록만 해석한다.
+                raw_exif = image.info.get("exif")
+                orientation = None
+                if raw_exif:
+                    exif = Image.Exif()
+                    exif.load(raw_exif)
+                    orientation = exif.get(_ORIENTATION_TAG)
+                image.verify()
         except Exception as exc:  # pragma: no cover - Pillow 예외 메시지 위임
             raise StorageError("이미지 파일을 열 수 없습니다.") from exc
+        return format_name, orientation
+
+    def _transpose(self, source: bytes | Path, format_name: str) -> tuple[bytes, np.ndarray]:
+        """방향 보정 후 재인코딩한 바이트와 보정된 RGB 픽셀."""
+
+        try:
+            with Image.open(_open_source(source)) as image:
+                transposed = ImageOps.exif_transpose(image)
+        except Exception as exc:  # pragma: no cover - Pillow 예외 메시지 위임
+            raise StorageError("이미지 파일을 열 수 없습니다.") from exc
+
+        buffer = BytesIO()
+        save_kwargs = {} if format_name != "JPEG" else {"quality": 90}
+        transposed.save(buffer, format=format_name, **save_kwargs)
+        return buffer.getvalue(), np.asarray(transposed.convert("RGB"))
+
+    def resolve(self, upload_id: str) -> Path:
+        """업로드 식별자(내용 해시)로 저장된 파일 경로를 찾는다. 이전 형식(uuid) 파일도 지원."""
+
+        if _CONTENT_HASH_PATTERN.match(upload_id):
+            shard = self.base_dir / blob_relative_path(upload_id, "").parent
+            for candidate in sorted(shard.glob(f"{upload_id}.*")):
+                if candidate.suffix.lstrip(".") in self.allowed_extensions | set(_CANONICAL_EXTENSIONS.values()):
+                    return candidate
+            raise StorageError("업로드한 이미지를 찾을 수 없습니다.")
+        if not _LEGACY_UPLOAD_ID_PATTERN.match(upload_id):
+            raise StorageError("잘못된 업로드 식별자입니다.")
+        for extension in sorted(self.allowed_extensions):
+            candidate = self.base_dir / f"{upload_id}.{extension}"
+            if candidate.exists():
+                return candidate
+        raise StorageError("업로드한 이미지를 찾을 수 없습니다.")
 
     def _validate_size(self, size: int) -> None:
         if size > self.max_file_size:
             raise StorageError("파일 크기가 제한을 초과했습니다.")
 
+    def _sniff(self, head: bytes, filename: str | None) -> str:
+        """앞부분 바이트의 시그니처로 형식을 판별하고 허용 여부와 파일 확장자 일치를 확인."""
+
+        format_name = sniff_image_format(head)
+        allowed = {
+            name for name, extensions in _FORMAT_EXTENSIONS.items() if extensions & self.allowed_extensions
+        }
+        if format_name is None or format_name not in allowed:
+            raise StorageError("지원하지 않는 이미지 형식입니다.")
+        if filename:
+            extension = Path(filename).suffix.lower().lstrip(".")
+            self._validate_extension(extension)
+            if extension not in _FORMAT_EXTENSIONS[format_name]:
+                raise StorageError("파일 확장자와 이미지 형식이 일치하지 않습니다.")
+        return format_name
+
     def _validate_extension(self, extension: str) -> None:
         if extension.lower() not in self.allowed_extensions:
             raise StorageError("지원하지 않는 이미지 확장자입니다.")
 
-    def _resolve_extension(self, filename: str | None, image: Image.Image) -> str:
+    def _resolve_extension(self, filename: str | None, format_name: str | None) -> str:
         if filename:
             ext = Path(filename).suffix.lower().lstrip(".")
             if not ext:
                 raise StorageError("파일 확장자를 확인할 수 없습니다.")
             return ext
 
-        if image.format:
-            return image.format.lower()
+        if format_name:
+            return format_name.lower()
 
         raise StorageError("파일 확장자를 확인할 수 없습니다.")
 
@@ -106,3 +237,109 @@ class ImageStorageService:
             "webp": "image/webp",
         }
         return mapping.get(extension.lower(), "application/octet-stream")
+
+
+class UploadWriter:
+    """업로드 본문을 받는 즉시 임시 파일에 기록하며 크기/형식을 검증.
+
+    첫 바이트가 도착하면 파일 시그니처로 형식을 판별해 잘못된 파일은 본문을 다 받기 전에
+    거절하고, 누적 크기가 제한을 넘는 순간 중단한다. 메모리에는 청크 하나만 유지된다.
+    """
+
+    def __init__(self, storage: ImageStorageService, filename: str | None, *, decode: bool = True) -> None:
+        self.storage = storage
+        self.filename = filename
+        self.decode = decode
+        self.size = 0
+        self._head = b""
+        self._format: str | None = None
+        handle, name = tempfile.mkstemp(prefix=".upload-", suffix=".part", dir=storage.base_dir)
+        self._path = Path(name)
+        self._file = os.fdopen(handle, "wb")
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        self.storage._validate_size(self.size)
+        if self._format is None:
+            self._head += chunk[:_SNIFF_BYTES]
+            if len(self._head) >= _SNIFF_BYTES:
+                self._format = self.storage._sniff(self._head, self.filename)
+        self._file.write(chunk)
+
+    def finish(self) -> StorageResult:
+        """기록을 마치고 저장. 보정이 필요 없으면 임시 파일을 그대로 최종 위치로 옮긴다."""
+
+        try:
+            self._file.close()
+            if self._format is None:
+                self.storage._sniff(self._head, self.filename)
+            return self.storage._store(self._path, self.filename, decode=self.decode)
+        finally:
+            self.abort()
+
+    def abort(self) -> None:
+        """임시 파일을 닫고 삭제."""
+
+        self._file.close()
+        self._path.unlink(missing_ok=True)
+
+
+def blob_relative_path(digest: str, extension: str) -> Path:
+    """내용 해시를 두 단계(`ab/cd/`)로 샤딩한 상대 경로. 디렉터리당 파일 수를 작게 유지한다."""
+
+    name = f"{digest}.{extension}" if extension else digest
+    return Path(digest[:2]) / digest[2:4] / name
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    handle, tmp_name = tempfile.mkstemp(prefix=".blob-", suffix=".part", dir=path.parent)
+    try:
+        with os.fdopen(handle, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _open_source(source: bytes | Path) -> BytesIO | Path:
+    return BytesIO(source) if isinstance(source, bytes) else source
+
+
+def _decode_rgb(source: bytes | Path) -> np.ndarray:
+    try:
+        with Image.open(_open_source(source)) as image:
+            return np.asarray(image.convert("RGB"))
+    except (OSError, ValueError) as exc:
+        raise StorageError("손상된 이미지 파일입니다.") from exc
+
+
+def _check_complete(source: bytes | Path) -> None:
+    """픽셀이 필요 없을 때 잘린 파일을 거르는 검사. JPEG은 1/8 축소(draft) 디코딩으로 스캔 데이터 끝까지 읽는다."""
+
+    try:
+        with Image.open(_open_source(source)) as image:
+            image.draft(image.mode, (1, 1))
+            image.load()
+    except (OSError, ValueError) as exc:
+        raise StorageError("손상된 이미지 파일입니다.") from exc
+
+
+def _extension_format(extension: str) -> str:
+    extension = extension.lower()
+    for format_name, extensions in _FORMAT_EXTENSIONS.items():
+        if extension in extensions:
+            return format_name
+    return extension.upper()
+
+
+def sniff_image_format(head: bytes) -> str | None:
+    """파일 앞부분 시그니처로 JPEG/PNG/WEBP를 판별. 알 수 없으면 None."""
+
+    if head.startswith(b"\xff\xd8\xff"):
+        return "JPEG"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "PNG"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "WEBP"
+    return None
@@ -1,6 +1,8 @@
 """테스트 구성 및 공용 픽스처."""
 
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 import pytest
@@ -14,9 +16,20 @@ SRC_DIR = ROOT_DIR / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
+# 앱 lifespan이 만드는 SQLite 파일이 저장소의 data/ 대신 임시 디렉터리에 생기도록 엔진 생성 전에 지정
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp(prefix='acen-test-')}/acen.db")
+
 from acen_api.models import Base  # noqa: E402
 
 
+@pytest.fixture(autouse=True)
+def _isolated_data_dirs(tmp_path, monkeypatch):
+    """업로드/파생 이미지 저장 경로를 테스트별 임시 디렉터리로 지정."""
+
+    monkeypatch.setenv("UPLOAD_DIR", str(tmp_path / "data" / "uploads"))
+    monkeypatch.setenv("RENDITION_DIR", str(tmp_path / "data" / "renditions"))
+
+
 @pytest.fixture()
 def db_session() -> Session:
     """테스트용 인메모리 SQLite 세션."""
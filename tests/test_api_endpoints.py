@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import date
 
 import pytest
@@ -89,3 +90,251 @@ def test_dates_and_feedback_flow(client, db_session):
         assert body["feedback_id"] > 0
         response = client.get("/feedback/suggest", params={"feedback_id": body["feedback_id"]})
         assert response.status_code == 200, response.json()
+
+
+def test_model_detect_uses_preloaded_registry(client, tmp_path):
+    from PIL import Image
+
+    image_path = tmp_path / "face.png"
+    Image.new("RGB", (32, 32), color="white").save(image_path)
+
+    status_response = client.get("/model/status")
+    assert status_response.status_code == 200
+    assert {item["role"] for item in status_response.json()} == {"detector", "classifier"}
+    assert all(item["ready"] for item in status_response.json())
+
+    response = client.post("/model/detect", json={"image_path": str(image_path)})
+    assert response.status_code == 200
+    assert response.json()["boxes"]
+
+    before = client.get("/model/metrics").json()["cache"]["hits"]
+    repeat = client.post("/model/detect", json={"image_path": str(image_path)})
+    assert repeat.json() == response.json()
+    assert client.get("/model/metrics").json()["cache"]["hits"] == before + 1
+
+    response = client.post("/model/detect", json={"image_path": str(tmp_path / "missing.png")})
+    assert response.status_code == 400
+
+
+def test_model_detect_persists_results_for_date(client, db_session, tmp_path):
+    import json
+
+    from PIL import Image
+
+    from acen_api.repositories import DateRepository, ModelResultRepository
+    from acen_api.schemas import DateCreate
+
+    user = UserRepository(db_session).create(UserCreate(username="persist-user"))
+    db_session.flush()
+    calendar = CalendarRepository(db_session).create(user_id=user.id, name="저장")
+    date_log = DateRepository(db_session).create(
+        DateCreate(calendar_id=calendar.id, scheduled_date=date(2024, 2, 1), schedule_total=1),
+        user_id=user.id,
+    )
+    db_session.commit()
+
+    image_path = tmp_path / "face.png"
+    Image.new("RGB", (32, 32), color="white").save(image_path)
+
+    response = client.post("/model/detect", json={"image_path": str(image_path), "date_id": date_log.id})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["persisted"] == len(body["boxes"]) > 0
+
+    payload = {"image_path": str(image_path), "top_k": 2, "date_id": date_log.id}
+    response = client.post("/model/classify", json=payload)
+    assert response.json()["persisted"] == 2
+
+    rows = ModelResultRepository(db_session).list_for_date(date_log.id)
+    assert [row.result_type for row in rows].count("detection") == body["persisted"]
+    assert [row.result_type for row in rows].count("classification") == 2
+    assert len(json.loads(rows[0].data)) == 4
+    assert rows[0].image_path == str(image_path)
+
+    # 같은 일자로 다시 호출하면 종류별로 기존 결과를 교체한다.
+    client.post("/model/detect", json={"image_path": str(image_path), "date_id": date_log.id})
+    client.post("/model/classify", json=payload)
+    db_session.expire_all()
+    again = ModelResultRepository(db_session).list_for_date(date_log.id)
+    assert sorted(row.result_type for row in again) == sorted(row.result_type for row in rows)
+
+    assert client.post("/model/detect", json={"image_path": str(image_path)}).json()["persisted"] is None
+    missing = client.post("/model/detect", json={"image_path": str(image_path), "date_id": 9999})
+    assert missing.status_code == 404
+
+
+def test_model_detect_returns_400_when_image_disappears_after_validation(client, tmp_path, monkeypatch):
+    from acen_api.api.routers import model as model_router
+
+    vanished = tmp_path / "vanished.png"
+    # 존재 확인은 통과했지만 그 직후 파일이 삭제된 경우
+    monkeypatch.setattr(model_router, "_locate_image", lambda item, storage: (vanished, None))
+
+    response = client.post("/model/detect", json={"image_path": str(vanished)})
+    assert response.status_code == 400
+    assert response.json()["message"] == "Image not found"
+
+
+def test_model_reload_validates_role_and_weights(client, tmp_path, monkeypatch):
+    model_dir = tmp_path / "models"
+    model_dir.mkdir()
+    monkeypatch.setenv("MODEL_DIR", str(model_dir))
+    outside = tmp_path / "outside.pt"
+    outside.write_bytes(b"weights")
+
+    # 키가 하나도 없는 초기 상태에서도 키가 필요하다.
+    assert client.post("/model/reload", json={"role": "detector"}).status_code == 401
+    headers = {"X-API-Key": client.post("/api-keys", json={"description": "ops"}).json()["key"]}
+
+    response = client.post("/model/reload", json={"role": "unknown"}, headers=headers)
+    assert response.status_code == 404
+
+    response = client.post("/model/reload", json={"weights_path": str(model_dir / "missing.pt")}, headers=headers)
+    assert response.status_code == 400
+
+    for path in (outside, model_dir / ".." / "outside.pt"):
+        response = client.post("/model/reload", json={"weights_path": str(path)}, headers=headers)
+        assert response.status_code == 400
+
+    status_response = client.get("/model/status").json()
+    assert all(item["swapping"] is False for item in status_response)
+
+
+def test_model_batch_endpoints_keep_input_order(client, tmp_path):
+    from PIL import Image
+
+    paths = []
+    for idx, color in enumerate(["white", "black"]):
+        path = tmp_path / f"face-{idx}.png"
+        Image.new("RGB", (16, 16), color=color).save(path)
+        paths.append(str(path))
+
+    items = [{"image_path": paths[0]}, {"image_path": str(tmp_path / "missing.png")}, {"image_path": paths[1]}]
+
+    response = client.post("/model/detect:batch", json={"items": items})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["index"] for item in results] == [0, 1, 2]
+    assert results[0]["boxes"] and results[2]["boxes"]
+    assert results[1]["boxes"] is None and results[1]["error"] == "Image not found"
+
+    response = client.post("/model/classify:batch", json={"items": items, "top_k": 1})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0]["results"][0]["label"] == "clear"
+    assert results[2]["results"][0]["label"] == "acne"
+    assert results[1]["error"] == "Image not found"
+
+
+def test_model_upload_endpoints_infer_and_expose_upload_id(client, tmp_path):
+    import io
+
+    from PIL import Image
+
+    from acen_api.services import ImageStorageService
+
+    app.dependency_overrides[deps.get_storage] = lambda: ImageStorageService(tmp_path)
+    buffer = io.BytesIO()
+    Image.new("RGB", (16, 16), color="black").save(buffer, format="PNG")
+    files = {"file": ("face.png", buffer.getvalue(), "image/png")}
+
+    response = client.post("/model/detect:upload", files=files, data={"confidence": "0.3"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["boxes"] and body["upload_id"]
+    assert (tmp_path / body["relative_path"]).exists()
+
+    # 업로드 결과가 캐시되어 같은 이미지를 upload_id로 참조하면 캐시를 재사용
+    response = client.post("/model/detect", json={"upload_id": body["upload_id"], "confidence": 0.3})
+    assert response.status_code == 200
+    assert response.json()["boxes"] == body["boxes"]
+
+    response = client.post("/model/classify:upload", files=files, data={"top_k": "1"})
+    assert response.status_code == 200
+    assert response.json()["results"][0]["label"] == "acne"
+
+    response = client.post("/model/classify", json={"upload_id": "0" * 32})
+    assert response.status_code == 404
+
+    response = client.post(
+        "/model/detect:batch", json={"items": [{"upload_id": body["upload_id"]}, {"upload_id": "bad"}]}
+    )
+    results = response.json()["results"]
+    assert results[0]["boxes"] and results[1]["error"] == "Upload not found"
+
+
+def test_model_detect_submits_shadow_only_when_model_ran(client, tmp_path):
+    from PIL import Image
+
+    from acen_api.services import MicroBatcher
+
+    class RecordingShadow:
+        def __init__(self):
+            self.calls = []
+
+        def submit(self, image, primary, primary_ms, **thresholds):
+            self.calls.append(primary_ms)
+            return True
+
+    image_path = tmp_path / "face.png"
+    Image.new("RGB", (8, 8), color="white").save(image_path)
+    shadow = RecordingShadow()
+    # 배치 창(200ms) 대기는 모델 실행 시간에 포함되지 않는다.
+    batcher = MicroBatcher(lambda group, items: [[] for _ in items], window_ms=200)
+    app.dependency_overrides[deps.get_shadow_evaluator] = lambda: shadow
+    app.dependency_overrides[deps.get_batchers] = lambda: {"detector": batcher}
+    try:
+        payload = {"image_path": str(image_path)}
+        assert client.post("/model/detect", json=payload).status_code == 200
+        assert len(shadow.calls) == 1 and 0 <= shadow.calls[0] < 100
+        # 캐시 적중은 모델을 실행하지 않았으므로 비교하지 않는다.
+        assert client.post("/model/detect", json=payload).status_code == 200
+        assert len(shadow.calls) == 1
+
+        app.dependency_overrides[deps.get_batchers] = lambda: {}
+        assert client.post("/model/detect", json={**payload, "confidence": 0.4}).status_code == 200
+        assert len(shadow.calls) == 2
+    finally:
+        batcher.close()
+        del app.dependency_overrides[deps.get_shadow_evaluator]
+        del app.dependency_overrides[deps.get_batchers]
+
+
+def test_model_detect_returns_503_when_inference_queue_full(client, tmp_path):
+    from PIL import Image
+
+    from acen_api.services import InferenceExecutor, MicroBatcher
+
+    image_path = tmp_path / "face.png"
+    Image.new("RGB", (8, 8), color="white").save(image_path)
+    payload = {"image_path": str(image_path), "confidence": 0.31}
+
+    # 배처가 없으면 실행기 대기열에서 거절
+    full = InferenceExecutor(max_workers=1, queue_size=0, retry_after_seconds=2)
+    app.dependency_overrides[deps.get_inference_executor] = lambda: full
+    app.dependency_overrides[deps.get_batchers] = lambda: {}
+    gate = threading.Event()
+    blocker = full.submit(gate.wait)
+    try:
+        response = client.post("/model/detect", json=payload)
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "2"
+    finally:
+        gate.set()
+        blocker.result(timeout=2)
+        full.shutdown()
+        del app.dependency_overrides[deps.get_inference_executor]
+
+    # 배처가 있으면 실행기 스레드 대신 배처 대기열에서 거절
+    batcher = MicroBatcher(lambda group, items: items, window_ms=60_000, max_queue_size=1, retry_after_seconds=3)
+    app.dependency_overrides[deps.get_batchers] = lambda: {"detector": batcher}
+    queued = batcher.submit_future("other")
+    try:
+        response = client.post("/model/detect", json=payload)
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+        assert batcher.stats()["rejected"] == 1
+    finally:
+        batcher.close()
+        assert queued.result(timeout=2) == "other"
+        del app.dependency_overrides[deps.get_batchers]
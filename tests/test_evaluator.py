@@ -68,6 +68,21 @@ def test_evaluator_metrics(db_session):
     assert metrics.trend.current >= 0
 
 
+def test_evaluator_trend_excludes_classification_results(db_session):
+    user_id, calendar = _create_user_and_calendar(db_session)
+    day = date(2024, 3, 1)
+    entry = _add_date(db_session, calendar, user_id, day, done=1, total=1)
+    _add_model_result(db_session, entry)
+    for _ in range(3):
+        db_session.add(ModelResult(date_id=entry.id, result_type="classification"))
+    db_session.flush()
+    db_session.refresh(entry)
+
+    metrics = EvaluatorService(db_session).evaluate_range(calendar.id, day, day, user_id=user_id)
+
+    assert metrics.trend.current == 1
+
+
 def test_evaluator_empty(db_session):
     user_id, calendar = _create_user_and_calendar(db_session)
     service = EvaluatorService(db_session)
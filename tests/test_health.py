@@ -13,3 +13,40 @@ def test_health_ok() -> None:
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_liveness_and_readiness_after_warmup() -> None:
+    import time
+
+    with TestClient(app) as live_client:
+        assert live_client.get("/health/live").json() == {"status": "ok"}
+
+        deadline = time.monotonic() + 5
+        response = live_client.get("/health/ready")
+        while response.status_code == 503 and time.monotonic() < deadline:
+            time.sleep(0.05)
+            response = live_client.get("/health/ready")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "ready"
+        assert all(item["warmed"] and item["warmup_seconds"] is not None for item in body["models"])
+
+
+def test_readiness_reports_warming_before_warmup() -> None:
+    from acen_api.api import deps
+    from acen_api.services import DummyDetector, ModelConfig, ModelRegistry
+
+    registry = ModelRegistry()
+    registry.register("detector", DummyDetector, ModelConfig(name="dummy"))
+    registry.load_all()
+    app.dependency_overrides[deps.get_model_registry] = lambda: registry
+    try:
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming"
+
+        registry.warm_up("detector", lambda model: model.detect_batch([]))
+        assert client.get("/health/ready").status_code == 200
+    finally:
+        app.dependency_overrides.clear()
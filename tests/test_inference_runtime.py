@@ -0,0 +1,332 @@
+"""추론 런타임(배칭 등) 동작 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from acen_api.services import (
+    ExecutorSaturated,
+    InferenceCache,
+    InferenceExecutor,
+    MicroBatcher,
+    SingleFlight,
+    content_hash,
+    weights_version,
+)
+
+
+def test_micro_batcher_groups_concurrent_requests():
+    batch_sizes: list[int] = []
+
+    def handler(_group, items):
+        batch_sizes.append(len(items))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(handler, max_batch_size=4, window_ms=200)
+    results: dict[int, int] = {}
+
+    def worker(value: int) -> None:
+        results[value] = batcher.submit(value)
+
+    threads = [threading.Thread(target=worker, args=(value,)) for value in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+
+    assert results == {0: 0, 1: 2, 2: 4, 3: 6}
+    assert batch_sizes == [4]
+
+
+def test_micro_batcher_respects_latency_budget_and_groups():
+    seen: list[tuple[object, list[int]]] = []
+
+    def handler(group, items):
+        seen.append((group, list(items)))
+        return items
+
+    batcher = MicroBatcher(handler, max_batch_size=8, window_ms=5000)
+    started = time.monotonic()
+    assert batcher.submit(1, group="a", budget_ms=0) == 1
+    assert time.monotonic() - started < 1.0
+
+    future_b = batcher.submit_future(2, group="b", budget_ms=10)
+    future_c = batcher.submit_future(3, group="c", budget_ms=10)
+    assert future_b.result(timeout=2) == 2
+    assert future_c.result(timeout=2) == 3
+    batcher.close()
+
+    assert ("b", [2]) in seen and ("c", [3]) in seen
+
+
+def test_batched_requests_do_not_hold_executor_threads():
+    from acen_api.api.routers.model import _run_model
+
+    batch_sizes: list[int] = []
+
+    def handler(_group, items):
+        batch_sizes.append(len(items))
+        return [[item] for item in items]
+
+    batcher = MicroBatcher(handler, max_batch_size=8, window_ms=2000)
+    executor = InferenceExecutor(max_workers=1, queue_size=0)
+
+    async def main():
+        return await asyncio.gather(
+            *(_run_model(executor, batcher, value, lambda: [], group=None) for value in range(8))
+        )
+
+    results = asyncio.run(main())
+    batcher.close()
+    executor.shutdown()
+
+    # 실행기 스레드 1개로도 요청 8개가 한 배치로 모인다.
+    assert results == [[value] for value in range(8)]
+    assert batch_sizes == [8]
+    assert executor.stats()["submitted"] == 0
+
+
+def test_inference_cache_evicts_by_bytes_and_uses_disk_tier(tmp_path):
+    image = tmp_path / "img.bin"
+    image.write_bytes(b"same-content")
+    key = InferenceCache.make_key(
+        content_hash=content_hash(image),
+        model_name="det",
+        weights_version=weights_version(None),
+        params={"confidence": 0.25, "iou": 0.45},
+    )
+    other = InferenceCache.make_key(
+        content_hash=content_hash(image),
+        model_name="det",
+        weights_version=weights_version(None),
+        params={"confidence": 0.5, "iou": 0.45},
+    )
+    assert key != other
+
+    cache = InferenceCache(max_bytes=80, disk_dir=tmp_path / "cache")
+    cache.put(key, [{"label": "acne", "score": 0.5}])
+    cache.put(other, [{"label": "x" * 40, "score": 0.1}])
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 80
+    assert stats["evictions"] == 1
+
+    assert cache.get(key) == [{"label": "acne", "score": 0.5}]
+    assert cache.stats()["disk_hits"] == 1
+    assert cache.get("unknown") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_inference_executor_rejects_when_queue_full():
+    executor = InferenceExecutor(max_workers=1, queue_size=1, retry_after_seconds=3)
+    gate = threading.Event()
+
+    running = executor.submit(gate.wait)
+    queued = executor.submit(gate.wait)
+    with pytest.raises(ExecutorSaturated) as excinfo:
+        executor.submit(gate.wait)
+    assert excinfo.value.retry_after == 3
+    assert executor.stats()["rejected"] == 1
+
+    gate.set()
+    running.result(timeout=2)
+    queued.result(timeout=2)
+    executor.submit(lambda: None).result(timeout=2)
+    executor.shutdown()
+
+
+def test_single_flight_shares_one_computation_across_concurrent_callers():
+    flight = SingleFlight()
+    calls: list[str] = []
+
+    async def compute(key: str):
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        if key == "bad":
+            raise ValueError("boom")
+        return [key]
+
+    async def scenario():
+        results = await asyncio.gather(
+            *(flight.run("a", lambda: compute("a")) for _ in range(5)),
+            flight.run("b", lambda: compute("b")),
+        )
+        # 먼저 호출한 요청이 취소돼도 뒤따르는 요청은 결과를 받는다.
+        leader = asyncio.ensure_future(flight.run("c", lambda: compute("c")))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.run("c", lambda: compute("c")))
+        await asyncio.sleep(0)
+        leader.cancel()
+        shared = await follower
+        errors = await asyncio.gather(
+            flight.run("bad", lambda: compute("bad")),
+            flight.run("bad", lambda: compute("bad")),
+            return_exceptions=True,
+        )
+        return results, shared, errors
+
+    results, shared, errors = asyncio.run(scenario())
+
+    assert results == [["a"]] * 5 + [["b"]]
+    assert shared == ["c"]
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert sorted(calls) == ["a", "b", "bad", "c"]
+    assert flight.stats() == {"inflight": 0, "leaders": 4, "shared": 6}
+
+
+def test_rescore_job_replaces_detections_and_resumes_from_checkpoint(tmp_path):
+    import json
+    from datetime import date
+
+    from PIL import Image
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from acen_api.models import Base, Calendar, Date, ModelResult, User
+    from acen_api.repositories import ImageBlobRepository
+    from acen_api.services import DummyDetector, RescoreJob
+
+    # 읽기/쓰기 단계가 서로 다른 커넥션을 쓰도록 파일 DB 사용
+    engine = create_engine(f"sqlite:///{tmp_path / 'rescore.db'}", future=True)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+    db_session = factory()
+
+    user = User(username="rescore")
+    calendar = Calendar(user=user, name="재채점")
+    db_session.add_all([user, calendar])
+    db_session.flush()
+    for day in range(1, 6):
+        image_path = tmp_path / f"{day}.png"
+        Image.new("RGB", (32, 32), color="white").save(image_path)
+        db_session.add(
+            Date(
+                calendar_id=calendar.id,
+                user_id=user.id,
+                scheduled_date=date(2024, 3, day),
+                image_path=str(image_path) if day != 3 else str(tmp_path / "missing.png"),
+            )
+        )
+    db_session.add(Date(calendar_id=calendar.id, user_id=user.id, scheduled_date=date(2024, 3, 9)))
+    db_session.flush()
+    first_id = db_session.query(Date.id).order_by(Date.id).first()[0]
+    db_session.add(ModelResult(date_id=first_id, result_type="detection", label="stale", score=0.1))
+    # 첫 일자의 이전 결과는 다른 blob을 참조하고 있었다.
+    blobs = ImageBlobRepository(db_session)
+    old_digest, new_digest = "0a" * 32, "1b" * 32
+    for digest in (old_digest, new_digest):
+        blobs.register(digest, relative_path=f"{digest}.png", content_type="image/png", size_bytes=1)
+    blobs.add_ref(old_digest, blobs.OWNER_RESULTS["detection"], first_id)
+    db_session.commit()
+
+    detector = DummyDetector()
+    detector.load()
+    checkpoint = tmp_path / "rescore.json"
+
+    try:
+        stats = RescoreJob(
+            factory,
+            detector,
+            batch_size=2,
+            page_size=3,
+            checkpoint_path=checkpoint,
+            content_id=lambda path: new_digest if path.endswith("1.png") else None,
+        ).run()
+
+        assert (stats.processed, stats.failed) == (4, 1)
+        assert stats.images_per_second > 0
+        assert json.loads(checkpoint.read_text())["last_date_id"] == stats.last_date_id
+        labels = [row.label for row in db_session.query(ModelResult).filter_by(date_id=first_id)]
+        assert labels and "stale" not in labels
+        assert db_session.query(ModelResult).count() == stats.boxes
+        assert (blobs.get(old_digest).ref_count, blobs.get(new_digest).ref_count) == (0, 1)
+        db_session.rollback()
+
+        # 체크포인트 이후 남은 일자가 없으므로 재실행 시 새로 처리하지 않는다.
+        resumed = RescoreJob(factory, detector, checkpoint_path=checkpoint).run()
+        assert resumed.processed == stats.processed
+        assert db_session.query(ModelResult).count() == stats.boxes
+    finally:
+        db_session.close()
+        engine.dispose()
+
+
+def test_shadow_evaluator_compares_off_request_path_and_drops_when_full():
+    from acen_api.schemas import BoundingBox
+    from acen_api.services import ModelConfig, ShadowEvaluator
+
+    release = threading.Event()
+    box = BoundingBox(x=0, y=0, width=10, height=10, score=0.9, label="acne")
+
+    class SlowCandidate:
+        name = "candidate"
+
+        def load(self, *, device=None):
+            pass
+
+        def detect(self, image, **thresholds):
+            assert thresholds == {"confidence": 0.3}
+            release.wait(5)
+            return [box]
+
+    shadow = ShadowEvaluator(
+        lambda config: SlowCandidate(), ModelConfig(name="candidate"), sample_rate=1.0, queue_size=1
+    )
+    try:
+        started = time.perf_counter()
+        accepted = [shadow.submit("img.png", [box], 12.0, confidence=0.3) for _ in range(4)]
+        assert time.perf_counter() - started < 0.5
+        # 첫 작업은 워커가 꺼내 실행 중, 두 번째가 큐를 채우고 나머지는 버려진다.
+        assert accepted.count(True) in (1, 2)
+        assert shadow.stats()["dropped"] == accepted.count(False)
+
+        release.set()
+        deadline = time.time() + 5
+        while shadow.stats()["evaluated"] < accepted.count(True) and time.time() < deadline:
+            time.sleep(0.01)
+        stats = shadow.stats()
+        assert stats["evaluated"] == accepted.count(True)
+        assert stats["recall"] == 1.0 and stats["primary_ms"] == 12.0
+    finally:
+        release.set()
+        shadow.close()
+
+    disabled = ShadowEvaluator(lambda config: SlowCandidate(), ModelConfig(name="off"), sample_rate=0)
+    assert not disabled.submit("img.png", [box], 1.0)
+    disabled.close()
+
+
+def test_shadow_evaluator_caches_load_failure_instead_of_reloading_per_sample():
+    from acen_api.schemas import BoundingBox
+    from acen_api.services import ModelConfig, ShadowEvaluator
+
+    box = BoundingBox(x=0, y=0, width=10, height=10, score=0.9, label="acne")
+    loads = []
+
+    class BrokenCandidate:
+        def load(self, *, device=None):
+            loads.append(device)
+            raise RuntimeError("missing weights")
+
+    shadow = ShadowEvaluator(
+        lambda config: BrokenCandidate(), ModelConfig(name="candidate"), sample_rate=1.0, load_retry_seconds=60
+    )
+    try:
+        assert shadow.submit("img.png", [box], 1.0)
+        deadline = time.time() + 5
+        while shadow.stats()["skipped"] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+
+        # 대기 시간 동안은 큐에 넣지 않고 건너뛴 수만 센다.
+        assert not any(shadow.submit("img.png", [box], 1.0) for _ in range(5))
+        stats = shadow.stats()
+        assert len(loads) == 1
+        assert stats["load_failures"] == 1 and stats["load_error"] == "missing weights"
+        assert stats["skipped"] == 6 and stats["evaluated"] == 0 and stats["errors"] == 0
+    finally:
+        shadow.close()
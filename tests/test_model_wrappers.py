@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import time
+
+import pytest
 from PIL import Image
 
 from acen_api.schemas import BoundingBox, ClassificationResult
 from acen_api.services import (
     DummyDetector,
     ModelConfig,
+    ModelRegistry,
+    ProcessPoolModel,
     RuleBasedClassifier,
+    SynchronizedModel,
     UltralyticsDetector,
+    WeightsWatcher,
 )
 from acen_api.services.model import detector_ultralytics as yolo_module
 from acen_api.services.model import device as device_module
@@ -59,6 +66,49 @@ def test_choose_device_prefers_cuda(monkeypatch):
     assert device_module.choose_device("cuda") == "cuda"
 
 
+def test_cpu_plan_splits_cores_per_worker_and_applies_threads(monkeypatch, tmp_path):
+    import os
+    import sys
+
+    for name in device_module._THREAD_ENV_VARS:
+        # 변수가 없을 때 delenv는 아무것도 기록하지 않으므로 먼저 setenv해 원래 상태(미설정)로 복구되게 한다.
+        monkeypatch.setenv(name, "unset")
+        monkeypatch.delenv(name)
+    monkeypatch.setattr(device_module, "_available_cores", lambda: list(range(32)))
+    monkeypatch.setattr(device_module, "_active_plan", None)
+    pinned: list[list[int]] = []
+    monkeypatch.setattr(os, "sched_setaffinity", lambda pid, cores: pinned.append(list(cores)), raising=False)
+
+    class FakeTorch:
+        threads: tuple[int, int] | None = None
+
+        def set_num_threads(self, count):
+            self.threads = (count, self.threads[1] if self.threads else 0)
+
+        def set_num_interop_threads(self, count):
+            self.threads = (self.threads[0], count)
+
+    fake_torch = FakeTorch()
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+
+    plan = device_module.plan_cpu(workers=4, worker_index=1, pin=True)
+    assert (plan.intra_op_threads, plan.cores) == (8, list(range(8, 16)))
+
+    device_module.apply_cpu_plan(plan)
+    assert os.environ["OMP_NUM_THREADS"] == "8"
+    assert pinned == [list(range(8, 16))]
+    assert fake_torch.threads == (8, 1)
+    assert device_module.current_cpu_plan() is plan
+    assert plan.applied == ["env", "affinity", "torch"]
+
+    # 잠금 파일로 워커마다 서로 다른 순번을 받는다.
+    handles: list = []
+    monkeypatch.setattr(device_module, "_slot_handles", handles)
+    assert [device_module.claim_worker_slot(2, tmp_path) for _ in range(2)] == [0, 1]
+    for handle in handles:
+        handle.close()
+
+
 def test_ultralytics_detector_fallback(tmp_path, monkeypatch):
     monkeypatch.setattr(yolo_module, "YOLO", None)
     image_path = _prepare_image(tmp_path)
@@ -80,3 +130,525 @@ def test_rule_based_classifier(tmp_path):
 
     assert len(results) == 2
     assert all(isinstance(item, ClassificationResult) for item in results)
+
+
+def test_model_registry_loads_once_and_reports_status(tmp_path):
+    calls: list[str] = []
+
+    class CountingDetector(DummyDetector):
+        def load(self, *, device=None):
+            calls.append("load")
+            super().load(device=device)
+
+    registry = ModelRegistry()
+    registry.register("detector", CountingDetector, ModelConfig(name="counting"))
+    registry.register("alias", CountingDetector, ModelConfig(name="counting"))
+
+    first = registry.get("detector")
+    second = registry.get("alias")
+
+    assert first is second
+    assert calls == ["load"]
+    assert registry.ready()
+    status = {item["role"]: item for item in registry.status()}
+    assert status["detector"]["ready"] is True
+    assert status["detector"]["load_seconds"] is not None
+
+
+def test_model_registry_swaps_weights_atomically_and_releases_old_model(tmp_path):
+    closed: list[str] = []
+
+    class ClosingDetector(DummyDetector):
+        def __init__(self, config):
+            super().__init__()
+            self.weights = config.weights_path
+
+        def close(self):
+            closed.append(self.weights.name)
+
+    old_weights, new_weights = tmp_path / "v1.pt", tmp_path / "v2.pt"
+    registry = ModelRegistry()
+    registry.register("detector", ClosingDetector, ModelConfig(name="yolo", weights_path=old_weights))
+    old = registry.get("detector")
+
+    warmed: list[object] = []
+    entry = registry.swap("detector", new_weights, warm_up=warmed.append, drain_seconds=0.05)
+
+    new = registry.get("detector")
+    assert new is not old and new.weights == new_weights and warmed == [new]
+    assert entry.warmed and registry.config("detector").weights_path == new_weights
+    # 진행 중인 요청은 교체 후에도 이전 모델로 끝낼 수 있다.
+    assert old.detect(_prepare_image(tmp_path))
+    deadline = time.time() + 2
+    while not closed and time.time() < deadline:
+        time.sleep(0.01)
+    assert closed == ["v1.pt"]
+
+    # 로드 실패 시 기존 모델 유지
+    def failing(config):
+        raise RuntimeError("broken weights")
+
+    registry.register("classifier", failing, ModelConfig(name="broken"))
+    with pytest.raises(RuntimeError):
+        registry.swap("classifier")
+    assert registry.get("detector") is new
+
+    assert registry.start_swap("detector", old_weights, drain_seconds=0)
+    deadline = time.time() + 2
+    while registry.swapping("detector") and time.time() < deadline:
+        time.sleep(0.01)
+    assert registry.get("detector").weights == old_weights
+    registry.close()
+
+
+def test_weights_watcher_swaps_when_file_is_replaced(tmp_path):
+    class WeightsDetector(DummyDetector):
+        def __init__(self, config):
+            super().__init__()
+            self.content = config.weights_path.read_bytes()
+
+    weights = tmp_path / "yolo.pt"
+    weights.write_bytes(b"v1")
+    registry = ModelRegistry()
+    registry.register("detector", WeightsDetector, ModelConfig(name="yolo", weights_path=weights))
+    assert registry.get("detector").content == b"v1"
+
+    # 주기 확인 대신 check()를 직접 호출한다.
+    watcher = WeightsWatcher(registry, "detector", interval=60, drain_seconds=0)
+    assert watcher.check() is False
+
+    staged = tmp_path / "yolo.pt.new"
+    staged.write_bytes(b"v2-weights")
+    staged.replace(weights)
+    assert watcher.check() is True
+    deadline = time.time() + 2
+    while registry.swapping("detector") and time.time() < deadline:
+        time.sleep(0.01)
+    assert registry.get("detector").content == b"v2-weights"
+    assert watcher.check() is False
+    watcher.close()
+    registry.close()
+
+
+def test_model_registry_serializes_thread_unsafe_models(tmp_path):
+    weights = tmp_path / "missing.pt"
+    registry = ModelRegistry()
+    registry.register("detector", UltralyticsDetector, ModelConfig(name="ultra", weights_path=weights))
+
+    model = registry.get("detector")
+
+    assert isinstance(model, SynchronizedModel)
+    assert model.detect(_prepare_image(tmp_path))
+
+
+def test_process_pool_model_uses_shared_memory_and_restarts(tmp_path):
+    import numpy as np
+
+    pool = ProcessPoolModel(ModelConfig(name="pool"), factory=DummyDetector, workers=1)
+    pool.load()
+    try:
+        boxes = pool.detect(np.zeros((40, 20, 3), dtype=np.uint8))
+        assert boxes[0].width == 10  # 0.5 * width, 배열 형태가 그대로 전달됨
+        assert len(pool.detect_batch([_prepare_image(tmp_path)] * 2)) == 2
+
+        pool._workers[0].process.kill()
+        pool._workers[0].process.join()
+        deadline = time.monotonic() + 30
+        while pool.stats()["restarts"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.1)
+
+        assert pool.stats()["restarts"] == 1
+        assert pool.classify(_prepare_image(tmp_path), top_k=1)
+    finally:
+        pool.close()
+
+
+class _BrokenDetector(DummyDetector):
+    """워커 프로세스에서 로드가 항상 실패하는 모델(가중치 손상 등)."""
+
+    def load(self, device: str | None = None) -> None:
+        raise RuntimeError("broken weights")
+
+
+def test_process_pool_model_backs_off_and_gives_up_on_crash_loop(tmp_path):
+    from acen_api.services.model.workers import WorkerCrashed
+
+    pool = ProcessPoolModel(
+        ModelConfig(name="pool"), factory=_BrokenDetector, workers=1, max_restarts=2, restart_backoff=0.05
+    )
+    registry = ModelRegistry()
+    registry.register("detector", lambda config: pool, ModelConfig(name="pool"))
+    try:
+        registry.get("detector")
+        deadline = time.monotonic() + 60
+        while pool.failure is None and time.monotonic() < deadline:
+            time.sleep(0.1)
+
+        assert pool.failure is not None
+        assert pool.stats()["restarts"] == 2
+        with pytest.raises(WorkerCrashed):
+            pool.detect(_prepare_image(tmp_path))
+
+        status = registry.status()[0]
+        assert status["ready"] is False
+        assert status["error"] == pool.failure
+        assert registry.ready() is False
+    finally:
+        registry.close()
+
+
+def test_process_pool_model_forgets_timed_out_tasks(tmp_path):
+    from concurrent.futures import TimeoutError as FutureTimeout
+
+    pool = ProcessPoolModel(ModelConfig(name="pool"), factory=DummyDetector, workers=2, request_timeout=0)
+    pool.load()
+    try:
+        with pytest.raises(FutureTimeout):
+            pool.detect_batch([_prepare_image(tmp_path)] * 3)
+
+        # 시간 초과된 작업이 워커의 진행 중 목록에 남으면 배정에서 계속 제외된다.
+        assert pool.stats()["inflight"] == 0
+        assert all(not worker.inflight for worker in pool._workers)
+        pool.request_timeout = 30
+        assert pool.detect(_prepare_image(tmp_path))
+    finally:
+        pool.close()
+
+
+def test_build_model_registry_wraps_detector_in_process_pool(tmp_path):
+    from acen_api.api.deps import build_model_registry
+    from acen_api.config import AppSettings
+
+    settings = AppSettings(model_path=str(tmp_path / "missing.pt"), inference_process_workers=1)
+    registry = build_model_registry(settings)
+    try:
+        model = registry.get("detector")
+        assert isinstance(model, ProcessPoolModel)
+        assert model.detect(_prepare_image(tmp_path))
+    finally:
+        registry.close()
+
+
+def test_decode_yolo_output_applies_nms_and_undoes_letterbox():
+    import numpy as np
+
+    from acen_api.services.model.postprocess import decode_yolo_output, letterbox
+
+    _, info = letterbox(np.zeros((50, 100, 3), dtype=np.uint8), 64)  # ratio 0.64, 상하 패딩 16
+    # 앵커 3개: 두 개는 겹치는 같은 클래스, 하나는 낮은 점수
+    output = np.array(
+        [
+            [32.0, 33.0, 10.0],  # cx
+            [32.0, 32.0, 10.0],  # cy
+            [16.0, 16.0, 4.0],  # w
+            [16.0, 16.0, 4.0],  # h
+            [0.9, 0.8, 0.1],  # class 0
+            [0.0, 0.0, 0.0],  # class 1
+        ],
+        dtype=np.float32,
+    )
+
+    boxes, scores, classes = decode_yolo_output(output, info, confidence=0.25, iou=0.45)
+
+    assert boxes.shape == (1, 4)
+    assert scores.tolist() == pytest.approx([0.9])
+    assert classes.tolist() == [0]
+    assert boxes[0].tolist() == pytest.approx([50.0, 25.0, 25.0, 25.0])
+
+
+def test_onnx_detector_runs_session_output(tmp_path, monkeypatch):
+    import numpy as np
+
+    from acen_api.services import OnnxDetector
+    from acen_api.services.model import detector_onnx
+
+    weights = tmp_path / "model.pt"
+    weights.with_suffix(".onnx").write_bytes(b"onnx")
+
+    class FakeInput:
+        name = "images"
+        shape = ["batch", 3, 64, 64]
+
+    class FakeSession:
+        def get_inputs(self):
+            return [FakeInput()]
+
+        def get_modelmeta(self):
+            class Meta:
+                custom_metadata_map = {"names": "{0: 'acne'}"}
+
+            return Meta()
+
+        def run(self, _outputs, feeds):
+            batch = feeds["images"].shape[0]
+            head = np.array([[32.0], [32.0], [16.0], [16.0], [0.7]], dtype=np.float32)
+            return [np.repeat(head[None], batch, axis=0)]
+
+    monkeypatch.setattr(detector_onnx, "ort", object())
+    monkeypatch.setattr(OnnxDetector, "_create_session", lambda self, path: FakeSession())
+    detector = OnnxDetector(ModelConfig(name="onnx", weights_path=weights))
+    detector.load()
+
+    results = detector.detect_batch([np.zeros((64, 64, 3), dtype=np.uint8)] * 2)
+
+    assert len(results) == 2
+    assert results[0][0].label == "acne"
+    assert results[0][0].score == pytest.approx(0.7)
+
+
+def test_build_model_registry_and_shadow_use_onnx_backend(tmp_path):
+    from acen_api.api.deps import build_model_registry, build_shadow_evaluator
+    from acen_api.config import AppSettings
+    from acen_api.services import OnnxDetector
+
+    settings = AppSettings(
+        model_backend="onnx",
+        model_input_size=320,
+        model_path=str(tmp_path / "missing.pt"),
+        shadow_model_path=str(tmp_path / "candidate.pt"),
+        shadow_sample_rate=0.5,
+    )
+    registry = build_model_registry(settings)
+    shadow = build_shadow_evaluator(settings)
+    try:
+        detector = registry.get("detector")
+        assert isinstance(detector, OnnxDetector)
+        assert detector.input_size == 320
+        candidate = shadow.factory(shadow.config)
+        assert isinstance(candidate, OnnxDetector)
+        assert shadow.config.weights_path == tmp_path / "candidate.pt"
+    finally:
+        shadow.close()
+        registry.close()
+
+
+def test_tensor_cache_reuses_memory_mapped_letterbox_tensor(tmp_path):
+    import numpy as np
+
+    from acen_api.services import TensorCache
+    from acen_api.services.model.postprocess import letterbox
+
+    image_path = tmp_path / "face.png"
+    Image.new("RGB", (48, 32), color=(200, 10, 10)).save(image_path)
+    cache = TensorCache(tmp_path / "tensors")
+
+    first, info = cache.prepare(image_path, 64)
+    second, cached_info = cache.prepare(image_path, 64)
+    expected, expected_info = letterbox(np.asarray(Image.open(image_path).convert("RGB")), 64)
+
+    assert isinstance(second, np.memmap)
+    assert np.array_equal(second, expected)
+    assert cached_info == info == expected_info
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    # 입력 크기가 다르면 별도 항목
+    other, _ = cache.prepare(image_path, 32)
+    assert other.shape == (3, 32, 32)
+    assert cache.stats()["misses"] == 2
+
+
+def test_onnx_detector_matches_ultralytics(tmp_path):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("ultralytics")
+    import os
+    from pathlib import Path
+
+    from acen_api.services import OnnxDetector
+
+    weights = Path(os.environ.get("ACEN_PARITY_WEIGHTS", "data/models/yolov11l.pt"))
+    if not weights.exists() or not weights.with_suffix(".onnx").exists():
+        pytest.skip("parity 비교용 .pt/.onnx 가중치가 없습니다 (scripts/export_onnx.py 참고)")
+
+    image_path = _prepare_image(tmp_path)
+    torch_model = UltralyticsDetector(ModelConfig(name="torch", weights_path=weights, device="cpu"))
+    onnx_model = OnnxDetector(ModelConfig(name="onnx", weights_path=weights))
+    torch_model.load()
+    onnx_model.load()
+
+    expected = sorted(torch_model.detect(image_path), key=lambda box: -box.score)
+    actual = sorted(onnx_model.detect(image_path), key=lambda box: -box.score)
+
+    assert len(actual) == len(expected)
+    for left, right in zip(expected, actual):
+        assert left.label == right.label
+        assert right.score == pytest.approx(left.score, abs=0.02)
+        assert [right.x, right.y, right.width, right.height] == pytest.approx(
+            [left.x, left.y, left.width, left.height], abs=2.0
+        )
+
+
+def test_int8_precision_selects_quantized_onnx_and_box_agreement(tmp_path):
+    from acen_api.services import OnnxDetector
+    from acen_api.services.model.postprocess import box_agreement
+
+    weights = tmp_path / "model.pt"
+    fp32 = OnnxDetector(ModelConfig(name="onnx", weights_path=weights))
+    int8 = OnnxDetector(ModelConfig(name="onnx", weights_path=weights, precision="int8"))
+
+    assert fp32.onnx_path == tmp_path / "model.onnx"
+    assert int8.onnx_path == tmp_path / "model.int8.onnx"
+    assert fp32.config.key() != int8.config.key()
+
+    reference = [
+        BoundingBox(x=10, y=10, width=10, height=10, score=0.9, label="acne"),
+        BoundingBox(x=50, y=50, width=10, height=10, score=0.8, label="acne"),
+    ]
+    candidate = [
+        BoundingBox(x=11, y=10, width=10, height=10, score=0.85, label="acne"),
+        BoundingBox(x=50, y=50, width=10, height=10, score=0.7, label="scar"),
+    ]
+    report = box_agreement(reference, candidate, iou_threshold=0.5)
+
+    assert report["matched"] == 1
+    assert report["recall"] == pytest.approx(0.5)
+    assert report["precision"] == pytest.approx(0.5)
+    assert report["mean_iou"] == pytest.approx(90 / 110)
+
+
+def test_rule_based_classifier_batch_matches_single_calls(tmp_path):
+    import numpy as np
+
+    jpeg = tmp_path / "large.jpg"
+    Image.new("RGB", (640, 480), color=(200, 180, 170)).save(jpeg, quality=95)
+    arrays = [np.full((8, 8, 3), value, dtype=np.uint8) for value in (20, 240)]
+    classifier = RuleBasedClassifier()
+    classifier.load()
+
+    batch = classifier.classify_batch([jpeg, *arrays], top_k=3)
+
+    assert [results[0].label for results in batch] == ["clear", "acne", "clear"]
+    assert batch == [classifier.classify(image, top_k=3) for image in [jpeg, *arrays]]
+    # Pillow 그레이스케일 평균과 같은 밝기
+    expected = (200 * 0.299 + 180 * 0.587 + 170 * 0.114) / 255
+    clear = next(item for item in batch[0] if item.label == "clear")
+    assert clear.score == pytest.approx(expected, abs=0.01)
+
+
+def test_app_import_does_not_load_heavy_ml_dependencies():
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    src_dir = Path(__file__).resolve().parents[1] / "src"
+    env = {**os.environ, "PYTHONPATH": str(src_dir)}
+    code = (
+        "import sys; import acen_api.main; "
+        "print(','.join(m for m in ('torch', 'ultralytics', 'onnxruntime') if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+
+    assert completed.stdout.strip() == ""
+
+
+def test_ultralytics_detector_passes_thresholds_and_parses_in_bulk(tmp_path):
+    import numpy as np
+
+    calls: dict = {}
+
+    class FakeBoxes:
+        xywh = np.array([[10.0, 20.0, 4.0, 6.0], [30.0, 40.0, 8.0, 2.0]], dtype=np.float32)
+        conf = np.array([0.9, 0.6], dtype=np.float32)
+        cls = np.array([1.0, 0.0], dtype=np.float32)
+
+        def __len__(self):
+            return len(self.xywh)
+
+        def __iter__(self):  # 박스별 순회를 쓰면 실패하도록
+            raise AssertionError("boxes should be converted in one step")
+
+    class FakeResult:
+        boxes = FakeBoxes()
+
+    class FakeYOLO:
+        def predict(self, source, **kwargs):
+            calls.update(kwargs)
+            return [FakeResult() for _ in source]
+
+    model = UltralyticsDetector(ModelConfig(name="ultra"))
+    model._model = FakeYOLO()
+    model._labels = ["acne", "scar"]
+    model._loaded = True
+
+    boxes = model.detect(_prepare_image(tmp_path), confidence=0.5, iou=0.3)
+
+    assert calls["conf"] == 0.5 and calls["iou"] == 0.3
+    assert [(box.label, box.x, box.score) for box in boxes] == [
+        ("scar", 10.0, pytest.approx(0.9)),
+        ("acne", 30.0, pytest.approx(0.6)),
+    ]
+    dummy = DummyDetector()
+    dummy.load()
+    assert dummy.detect(_prepare_image(tmp_path), confidence=0.9) == []
+
+
+def test_tile_grid_covers_image_within_tile_budget():
+    from acen_api.services.model.postprocess import tile_grid
+
+    tiles = tile_grid(1000, 600, 400, overlap=0.2, max_tiles=16)
+    assert len(tiles) == 6
+    assert {x0 for x0, _, _, _ in tiles} == {0, 300, 600}
+    assert max(x1 for _, _, x1, _ in tiles) == 1000 and max(y1 for _, _, _, y1 in tiles) == 600
+
+    assert len(tile_grid(4000, 3000, 640, overlap=0.2, max_tiles=12)) <= 12
+    assert tile_grid(320, 240, 640) == []
+
+
+def test_ultralytics_detector_tiled_mode_merges_overlapping_tiles():
+    import numpy as np
+
+    image = np.zeros((600, 1000, 3), dtype=np.uint8)
+    image[300:310, 500:510] = 255
+    calls: list[int] = []
+
+    class FakeBoxes:
+        def __init__(self, xywh):
+            self.xywh = np.array(xywh, dtype=np.float32).reshape(-1, 4)
+            self.conf = np.full(len(self.xywh), 0.8, dtype=np.float32)
+            self.cls = np.zeros(len(self.xywh), dtype=np.float32)
+
+        def __len__(self):
+            return len(self.xywh)
+
+    class FakeResult:
+        def __init__(self, source):
+            ys, xs = np.nonzero(source[..., 0])
+            xywh = [] if len(xs) == 0 else [[(xs.min() + xs.max() + 1) / 2, (ys.min() + ys.max() + 1) / 2, 10, 10]]
+            self.boxes = FakeBoxes(xywh)
+
+    class FakeYOLO:
+        def predict(self, source, **kwargs):
+            calls.append(len(source))
+            return [FakeResult(item) for item in source]
+
+    model = UltralyticsDetector(ModelConfig(name="ultra"), tile_size=400, tile_overlap=0.2, max_tiles=16)
+    model._model = FakeYOLO()
+    model._labels = ["acne"]
+    model._loaded = True
+
+    boxes = model.detect(image)
+
+    assert calls == [7]  # 전체 이미지 1 + 타일 6을 한 번의 배치로
+    assert len(boxes) == 1
+    assert (boxes[0].x, boxes[0].y) == pytest.approx((505.0, 305.0))
+
+
+def test_build_model_registry_enables_tiled_detection(tmp_path):
+    from acen_api.api.deps import build_model_registry
+    from acen_api.config import AppSettings
+
+    settings = AppSettings(
+        model_path=str(tmp_path / "missing.pt"), detect_tile_size=512, detect_tile_overlap=0.25, detect_max_tiles=9
+    )
+    registry = build_model_registry(settings)
+    try:
+        model = registry.get("detector")
+        detector = model.wrapped if isinstance(model, SynchronizedModel) else model
+        assert isinstance(detector, UltralyticsDetector)
+        assert (detector.tile_size, detector.tile_overlap, detector.max_tiles) == (512, 0.25, 9)
+        assert registry.config("detector").name == "ultralytics-detector-tiled-512-0.25-9"
+        assert model.detect(_prepare_image(tmp_path))
+    finally:
+        registry.close()
@@ -11,6 +11,7 @@ from acen_api.repositories import (
     CalendarRepository,
     DateRepository,
     FeedbackRepository,
+    ImageBlobRepository,
     ProductRepository,
     ScheduleRepository,
     SuggestRepository,
@@ -176,3 +177,63 @@ def test_feedback_and_suggest_repositories(db_session):
     suggestions = suggest_repo.list_for_feedback(feedback.id)
     assert len(suggestions) == 1
     assert suggestions[0].product_id == product.id
+
+
+def test_image_blob_reference_counting(db_session):
+    repo = ImageBlobRepository(db_session)
+    digest = "ab" * 32
+    repo.register(digest, relative_path=f"ab/ab/{digest}.jpg", content_type="image/jpeg", size_bytes=10)
+    # 같은 내용의 재업로드는 기존 항목을 그대로 사용
+    repo.register(digest, relative_path=f"ab/ab/{digest}.jpg", content_type="image/jpeg", size_bytes=10)
+
+    assert repo.add_ref(digest, repo.OWNER_DATE, 1)
+    assert not repo.add_ref(digest, repo.OWNER_DATE, 1)
+    assert repo.add_ref(digest, repo.OWNER_RESULTS["detection"], 1)
+    assert not repo.add_ref("cd" * 32, repo.OWNER_DATE, 1)
+    assert repo.get(digest).ref_count == 2
+    assert repo.unreferenced() == []
+
+    assert repo.remove_refs(repo.OWNER_DATE, 1) == 1
+    assert repo.remove_refs(repo.OWNER_RESULTS["detection"], 1) == 1
+    assert [blob.content_hash for blob in repo.unreferenced()] == [digest]
+
+    # 결과 교체 시 이전 이미지 참조는 빠지고 새 이미지만 참조한다.
+    other = "cd" * 32
+    repo.register(other, relative_path=f"cd/cd/{other}.jpg", content_type="image/jpeg", size_bytes=10)
+    repo.replace_ref(digest, repo.OWNER_RESULTS["classification"], 2)
+    repo.replace_ref(other, repo.OWNER_RESULTS["classification"], 2)
+    assert (repo.get(digest).ref_count, repo.get(other).ref_count) == (0, 1)
+    assert repo.delete_unreferenced(digest)
+    assert not repo.delete_unreferenced(other)
+
+
+def test_deleting_dates_calendars_and_users_releases_image_refs(db_session):
+    user = UserRepository(db_session).create(UserCreate(username="blob-owner"))
+    calendars = CalendarRepository(db_session)
+    dates = DateRepository(db_session)
+    first = calendars.create(user_id=user.id, name="첫째")
+    second = calendars.create(user_id=user.id, name="둘째")
+    entries = [
+        dates.create(DateCreate(calendar_id=calendar.id, scheduled_date=date(2024, 1, day)), user_id=user.id)
+        for day, calendar in ((1, first), (2, second), (3, second))
+    ]
+    repo = ImageBlobRepository(db_session)
+    digest = "ef" * 32
+    repo.register(digest, relative_path=f"ef/ef/{digest}.jpg", content_type="image/jpeg", size_bytes=10)
+    for entry in entries:
+        repo.add_ref(digest, repo.OWNER_DATE, entry.id)
+        repo.add_ref(digest, repo.OWNER_RESULTS["detection"], entry.id)
+    assert repo.get(digest).ref_count == 6
+
+    dates.delete(entries[0])
+    db_session.flush()
+    assert repo.get(digest).ref_count == 4
+    calendars.delete(second)
+    db_session.flush()
+    assert repo.get(digest).ref_count == 0
+
+    third = dates.create(DateCreate(calendar_id=first.id, scheduled_date=date(2024, 1, 4)), user_id=user.id)
+    repo.add_ref(digest, repo.OWNER_DATE, third.id)
+    UserRepository(db_session).delete(user)
+    db_session.flush()
+    assert repo.get(digest).ref_count == 0
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 from io import BytesIO
 
 import pytest
 from PIL import Image
 
-from acen_api.services import ImageStorageService, StorageError
+from acen_api.services import ImageStorageService, RenditionService, StorageError
 
 
 def _make_image_bytes(color: str = "red", fmt: str = "PNG") -> bytes:
@@ -51,3 +52,153 @@ def test_rejects_large_file(tmp_path):
 
     with pytest.raises(StorageError):
         service.save_bytes(data, filename="big.png")
+
+
+def test_save_bytes_returns_pixels_and_resolves_upload_id(tmp_path):
+    from acen_api.services import content_hash
+
+    service = ImageStorageService(tmp_path)
+
+    result = service.save_bytes(_make_image_bytes(color="blue"), filename="sample.png")
+
+    assert result.pixels.shape == (16, 16, 3)
+    assert result.pixels[0, 0].tolist() == [0, 0, 255]
+    assert result.content_hash == content_hash(result.path)
+    assert service.resolve(result.upload_id) == result.path
+    with pytest.raises(StorageError):
+        service.resolve("../../etc/passwd")
+    with pytest.raises(StorageError):
+        service.resolve("0" * 32)
+
+
+def test_upload_writer_streams_and_rejects_early(tmp_path):
+    service = ImageStorageService(tmp_path, max_file_size=64 * 1024)
+    data = _make_image_bytes(fmt="JPEG")
+
+    writer = service.open_upload(filename="face.jpg")
+    for start in range(0, len(data), 7):
+        writer.write(data[start : start + 7])
+    result = writer.finish()
+    assert result.relative_path.suffix == ".jpg"
+    assert result.pixels.shape == (16, 16, 3)
+
+    # 첫 청크의 시그니처로 형식 위반을 바로 거절
+    writer = service.open_upload(filename="evil.png")
+    with pytest.raises(StorageError):
+        writer.write(b"MZ" + b"\0" * 30)
+    writer.abort()
+
+    writer = service.open_upload(filename="fake.png")
+    with pytest.raises(StorageError):
+        writer.write(data)
+    writer.abort()
+
+    # 누적 크기가 제한을 넘는 순간 중단
+    writer = service.open_upload(filename="big.png")
+    writer.write(_make_image_bytes()[:16])
+    with pytest.raises(StorageError):
+        writer.write(b"0" * (64 * 1024))
+    writer.abort()
+
+    assert [path for path in tmp_path.rglob("*") if path.is_file()] == [result.path]
+
+
+def test_save_bytes_keeps_original_bytes_unless_orientation_changes(tmp_path):
+    service = ImageStorageService(tmp_path)
+    plain = _make_image_bytes(fmt="JPEG")
+
+    result = service.save_bytes(plain, filename="plain.jpg", decode=False)
+    assert result.path.read_bytes() == plain
+    assert result.pixels is None
+
+    image = Image.new("RGB", (20, 10), color="green")
+    exif = image.getexif()
+    exif[0x0112] = 6  # 시계 방향 90도 회전 필요
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", exif=exif)
+
+    rotated = service.save_bytes(buffer.getvalue(), filename="rotated.jpg")
+    assert rotated.path.read_bytes() != buffer.getvalue()
+    assert rotated.pixels.shape == (20, 10, 3)
+    with Image.open(rotated.path) as stored:
+        assert stored.size == (10, 20)
+
+    with pytest.raises(StorageError):
+        service.save_bytes(b"\x89PNG\r\n\x1a\n" + b"0" * 40, filename="broken.png")
+
+
+def test_save_bytes_deduplicates_by_content(tmp_path):
+    service = ImageStorageService(tmp_path)
+    data = _make_image_bytes(fmt="JPEG")
+
+    first = service.save_bytes(data, filename="a.jpeg", decode=False)
+    second = service.save_bytes(data, filename="b.jpg", decode=False)
+
+    assert first.upload_id == first.content_hash == hashlib.sha256(data).hexdigest()
+    assert first.relative_path.parts == (first.upload_id[:2], first.upload_id[2:4], f"{first.upload_id}.jpg")
+    assert not first.deduplicated and second.deduplicated
+    assert second.path == first.path
+    assert service.resolve(first.upload_id) == first.path
+    assert service.content_id(first.path) == first.upload_id
+    assert service.content_id(tmp_path / "other.jpg") is None
+
+
+def test_renditions_generated_in_background_and_best_match(tmp_path):
+    renditions = RenditionService(tmp_path / "renditions", {"thumb": 32, "preview": 128, "small": 64})
+    service = ImageStorageService(tmp_path / "uploads", renditions=renditions)
+    image = Image.new("RGB", (400, 200), color="blue")
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG")
+
+    stored = service.save_bytes(buffer.getvalue(), filename="wide.jpg", decode=False)
+    # 저장 시 예약된 작업이 진행 중이면 같은 작업이 반환되고, 모두 생성된 뒤에는 None
+    pending = renditions.schedule(stored.path, stored.upload_id)
+    if pending is not None:
+        pending.result(timeout=10)
+    assert renditions.schedule(stored.path, stored.upload_id) is None
+
+    for name, edge in renditions.sizes.items():
+        with Image.open(renditions.path(name, stored.upload_id)) as rendition:
+            assert rendition.size == (edge, edge // 2)
+
+    assert renditions.best(stored.upload_id, 20)[0] == "thumb"
+    assert renditions.best(stored.upload_id, 100)[0] == "preview"
+    assert renditions.best(stored.upload_id, 500) is None
+    assert renditions.stats()["failed"] == 0
+    renditions.close()
+
+
+def test_truncated_jpeg_is_rejected_before_it_is_stored(tmp_path):
+    service = ImageStorageService(tmp_path)
+    image = Image.effect_noise((64, 64), 64).convert("RGB")
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG")
+    truncated = buffer.getvalue()[: len(buffer.getvalue()) // 2]
+
+    with pytest.raises(StorageError):
+        service.save_bytes(truncated, filename="cut.jpg")
+    writer = service.open_upload(filename="cut.jpg")
+    writer.write(truncated)
+    with pytest.raises(StorageError):
+        writer.finish()
+
+    # 픽셀이 필요 없는 업로드(decode=False)도 잘린 JPEG을 저장하지 않는다.
+    with pytest.raises(StorageError):
+        service.save_bytes(truncated, filename="cut.jpg", decode=False)
+    writer = service.open_upload(filename="cut.jpg", decode=False)
+    writer.write(truncated)
+    with pytest.raises(StorageError):
+        writer.finish()
+
+    assert [path for path in tmp_path.rglob("*") if path.is_file()] == []
+
+
+def test_truncated_png_is_rejected_without_decoding(tmp_path):
+    service = ImageStorageService(tmp_path)
+    buffer = BytesIO()
+    Image.effect_noise((64, 64), 64).convert("RGB").save(buffer, format="PNG")
+    truncated = buffer.getvalue()[: len(buffer.getvalue()) // 2]
+
+    with pytest.raises(StorageError):
+        service.save_bytes(truncated, filename="cut.png", decode=False)
+    assert [path for path in tmp_path.rglob("*") if path.is_file()] == []
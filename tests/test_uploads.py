@@ -10,6 +10,8 @@ from fastapi.testclient import TestClient
 
 from acen_api.api import deps
 from acen_api.main import app
+from acen_api.repositories import ImageBlobRepository
+from acen_api.services import ImageStorageService, RenditionService
 
 
 def _image_bytes(fmt: str = "PNG") -> bytes:
@@ -31,6 +33,14 @@ def test_upload_image_requires_key(db_session):
         r = client.post("/uploads", files=files, headers={"X-API-Key": key})
         assert r.status_code == 200
         assert r.json()["relative_path"].endswith(".png")
+
+        # 같은 내용은 한 파일로 저장되고 blob 테이블에 한 번만 등록된다.
+        again = client.post("/uploads", files=files, headers={"X-API-Key": key}).json()
+        assert again["deduplicated"] is True
+        assert again["upload_id"] == r.json()["upload_id"]
+        blob = ImageBlobRepository(db_session).get(again["upload_id"])
+        assert blob.relative_path == again["relative_path"]
+        assert blob.ref_count == 0
     app.dependency_overrides.clear()
 
 
@@ -47,3 +57,127 @@ def test_upload_image_size_limit(db_session, monkeypatch):
         r = client.post("/uploads", files=files, headers={"X-API-Key": key})
         assert r.status_code == 400
     app.dependency_overrides.clear()
+
+
+def test_upload_stream_accepts_raw_body_and_rejects_bad_format(db_session, monkeypatch):
+    monkeypatch.setenv("UPLOAD_MAX_BYTES", "4096")
+
+    def override_session():
+        return db_session
+
+    app.dependency_overrides[deps.get_session] = override_session
+    with TestClient(app) as client:
+        key = client.post("/api-keys", json={"description": "upload"}).json()["key"]
+        headers = {"X-API-Key": key, "Content-Type": "image/jpeg"}
+        params = {"filename": "a.jpg"}
+        r = client.post("/uploads/stream", params=params, content=_image_bytes("JPEG"), headers=headers)
+        assert r.status_code == 200
+        assert r.json()["relative_path"].endswith(".jpg")
+
+        r = client.post("/uploads/stream", content=b"not an image at all", headers=headers)
+        assert r.status_code == 400
+        r = client.post("/uploads/stream", content=b"0" * 5000, headers=headers)
+        assert r.status_code == 400
+    app.dependency_overrides.clear()
+
+
+def test_rendition_endpoint_serves_best_size(db_session, tmp_path):
+    renditions = RenditionService(tmp_path / "renditions", {"thumb": 16, "preview": 64})
+    storage = ImageStorageService(tmp_path / "uploads")
+    bio = io.BytesIO()
+    Image.new("RGB", (128, 96), color="green").save(bio, format="JPEG")
+    stored = storage.save_bytes(bio.getvalue(), filename="face.jpg", decode=False)
+
+    app.dependency_overrides[deps.get_session] = lambda: db_session
+    app.dependency_overrides[deps.get_storage] = lambda: storage
+    app.dependency_overrides[deps.get_rendition_service] = lambda: renditions
+    with TestClient(app) as client:
+        key = client.post("/api-keys", json={"description": "rendition"}).json()["key"]
+        r = client.get(f"/uploads/{stored.upload_id}/rendition", params={"size": 16})
+        assert r.status_code == 401
+        client.headers["X-API-Key"] = key
+
+        # 파생본 생성 전에는 원본으로 응답하고 생성을 예약
+        r = client.get(f"/uploads/{stored.upload_id}/rendition", params={"size": 16})
+        assert r.status_code == 200
+        assert r.headers["x-rendition"] == "original"
+        assert r.content == stored.path.read_bytes()
+
+        renditions.generate(stored.path, stored.upload_id)
+        r = client.get(f"/uploads/{stored.upload_id}/rendition", params={"size": 16})
+        assert r.headers["x-rendition"] == "thumb"
+        assert "immutable" in r.headers["cache-control"]
+        assert Image.open(io.BytesIO(r.content)).size == (16, 12)
+
+        r = client.get(f"/uploads/{'0' * 64}/rendition")
+        assert r.status_code == 404
+    app.dependency_overrides.clear()
+    renditions.close()
+
+
+def test_collect_unreferenced_blobs_removes_files_and_renditions(db_session, tmp_path):
+    from acen_api.api.routers.uploads import register_blob
+    from acen_api.services import collect_unreferenced_blobs
+
+    renditions = RenditionService(tmp_path / "renditions", {"thumb": 4})
+    storage = ImageStorageService(tmp_path / "uploads")
+    orphan = storage.save_bytes(_image_bytes(), filename="a.png")
+    kept = storage.save_bytes(_image_bytes("JPEG"), filename="b.jpg")
+    for stored in (orphan, kept):
+        register_blob(db_session, stored)
+        renditions.generate(stored.path, stored.upload_id)
+    repo = ImageBlobRepository(db_session)
+    repo.add_ref(kept.upload_id, repo.OWNER_DATE, 1)
+    db_session.commit()
+
+    # 막 업로드된 파일은 유예 시간 동안 남겨 둔다.
+    assert collect_unreferenced_blobs(db_session, storage, renditions=renditions) == 0
+    assert collect_unreferenced_blobs(db_session, storage, renditions=renditions, grace_seconds=0) == 1
+
+    assert not orphan.path.exists() and not renditions.path("thumb", orphan.upload_id).exists()
+    assert repo.get(orphan.upload_id) is None
+    assert kept.path.exists() and renditions.path("thumb", kept.upload_id).exists()
+    renditions.close()
+
+
+def test_detect_reads_model_rendition_and_returns_original_coordinates(db_session, tmp_path):
+    from acen_api.schemas import BoundingBox
+
+    class RecordingDetector:
+        def __init__(self):
+            self.inputs = []
+
+        def detect(self, image, **thresholds):
+            self.inputs.append(image)
+            with Image.open(image) as img:
+                width, height = img.size
+            return [BoundingBox(x=0, y=0, width=width, height=height, score=0.9, label="acne")]
+
+    renditions = RenditionService(tmp_path / "renditions", {"thumb": 16, "model": 64})
+    storage = ImageStorageService(tmp_path / "uploads")
+    bio = io.BytesIO()
+    Image.new("RGB", (256, 128), color="green").save(bio, format="JPEG")
+    stored = storage.save_bytes(bio.getvalue(), filename="face.jpg", decode=False)
+    detector = RecordingDetector()
+
+    app.dependency_overrides[deps.get_session] = lambda: db_session
+    app.dependency_overrides[deps.get_storage] = lambda: storage
+    app.dependency_overrides[deps.get_rendition_service] = lambda: renditions
+    app.dependency_overrides[deps.get_detector] = lambda: detector
+    app.dependency_overrides[deps.get_batchers] = lambda: {}
+    app.dependency_overrides[deps.get_inference_cache] = lambda: None
+    try:
+        with TestClient(app) as client:
+            # 파생본이 없으면 원본으로 추론하고 생성을 예약한다.
+            first = client.post("/model/detect", json={"upload_id": stored.upload_id}).json()
+            assert detector.inputs[-1] == stored.path
+            renditions.generate(stored.path, stored.upload_id)
+
+            second = client.post("/model/detect", json={"upload_id": stored.upload_id}).json()
+            assert detector.inputs[-1] == renditions.path("model", stored.upload_id)
+            box = second["boxes"][0]
+            assert (box["width"], box["height"]) == (256, 128)
+            assert first["boxes"] == second["boxes"]
+    finally:
+        app.dependency_overrides.clear()
+        renditions.close()